@@ -0,0 +1,25 @@
+"""Gunicorn config for running KaziAI with multiple Uvicorn worker processes.
+
+Usage: gunicorn -c gunicorn.conf.py src.server:app
+"""
+
+import multiprocessing
+import os
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8030')}"
+
+_concurrency = os.getenv("WEB_CONCURRENCY", "auto")
+workers = (
+    multiprocessing.cpu_count() * 2 + 1
+    if _concurrency == "auto"
+    else int(_concurrency)
+)
+worker_class = "uvicorn.workers.UvicornWorker"
+worker_connections = 1000
+
+# Import the app once in the master so workers share its pages after fork.
+preload_app = True
+
+# SSE chat streams and agent dispatches can run for minutes.
+timeout = 300
+keepalive = 300
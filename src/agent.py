@@ -64,6 +64,8 @@ class Agent:
         self.model = model or provider_config["default_model"]
         self._client = None
         self._provider_config = provider_config
+        # System prompt and the registry spec list it was built from
+        self._system_prompt: tuple[list[dict], str] | None = None
 
     @property
     def client(self):
@@ -80,12 +82,22 @@ class Agent:
         self._client = value
 
     def _build_system_prompt(self) -> str:
-        """Construct the system prompt with available tool descriptions."""
-        tool_lines = []
-        for tool in self.registry.list_tools():
-            tool_lines.append(f"- **{tool.name}**: {tool.description}")
-        tool_descriptions = "\n".join(tool_lines)
-        return SYSTEM_PROMPT.format(tool_descriptions=tool_descriptions)
+        """Construct the system prompt with available tool descriptions.
+
+        Built from the registry's cached tool specs and reused until that
+        list changes (register() replaces it), so every loop step doesn't
+        reformat the same prompt.
+        """
+        specs = self.registry.to_openai_specs()
+        if self._system_prompt is not None and self._system_prompt[0] is specs:
+            return self._system_prompt[1]
+        tool_descriptions = "\n".join(
+            f"- **{spec['function']['name']}**: {spec['function']['description']}"
+            for spec in specs
+        )
+        prompt = SYSTEM_PROMPT.format(tool_descriptions=tool_descriptions)
+        self._system_prompt = (specs, prompt)
+        return prompt
 
     def _build_messages(self, task: str) -> list[dict]:
         """Build the full message history for the LLM call.
@@ -1,2 +1,19 @@
+from importlib import import_module
+
 from .router import AgentRouter, RoutingDecision
-from .orchestrator import Orchestrator, AgentResult
+
+# The orchestrator pulls in every agent and its tools; resolve it lazily so
+# importing the router stays cheap.
+_LAZY_EXPORTS = {
+    "Orchestrator": ".orchestrator",
+    "AgentResult": ".orchestrator",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
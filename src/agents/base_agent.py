@@ -1,18 +1,21 @@
 import json
 import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
 
-from openai import OpenAI
 from dotenv import load_dotenv
 
 from ..memory import AgentMemory, AgentStep, ToolResult
 from ..tools.base import ToolRegistry
+from ..tools.delegate_tool import DelegateToAgentTool
 from .. import database as db
+from ..utils.llm_client import get_openai_client
 
 load_dotenv()
 
 MAX_STEPS = int(os.getenv("AGENT_MAX_STEPS", "15"))
+MAX_CONCURRENT_DELEGATIONS = 3  # sub-agents run at once when one turn delegates several tasks
 
 # Provider configurations
 DEFAULT_PROVIDER = os.getenv("LLM_PROVIDER", "groq")
@@ -70,7 +73,7 @@ class BaseAgent(ABC):
         if self._client is None:
             api_key = os.getenv(self._provider_config["env_key"]) or "ollama"
             base_url = self._provider_config["base_url"]
-            self._client = OpenAI(api_key=api_key, base_url=base_url) if base_url else OpenAI(api_key=api_key)
+            self._client = get_openai_client(api_key, base_url)
         return self._client
 
     @client.setter
@@ -145,7 +148,7 @@ SELF-CORRECTION RULES:
             {"role": "user", "content": user_content},
         ]
 
-        for step in self.memory.steps:
+        for index, step in enumerate(self.memory.steps):
             messages.append({
                 "role": "assistant",
                 "content": f"Thought: {step.thought}",
@@ -155,7 +158,7 @@ SELF-CORRECTION RULES:
                     "role": "assistant",
                     "content": None,
                     "tool_calls": [{
-                        "id": f"call_{step.step_number}",
+                        "id": f"call_{index}",
                         "type": "function",
                         "function": {
                             "name": step.tool_call.tool_name,
@@ -165,7 +168,7 @@ SELF-CORRECTION RULES:
                 })
                 messages.append({
                     "role": "tool",
-                    "tool_call_id": f"call_{step.step_number}",
+                    "tool_call_id": f"call_{index}",
                     "content": json.dumps(step.tool_call.result),
                 })
 
@@ -180,6 +183,21 @@ SELF-CORRECTION RULES:
         except Exception as e:
             return {"success": False, "error": f"Tool failed: {str(e)}"}
 
+    def _select_tool_calls(self, tool_calls) -> list[tuple[str, dict]]:
+        """Pick the (name, arguments) calls to run this step.
+
+        The loop runs one tool call per step, except that several
+        delegate_to_agent calls in one turn are all kept so they can run
+        concurrently.
+        """
+        if len(tool_calls) > 1 and all(
+            tc.function.name == DelegateToAgentTool.name for tc in tool_calls
+        ):
+            selected = tool_calls
+        else:
+            selected = tool_calls[:1]
+        return [(tc.function.name, json.loads(tc.function.arguments)) for tc in selected]
+
     def run(
         self,
         task: str,
@@ -233,51 +251,58 @@ SELF-CORRECTION RULES:
             message = response.choices[0].message
 
             if message.tool_calls:
-                tool_call = message.tool_calls[0]
-                func_name = tool_call.function.name
-                func_args = json.loads(tool_call.function.arguments)
-                thought = message.content or f"Using {func_name}"
+                calls = self._select_tool_calls(message.tool_calls)
+                thought = message.content or f"Using {calls[0][0]}"
 
                 print(f"    Thought: {thought[:100]}")
-                print(f"    Action: {func_name}")
-
-                result = self._execute_tool_with_retry(func_name, func_args)
-                observation = json.dumps(result, indent=2)
-                success = result.get("success", True)
-                total_tool_calls += 1
-
-                print(f"    Result: {'OK' if success else 'FAILED'}")
-
-                # Stream reasoning to caller
-                if on_thought:
-                    on_thought(thought, func_name)
-
-                self.memory.add_step(AgentStep(
-                    step_number=step_num,
-                    thought=thought,
-                    tool_call=ToolResult(
-                        tool_name=func_name,
-                        arguments=func_args,
-                        result=result,
-                    ),
-                    observation=observation,
-                ))
-
-                # Persist step to database if tracing
-                if trace_id:
-                    try:
-                        db.add_trace_step(
-                            trace_id=trace_id,
-                            step_number=step_num,
-                            thought=thought,
+                for func_name, _ in calls:
+                    print(f"    Action: {func_name}")
+
+                if len(calls) > 1:
+                    # Delegations are I/O-bound sub-agent runs; run them side by side
+                    workers = min(len(calls), MAX_CONCURRENT_DELEGATIONS)
+                    with ThreadPoolExecutor(max_workers=workers) as pool:
+                        results = list(pool.map(lambda call: self._execute_tool_with_retry(*call), calls))
+                else:
+                    results = [self._execute_tool_with_retry(*calls[0])]
+
+                for (func_name, func_args), result in zip(calls, results):
+                    observation = json.dumps(result, indent=2)
+                    success = result.get("success", True)
+                    total_tool_calls += 1
+
+                    print(f"    Result: {'OK' if success else 'FAILED'}")
+
+                    # Stream reasoning to caller
+                    if on_thought:
+                        on_thought(thought, func_name)
+
+                    self.memory.add_step(AgentStep(
+                        step_number=step_num,
+                        thought=thought,
+                        tool_call=ToolResult(
                             tool_name=func_name,
-                            tool_args=json.dumps(func_args),
-                            tool_result=observation[:4000],
-                            observation=observation[:2000],
-                            success=success,
-                        )
-                    except Exception:
-                        pass  # Don't let trace persistence break the agent
+                            arguments=func_args,
+                            result=result,
+                        ),
+                        observation=observation,
+                    ))
+
+                    # Persist step to database if tracing
+                    if trace_id:
+                        try:
+                            db.add_trace_step(
+                                trace_id=trace_id,
+                                step_number=step_num,
+                                thought=thought,
+                                tool_name=func_name,
+                                tool_args=json.dumps(func_args),
+                                tool_result=observation[:4000],
+                                observation=observation[:2000],
+                                success=success,
+                            )
+                        except Exception:
+                            pass  # Don't let trace persistence break the agent
             else:
                 content = message.content or ""
                 if "FINAL_ANSWER" in content:
@@ -8,9 +8,10 @@ import json
 import os
 from dataclasses import dataclass
 
-from openai import OpenAI
 from dotenv import load_dotenv
 
+from ..utils.llm_client import get_openai_client
+
 load_dotenv()
 
 EVAL_PROMPT = """You are a pipeline evaluator for a career AI system. After an agent produces output, decide what should happen next.
@@ -58,17 +59,13 @@ class PipelineEvaluator:
         if self._client is None:
             provider = os.getenv("LLM_PROVIDER", "groq")
             if provider == "ollama":
-                self._client = OpenAI(
-                    api_key="ollama",
-                    base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434/v1"),
+                self._client = get_openai_client(
+                    "ollama", os.getenv("OLLAMA_BASE_URL", "http://localhost:11434/v1"),
                 )
             else:
                 api_key = os.getenv("GROQ_API_KEY")
                 if api_key:
-                    self._client = OpenAI(
-                        api_key=api_key,
-                        base_url="https://api.groq.com/openai/v1",
-                    )
+                    self._client = get_openai_client(api_key, "https://api.groq.com/openai/v1")
         return self._client
 
     def evaluate(self, agent_result, message_bus, remaining_agents, routing) -> EvalDecision:
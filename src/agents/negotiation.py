@@ -16,11 +16,11 @@ import os
 import re
 from dataclasses import dataclass, field
 
-from openai import OpenAI
 from dotenv import load_dotenv
 
 from .protocol import AgentMessage, MessageBus
 from .. import database as db
+from ..utils.llm_client import get_openai_client
 
 load_dotenv()
 
@@ -137,17 +137,13 @@ class NegotiationSession:
         if self._client is None:
             provider = os.getenv("LLM_PROVIDER", "groq")
             if provider == "ollama":
-                self._client = OpenAI(
-                    api_key="ollama",
-                    base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434/v1"),
+                self._client = get_openai_client(
+                    "ollama", os.getenv("OLLAMA_BASE_URL", "http://localhost:11434/v1"),
                 )
             else:
                 api_key = os.getenv("GROQ_API_KEY")
                 if api_key:
-                    self._client = OpenAI(
-                        api_key=api_key,
-                        base_url="https://api.groq.com/openai/v1",
-                    )
+                    self._client = get_openai_client(api_key, "https://api.groq.com/openai/v1")
         return self._client
 
     def run(self) -> ConsensusResult:
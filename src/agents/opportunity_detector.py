@@ -37,12 +37,21 @@ class OpportunityDetector:
 
         Anti-spam controls are applied before returning.
         """
+        return self.detect_many([user_id])[user_id]
+
+    def detect_many(self, user_ids: list[int]) -> dict[int, list[Suggestion]]:
+        """Run detect() for several users off one bulk read of their data."""
+        data = db.get_opportunity_data_many(user_ids)
+        return {user_id: self._detect_for(user_id, data[user_id]) for user_id in user_ids}
+
+    def _detect_for(self, user_id: int, data: dict) -> list[Suggestion]:
+        """Apply anti-spam controls and trigger checks to one user's data."""
         # Check if user has auto_suggestions enabled
-        if not db.get_auto_suggestions_enabled(user_id):
+        if not data["auto_suggestions"]:
             return []
 
         # Check daily limit
-        recent = db.get_recent_suggestions(user_id, hours=24)
+        recent = data["recent_suggestions"]
         if len(recent) >= self.MAX_SUGGESTIONS_PER_DAY:
             return []
 
@@ -69,11 +78,10 @@ class OpportunityDetector:
             self._check_learning_opportunity,
         ]:
             try:
-                result = check(user_id)
+                result = check(user_id, data)
                 if result and result.confidence >= self.MIN_CONFIDENCE:
                     # 7-day dedup check
-                    existing = db.get_suggestion_by_cooldown_key(user_id, result.cooldown_key, days=7)
-                    if not existing:
+                    if result.cooldown_key not in data["recent_cooldown_keys"]:
                         suggestions.append(result)
             except Exception:
                 continue
@@ -84,13 +92,13 @@ class OpportunityDetector:
 
         return suggestions
 
-    def _check_stale_saved_jobs(self, user_id: int) -> Suggestion | None:
+    def _check_stale_saved_jobs(self, user_id: int, data: dict) -> Suggestion | None:
         """5+ saved jobs, 0 applications in 5 days."""
-        jobs = db.get_jobs(user_id=user_id, limit=50)
+        jobs = data["jobs"][:50]
         if len(jobs) < 5:
             return None
 
-        apps = db.get_applications(user_id=user_id)
+        apps = data["applications"]
         recent_apps = [
             a for a in apps
             if a.get("updated_at", "") > (datetime.now() - timedelta(days=5)).isoformat()
@@ -110,9 +118,9 @@ class OpportunityDetector:
             )
         return None
 
-    def _check_skill_gap(self, user_id: int) -> Suggestion | None:
+    def _check_skill_gap(self, user_id: int, data: dict) -> Suggestion | None:
         """Match agent flagged missing skills 3+ times."""
-        traces = db.get_traces(user_id, limit=30)
+        traces = data["traces"][:30]
         match_traces = [t for t in traces if t.get("agent_name") == "match" and t.get("status") == "completed"]
 
         # Look for "missing" or "gap" in outputs
@@ -141,14 +149,14 @@ class OpportunityDetector:
             )
         return None
 
-    def _check_market_shift(self, user_id: int) -> Suggestion | None:
+    def _check_market_shift(self, user_id: int, data: dict) -> Suggestion | None:
         """Scout found 10+ new jobs in user's field."""
-        profile = db.get_profile(user_id)
+        profile = data["profile"]
         if not profile or not profile.get("target_role"):
             return None
 
         # Check if there are many saved jobs recently
-        jobs = db.get_jobs(user_id=user_id, limit=20)
+        jobs = data["jobs"][:20]
         recent_jobs = [
             j for j in jobs
             if j.get("saved_at", "") > (datetime.now() - timedelta(days=7)).isoformat()
@@ -169,9 +177,9 @@ class OpportunityDetector:
             )
         return None
 
-    def _check_profile_incomplete(self, user_id: int) -> Suggestion | None:
+    def _check_profile_incomplete(self, user_id: int, data: dict) -> Suggestion | None:
         """Profile missing key sections."""
-        profile = db.get_profile(user_id)
+        profile = data["profile"]
         if not profile:
             return Suggestion(
                 title="Complete your profile",
@@ -190,8 +198,7 @@ class OpportunityDetector:
         if not profile.get("skills"):
             missing.append("skills")
 
-        resumes = db.get_resumes(user_id)
-        if not resumes:
+        if not data["has_resume"]:
             missing.append("resume")
 
         if len(missing) >= 2:
@@ -205,9 +212,9 @@ class OpportunityDetector:
             )
         return None
 
-    def _check_application_followup(self, user_id: int) -> Suggestion | None:
+    def _check_application_followup(self, user_id: int, data: dict) -> Suggestion | None:
         """Applied 7+ days ago, no status change."""
-        apps = db.get_applications(user_id=user_id, status="applied")
+        apps = [a for a in data["applications"] if a.get("status") == "applied"]
         stale_apps = [
             a for a in apps
             if a.get("updated_at", "") < (datetime.now() - timedelta(days=7)).isoformat()
@@ -228,10 +235,10 @@ class OpportunityDetector:
             )
         return None
 
-    def _check_learning_opportunity(self, user_id: int) -> Suggestion | None:
+    def _check_learning_opportunity(self, user_id: int, data: dict) -> Suggestion | None:
         """Recurring skill gap + available resources."""
         # Simplified: check if user has been searching but not using learning tools
-        traces = db.get_traces(user_id, limit=30)
+        traces = data["traces"][:30]
         search_count = sum(1 for t in traces if t.get("agent_name") == "scout")
         learn_count = sum(1 for t in traces if "learn" in (t.get("task") or "").lower())
 
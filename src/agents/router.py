@@ -6,7 +6,10 @@ to the right agent(s) — Scout, Match, Forge, Coach, or combinations.
 
 import json
 import os
-from dataclasses import dataclass, field
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 
 from openai import OpenAI
 from dotenv import load_dotenv
@@ -69,6 +72,15 @@ class RoutingDecision:
     needs_profile: bool = False
 
 
+def _copy_decision(decision: RoutingDecision) -> RoutingDecision:
+    """Copy a cached decision so callers can't mutate the cached lists/dicts."""
+    return replace(
+        decision,
+        agents=list(decision.agents),
+        extracted_context=dict(decision.extracted_context),
+    )
+
+
 class AgentRouter:
     """Classifies user intent and determines which agents to dispatch."""
 
@@ -78,8 +90,13 @@ class AgentRouter:
     }
     VALID_AGENTS = {"scout", "match", "forge", "coach"}
 
+    # Max LLM classifications remembered, keyed on the normalized message
+    DECISION_CACHE_SIZE = 2048
+
     def __init__(self):
         self._client = None
+        self._decision_cache: OrderedDict[tuple, RoutingDecision] = OrderedDict()
+        self._cache_lock = threading.Lock()  # route() runs in worker threads
 
     @property
     def client(self):
@@ -98,6 +115,12 @@ class AgentRouter:
                 )
         return self._client
 
+    # Greetings and small talk that never need an agent
+    _GREETING_RE = re.compile(
+        r"^(hello|hi|hey|thanks|thank you|good morning|good evening"
+        r"|how are you|what can you do|help)\b"
+    )
+
     # Keyword patterns for fast routing (no LLM call needed)
     _FAST_PATTERNS = {
         "job_search": [
@@ -127,9 +150,7 @@ class AgentRouter:
         msg_lower = message.lower()
 
         # General chat shortcuts (greetings, thanks, etc.)
-        greetings = ["hello", "hi ", "hey", "thanks", "thank you", "good morning",
-                      "good evening", "how are you", "what can you do", "help"]
-        if any(msg_lower.strip().startswith(g) for g in greetings):
+        if self._GREETING_RE.match(msg_lower.strip()):
             return RoutingDecision(
                 intent="general_chat", agents=[], extracted_context={},
                 reasoning="Fast-routed: greeting or general query",
@@ -158,6 +179,15 @@ class AgentRouter:
         if fast is not None:
             return fast
 
+        # Repeated prompts ("help me with my resume") skip the LLM round-trip
+        cache_key = (" ".join(message.lower().split())[:256], has_resume, has_profile)
+        with self._cache_lock:
+            cached = self._decision_cache.get(cache_key)
+            if cached is not None:
+                self._decision_cache.move_to_end(cache_key)
+        if cached is not None:
+            return _copy_decision(cached)
+
         context_hint = ""
         if has_resume:
             context_hint += " The user has a resume on file."
@@ -185,8 +215,7 @@ class AgentRouter:
                 raw = raw.strip()
 
             data = json.loads(raw)
-            return self._parse_response(data)
-
+            decision = self._parse_response(data)
         except Exception:
             # On any failure, fall back to general chat
             return RoutingDecision(
@@ -196,6 +225,12 @@ class AgentRouter:
                 reasoning="Router fallback due to classification error",
             )
 
+        with self._cache_lock:
+            self._decision_cache[cache_key] = decision
+            if len(self._decision_cache) > self.DECISION_CACHE_SIZE:
+                self._decision_cache.popitem(last=False)
+        return _copy_decision(decision)
+
     def _parse_response(self, data: dict) -> RoutingDecision:
         """Validate and normalize the LLM's routing response."""
         intent = data.get("intent", "general_chat")
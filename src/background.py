@@ -8,12 +8,20 @@ Creates notifications so the system acts without user input.
 """
 
 import os
-import asyncio
+import tempfile
 from datetime import datetime, timedelta
 
 from . import database as db
 
 _scheduler = None
+_scheduler_lock_file = None
+
+# With several server workers (gunicorn), only the one holding this lock runs
+# the scheduler so checks don't fire once per worker.
+SCHEDULER_LOCK_PATH = os.getenv(
+    "SCHEDULER_LOCK_PATH",
+    os.path.join(tempfile.gettempdir(), "kaziai-scheduler.lock"),
+)
 
 
 def check_stalled_goals() -> None:
@@ -50,8 +58,8 @@ def check_stalled_goals() -> None:
 
         # Deduplicate: don't create if we already have an unread notification for this goal
         existing = conn.execute(
-            "SELECT id FROM notifications WHERE user_id = ? AND type = 'goal_stalled' AND data LIKE ? AND read = 0",
-            (user_id, f'%"goal_id": {goal_id}%'),
+            "SELECT id FROM notifications WHERE user_id = ? AND type = 'goal_stalled' AND read = 0 AND goal_id_ref = ?",
+            (user_id, goal_id),
         ).fetchone()
 
         if existing:
@@ -98,8 +106,8 @@ def check_stale_applications() -> None:
 
         # Deduplicate
         existing = conn.execute(
-            "SELECT id FROM notifications WHERE user_id = ? AND type = 'application_reminder' AND data LIKE ? AND read = 0",
-            (user_id, f'%"application_id": {app_id}%'),
+            "SELECT id FROM notifications WHERE user_id = ? AND type = 'application_reminder' AND read = 0 AND application_id_ref = ?",
+            (user_id, app_id),
         ).fetchone()
 
         if existing:
@@ -129,15 +137,36 @@ def _ws_notify(user_id: int, data: dict) -> None:
     """Push a WebSocket notification to a user (fire-and-forget)."""
     try:
         from .websocket_manager import ws_manager
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            asyncio.ensure_future(ws_manager.send_to_user(user_id, data))
-        else:
-            loop.run_until_complete(ws_manager.send_to_user(user_id, data))
+        ws_manager.notify(user_id, data)
     except Exception:
         pass  # WebSocket push is best-effort
 
 
+def _acquire_scheduler_lock() -> bool:
+    """Take the cross-process scheduler lock. Returns False if another worker holds it."""
+    global _scheduler_lock_file
+    try:
+        import fcntl
+    except ImportError:
+        return True  # No flock (Windows) — single-process deployments only
+
+    lock_file = open(SCHEDULER_LOCK_PATH, "w")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+    _scheduler_lock_file = lock_file
+    return True
+
+
+def _release_scheduler_lock() -> None:
+    global _scheduler_lock_file
+    if _scheduler_lock_file is not None:
+        _scheduler_lock_file.close()
+        _scheduler_lock_file = None
+
+
 def start_scheduler() -> None:
     """Start the background scheduler for periodic checks."""
     global _scheduler
@@ -155,6 +184,9 @@ def start_scheduler() -> None:
     if _scheduler is not None:
         return  # already running
 
+    if not _acquire_scheduler_lock():
+        return  # another worker process owns the scheduler
+
     _scheduler = AsyncIOScheduler()
     _scheduler.add_job(check_stalled_goals, "interval", hours=4, id="check_stalled_goals")
     _scheduler.add_job(check_stale_applications, "interval", hours=12, id="check_stale_applications")
@@ -168,4 +200,5 @@ def stop_scheduler() -> None:
     if _scheduler is not None:
         _scheduler.shutdown(wait=False)
         _scheduler = None
+        _release_scheduler_lock()
         print("[background] Scheduler stopped")
@@ -0,0 +1,119 @@
+"""Cancellation flags for in-flight chat dispatches and goal auto-executions.
+
+With several server workers, the cancel request can land on a different
+process than the one streaming the response, so flags live in Redis (already
+required for Celery). When Redis is unreachable the flags fall back to a
+per-process dict, which is only correct for single-worker deployments. The
+same dict covers Redis errors after startup (a broker restart or blip), so a
+flag operation never fails the run it belongs to.
+"""
+
+import os
+import time
+
+try:
+    from redis.exceptions import RedisError
+except ImportError:
+    RedisError = ()  # redis not installed: _get_redis() never returns a client
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+_redis_client = None
+_redis_checked = False
+
+
+def _get_redis():
+    """Return a connected Redis client, or None if Redis is unavailable."""
+    global _redis_client, _redis_checked
+    if _redis_checked:
+        return _redis_client
+    _redis_checked = True
+    try:
+        import redis
+        client = redis.Redis.from_url(REDIS_URL, socket_timeout=0.5, socket_connect_timeout=0.5)
+        client.ping()
+        _redis_client = client
+    except Exception:
+        print("[cancellation] Redis unavailable, using in-process cancel flags")
+        _redis_client = None
+    return _redis_client
+
+
+class CancelFlags:
+    """Shared cancel flags keyed by an integer ID (conversation or goal)."""
+
+    # How long a streaming worker trusts its last read of a flag before
+    # asking Redis again — cancel_check is polled between agent steps.
+    LOCAL_TTL = 1.0
+
+    def __init__(self, namespace: str, ttl: int = 600):
+        self.namespace = namespace
+        self.ttl = ttl
+        self._local: dict[int, bool] = {}  # fallback store when Redis is down
+        self._last_read: dict[int, tuple[float, bool]] = {}
+
+    def _key(self, item_id: int) -> str:
+        return f"cancel:{self.namespace}:{item_id}"
+
+    def start(self, item_id: int) -> None:
+        """Register an active run that can be cancelled."""
+        self._last_read.pop(item_id, None)
+        client = _get_redis()
+        if client is not None:
+            try:
+                client.set(self._key(item_id), "0", ex=self.ttl)
+                return
+            except RedisError as e:
+                print(f"[cancellation] Redis error on start, using in-process flag: {e}")
+        self._local[item_id] = False
+
+    def request_cancel(self, item_id: int) -> bool:
+        """Flag an active run for cancellation. Returns False if none is active."""
+        client = _get_redis()
+        if client is not None:
+            try:
+                if client.set(self._key(item_id), "1", xx=True, keepttl=True):
+                    return True
+            except RedisError as e:
+                print(f"[cancellation] Redis error on cancel, using in-process flag: {e}")
+        # Runs started while Redis was failing are only known locally
+        if item_id not in self._local:
+            return False
+        self._local[item_id] = True
+        return True
+
+    def is_cancelled(self, item_id: int) -> bool:
+        """Check whether cancellation was requested for an active run.
+
+        A Redis error reads as the in-process flag (not cancelled unless
+        this process was asked), so the run carries on.
+        """
+        if self._local.get(item_id):
+            return True
+        client = _get_redis()
+        if client is None:
+            return False
+
+        now = time.monotonic()
+        cached = self._last_read.get(item_id)
+        if cached and (cached[1] or now - cached[0] < self.LOCAL_TTL):
+            return cached[1]
+        try:
+            cancelled = client.get(self._key(item_id)) == b"1"
+        except RedisError as e:
+            print(f"[cancellation] Redis error on check, assuming not cancelled: {e}")
+            return False
+        self._last_read[item_id] = (now, cancelled)
+        return cancelled
+
+    def finish(self, item_id: int) -> None:
+        """Forget a run once it has completed or been cancelled."""
+        self._last_read.pop(item_id, None)
+        self._local.pop(item_id, None)
+        client = _get_redis()
+        if client is not None:
+            try:
+                client.delete(self._key(item_id))
+            except RedisError as e:
+                # The key expires after ttl seconds anyway
+                print(f"[cancellation] Redis error on finish: {e}")
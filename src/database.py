@@ -1,7 +1,9 @@
 import sqlite3
 import json
 import os
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timedelta
 from typing import Any
 
 
@@ -17,6 +19,32 @@ def get_db() -> sqlite3.Connection:
     return conn
 
 
+def iter_id_batches(query: str, params: tuple = (), batch_size: int = 100):
+    """Yield lists of ids from a keyset-paginated query, one short connection per batch.
+
+    `query` must select a single id column, end its WHERE clause with
+    `<id> > ?` and finish with `ORDER BY <id> LIMIT ?`; the last id seen and
+    batch_size are appended to `params`. Long per-batch work in the caller
+    never holds a read transaction open.
+    """
+    last_id = 0
+    while True:
+        conn = get_db()
+        rows = conn.execute(query, (*params, last_id, batch_size)).fetchall()
+        conn.close()
+        if rows:
+            yield [row[0] for row in rows]
+        if len(rows) < batch_size:
+            return
+        last_id = rows[-1][0]
+
+
+def iter_batched_ids(query: str, params: tuple = (), batch_size: int = 100):
+    """Yield ids one at a time from a keyset-paginated query (see iter_id_batches)."""
+    for batch in iter_id_batches(query, params, batch_size):
+        yield from batch
+
+
 def init_db() -> None:
     """Create database tables if they don't exist, and run migrations."""
     conn = get_db()
@@ -194,6 +222,8 @@ def init_db() -> None:
     if "user_id" not in job_cols:
         conn.execute("ALTER TABLE jobs ADD COLUMN user_id INTEGER REFERENCES users(id)")
         conn.commit()
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_user_url ON jobs(user_id, url)")
+    conn.commit()
 
     # Migration: add user_id column to applications if it doesn't exist
     app_cols = [row["name"] for row in conn.execute("PRAGMA table_info(applications)").fetchall()]
@@ -228,6 +258,24 @@ def init_db() -> None:
     """)
     conn.commit()
 
+    # Migration: expose the ids that dedup checks look up inside notification
+    # data as indexed virtual columns, instead of LIKE-scanning the JSON text
+    notif_cols = [row["name"] for row in conn.execute("PRAGMA table_xinfo(notifications)").fetchall()]
+    for ref_col, json_key in (("application_id_ref", "application_id"), ("goal_id_ref", "goal_id")):
+        if ref_col not in notif_cols:
+            conn.execute(
+                f"ALTER TABLE notifications ADD COLUMN {ref_col} INTEGER GENERATED ALWAYS AS "
+                f"(CASE WHEN json_valid(data) THEN json_extract(data, '$.{json_key}') END) VIRTUAL"
+            )
+    conn.execute("DROP INDEX IF EXISTS idx_notifications_user_type_read")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_notifications_app_ref ON notifications(user_id, type, read, application_id_ref)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_notifications_goal_ref ON notifications(user_id, type, read, goal_id_ref)"
+    )
+    conn.commit()
+
     # --- Phase 8 tables ---
 
     # RL training log
@@ -268,6 +316,15 @@ def init_db() -> None:
         )
     """)
 
+    # Company research shared across users and task runs (see company_deep_dive)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS company_research_cache (
+            company_key TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            fetched_at TEXT NOT NULL
+        )
+    """)
+
     # Goal suggestion log (anti-spam tracking)
     conn.execute("""
         CREATE TABLE IF NOT EXISTS goal_suggestion_log (
@@ -328,6 +385,18 @@ def init_db() -> None:
         conn.execute("ALTER TABLE user_profiles ADD COLUMN auto_suggestions INTEGER DEFAULT 1")
         conn.commit()
 
+    # Indexes for the periodic tasks' user seed queries (see src/tasks/); the
+    # partial profile indexes hold only the users each scan actually visits
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_apps_status_user ON applications(status, user_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_traces_started_user ON agent_traces(started_at, user_id)")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_profiles_autosug ON user_profiles(user_id) WHERE auto_suggestions = 1"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_profiles_target_role ON user_profiles(user_id) WHERE target_role != ''"
+    )
+    conn.commit()
+
     # Migrate orphaned messages (those without a conversation_id) into a "Previous Chat" conversation
     orphan = conn.execute("SELECT COUNT(*) as cnt FROM chat_history WHERE conversation_id IS NULL").fetchone()
     if orphan["cnt"] > 0:
@@ -498,6 +567,17 @@ def get_chat_history(conversation_id: int, limit: int = 50) -> list[dict]:
     return [dict(row) for row in reversed(rows)]
 
 
+def get_chat_history_after(conversation_id: int, after_id: int = 0, limit: int = 50) -> list[dict]:
+    """Get chat messages with id greater than after_id (the latest `limit`, oldest first)."""
+    conn = get_db()
+    rows = conn.execute(
+        "SELECT * FROM chat_history WHERE conversation_id = ? AND id > ? ORDER BY id DESC LIMIT ?",
+        (conversation_id, after_id, limit),
+    ).fetchall()
+    conn.close()
+    return [dict(row) for row in reversed(rows)]
+
+
 # --- Jobs & Applications (user-scoped) ---
 
 def save_job(job: dict, user_id: int | None = None) -> int:
@@ -542,6 +622,21 @@ def get_jobs(user_id: int | None = None, limit: int = 50) -> list[dict]:
     return [dict(row) for row in rows]
 
 
+def filter_new_job_urls(user_id: int, urls: list[str]) -> set[str]:
+    """Return the URLs from `urls` the user has not saved a job for yet."""
+    urls = {url for url in urls if url}
+    if not urls:
+        return set()
+    conn = get_db()
+    placeholders = ", ".join("?" * len(urls))
+    rows = conn.execute(
+        f"SELECT url FROM jobs WHERE user_id = ? AND url IN ({placeholders})",
+        (user_id, *urls),
+    ).fetchall()
+    conn.close()
+    return urls - {row["url"] for row in rows}
+
+
 def create_application(job_id: int, jd_text: str = "", user_id: int | None = None) -> int:
     """Create a new application entry."""
     conn = get_db()
@@ -601,6 +696,197 @@ def get_applications(user_id: int | None = None, status: str | None = None) -> l
     return [dict(row) for row in rows]
 
 
+def get_stale_applications_without_followup(user_id: int, stale_before: str) -> list[dict]:
+    """Get 'applied' applications not updated since stale_before that have no
+    unread follow-up notification yet."""
+    conn = get_db()
+    rows = conn.execute(
+        """SELECT a.*, j.title, j.company FROM applications a
+           JOIN jobs j ON a.job_id = j.id
+           LEFT JOIN notifications n
+             ON n.user_id = a.user_id AND n.type = 'application_followup' AND n.read = 0
+            AND n.application_id_ref = a.id
+           WHERE a.user_id = ? AND a.status = 'applied' AND COALESCE(a.updated_at, '') < ?
+             AND n.id IS NULL
+           ORDER BY a.updated_at DESC""",
+        (user_id, stale_before),
+    ).fetchall()
+    conn.close()
+    return [dict(row) for row in rows]
+
+
+def get_dashboard_bundle(user_id: int, recent_limit: int = 5) -> dict:
+    """Get all dashboard aggregates for a user over a single connection.
+
+    Counts are computed in SQLite instead of materializing every row, so the
+    dashboard costs one connection and three small queries.
+    """
+    conn = get_db()
+    totals = conn.execute(
+        """SELECT
+               (SELECT COUNT(*) FROM jobs WHERE user_id = ?) AS total_jobs_saved,
+               (SELECT COUNT(*) FROM conversations WHERE user_id = ?) AS total_conversations,
+               (SELECT COUNT(*) FROM user_resumes WHERE user_id = ?) AS total_resumes,
+               EXISTS(SELECT 1 FROM user_profiles WHERE user_id = ?) AS has_profile""",
+        (user_id, user_id, user_id, user_id),
+    ).fetchone()
+    status_rows = conn.execute(
+        "SELECT COALESCE(a.status, 'saved') AS status, COUNT(*) AS cnt FROM applications a "
+        "JOIN jobs j ON a.job_id = j.id WHERE a.user_id = ? GROUP BY COALESCE(a.status, 'saved')",
+        (user_id,),
+    ).fetchall()
+    recent_rows = conn.execute(
+        "SELECT j.title, j.company, a.status, a.updated_at FROM applications a "
+        "JOIN jobs j ON a.job_id = j.id WHERE a.user_id = ? ORDER BY a.updated_at DESC LIMIT ?",
+        (user_id, recent_limit),
+    ).fetchall()
+    conn.close()
+
+    status_counts = {row["status"]: row["cnt"] for row in status_rows}
+    return {
+        "total_jobs_saved": totals["total_jobs_saved"],
+        "total_applications": sum(status_counts.values()),
+        "total_conversations": totals["total_conversations"],
+        "total_resumes": totals["total_resumes"],
+        "has_profile": bool(totals["has_profile"]),
+        "application_status": status_counts,
+        "recent_applications": [dict(row) for row in recent_rows],
+    }
+
+
+def get_suggestion_rows(user_id: int, stale_before: str, limit: int = 3, goal_limit: int = 2) -> list[dict]:
+    """Evaluate SuggestionEngine's rules in one query and return the top `limit` hits.
+
+    Each UNION ALL branch is one rule: it yields a row (rule, priority, ord,
+    ref_id, title, count) only when its predicate holds. `ord` orders the
+    goal rows, which share a priority, most recently updated first.
+    """
+    conn = get_db()
+    rows = conn.execute(
+        """SELECT rule, priority, ref_id, title, count FROM (
+               SELECT 'complete_profile' AS rule, 10 AS priority, 0 AS ord,
+                      NULL AS ref_id, NULL AS title, 0 AS count
+               WHERE NOT EXISTS(SELECT 1 FROM user_profiles
+                                WHERE user_id = :user_id AND COALESCE(target_role, '') != '')
+               UNION ALL
+               SELECT 'upload_resume', 9, 0, NULL, NULL, 0
+               WHERE NOT EXISTS(SELECT 1 FROM user_resumes WHERE user_id = :user_id)
+               UNION ALL
+               SELECT 'goal_steps', 8, ord, id, title, pending FROM (
+                   SELECT g.id, g.title,
+                          ROW_NUMBER() OVER (ORDER BY g.updated_at DESC) AS ord,
+                          (SELECT COUNT(*) FROM goal_steps s
+                           WHERE s.goal_id = g.id AND s.status = 'pending') AS pending
+                   FROM goals g WHERE g.user_id = :user_id AND g.status = 'active'
+                   ORDER BY g.updated_at DESC LIMIT :goal_limit
+               ) WHERE pending > 0
+               UNION ALL
+               SELECT 'draft_cover_letters', 7, 0, NULL, NULL, cnt FROM (
+                   SELECT COUNT(*) AS cnt FROM jobs j WHERE j.user_id = :user_id AND NOT EXISTS (
+                       SELECT 1 FROM applications a WHERE a.user_id = :user_id AND a.job_id = j.id
+                   )
+               ) WHERE cnt > 0
+               UNION ALL
+               SELECT 'follow_up', 6, 0, NULL, NULL, cnt FROM (
+                   SELECT COUNT(*) AS cnt FROM applications
+                   WHERE user_id = :user_id AND status = 'applied'
+                         AND COALESCE(updated_at, '') < :stale_before
+               ) WHERE cnt > 0
+               UNION ALL
+               SELECT 'first_chat', 5, 0, NULL, NULL, 0
+               WHERE NOT EXISTS(SELECT 1 FROM conversations WHERE user_id = :user_id)
+           ) ORDER BY priority DESC, ord LIMIT :limit""",
+        {"user_id": user_id, "stale_before": stale_before, "limit": limit, "goal_limit": goal_limit},
+    ).fetchall()
+    conn.close()
+    return [dict(row) for row in rows]
+
+
+def get_opportunity_data_many(
+    user_ids: list[int], job_limit: int = 50, trace_limit: int = 30
+) -> dict[int, dict]:
+    """Get the user state OpportunityDetector needs for several users at once.
+
+    Every table is read with one `user_id IN (...)` query over a single
+    connection and partitioned per user here, so a scan batch costs a fixed
+    number of queries however many users it holds. Jobs and traces are the
+    most recent `job_limit` / `trace_limit` rows per user.
+    """
+    data = {
+        user_id: {
+            "profile": None,
+            "auto_suggestions": True,  # Default on when there is no profile
+            "jobs": [],
+            "applications": [],
+            "traces": [],
+            "has_resume": False,
+            "recent_suggestions": [],
+            "recent_cooldown_keys": set(),
+        }
+        for user_id in user_ids
+    }
+    if not user_ids:
+        return data
+
+    conn = get_db()
+    placeholders = ", ".join("?" * len(user_ids))
+    profile_rows = conn.execute(
+        f"SELECT * FROM user_profiles WHERE user_id IN ({placeholders})", user_ids
+    ).fetchall()
+    job_rows = conn.execute(
+        f"""SELECT * FROM (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY saved_at DESC) AS rn
+                FROM jobs WHERE user_id IN ({placeholders})
+            ) WHERE rn <= ? ORDER BY user_id, rn""",
+        (*user_ids, job_limit),
+    ).fetchall()
+    app_rows = conn.execute(
+        "SELECT a.*, j.title, j.company FROM applications a "
+        f"JOIN jobs j ON a.job_id = j.id WHERE a.user_id IN ({placeholders}) "
+        "ORDER BY a.updated_at DESC",
+        user_ids,
+    ).fetchall()
+    trace_rows = conn.execute(
+        f"""SELECT * FROM (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY started_at DESC) AS rn
+                FROM agent_traces WHERE user_id IN ({placeholders})
+            ) WHERE rn <= ? ORDER BY user_id, rn""",
+        (*user_ids, trace_limit),
+    ).fetchall()
+    resume_rows = conn.execute(
+        f"SELECT DISTINCT user_id FROM user_resumes WHERE user_id IN ({placeholders})", user_ids
+    ).fetchall()
+    suggestion_rows = conn.execute(
+        f"""SELECT *, created_at > datetime('now', '-24 hours') AS is_recent
+            FROM goal_suggestion_log
+            WHERE user_id IN ({placeholders}) AND created_at > datetime('now', '-7 days')
+            ORDER BY created_at DESC""",
+        user_ids,
+    ).fetchall()
+    conn.close()
+
+    for row in profile_rows:
+        profile = dict(row)
+        profile["skills"] = json.loads(profile.get("skills") or "[]")
+        data[row["user_id"]]["profile"] = profile
+        data[row["user_id"]]["auto_suggestions"] = bool(row["auto_suggestions"])
+    for key, rows in (("jobs", job_rows), ("applications", app_rows), ("traces", trace_rows)):
+        for row in rows:
+            item = dict(row)
+            item.pop("rn", None)
+            data[row["user_id"]][key].append(item)
+    for row in resume_rows:
+        data[row["user_id"]]["has_resume"] = True
+    for row in suggestion_rows:
+        user_data = data[row["user_id"]]
+        user_data["recent_cooldown_keys"].add(row["cooldown_key"])
+        if row["is_recent"]:
+            suggestion = dict(row)
+            suggestion.pop("is_recent")
+            user_data["recent_suggestions"].append(suggestion)
+    return data
+
+
 def save_analysis(application_id: int, agent_name: str, output: str) -> int:
     """Save an agent's analysis output."""
     conn = get_db()
@@ -617,16 +903,47 @@ def save_analysis(application_id: int, agent_name: str, output: str) -> int:
 
 # --- User Profile CRUD ---
 
-def get_profile(user_id: int) -> dict | None:
-    """Get the profile for a user."""
+# Profiles are read on every chat turn and scan but change rarely. Entries are
+# dropped on write in this process; other processes (server workers, Celery)
+# see a change once their entry expires.
+PROFILE_CACHE_TTL = float(os.getenv("PROFILE_CACHE_TTL", "60"))
+_PROFILE_CACHE_MAX = 10_000
+_profile_cache: dict[tuple[str, int], tuple[float, dict | None]] = {}
+_profile_cache_lock = threading.Lock()
+
+
+def _invalidate_profile(user_id: int) -> None:
+    with _profile_cache_lock:
+        _profile_cache.pop((DB_PATH, user_id), None)
+
+
+def get_profile(user_id: int, fresh: bool = False) -> dict | None:
+    """Get the profile for a user.
+
+    Pass fresh=True to skip the cache (and refresh it), e.g. when the user
+    is looking at their own profile and may have just edited it via
+    another worker.
+    """
+    key = (DB_PATH, user_id)
+    with _profile_cache_lock:
+        cached = None if fresh else _profile_cache.get(key)
+    if cached and time.monotonic() - cached[0] < PROFILE_CACHE_TTL:
+        profile = cached[1]
+        return {**profile, "skills": list(profile["skills"])} if profile else None
+
     conn = get_db()
     row = conn.execute("SELECT * FROM user_profiles WHERE user_id = ?", (user_id,)).fetchone()
     conn.close()
-    if not row:
-        return None
-    result = dict(row)
-    result["skills"] = json.loads(result.get("skills") or "[]")
-    return result
+    result = None
+    if row:
+        result = dict(row)
+        result["skills"] = json.loads(result.get("skills") or "[]")
+
+    with _profile_cache_lock:
+        if key not in _profile_cache and len(_profile_cache) >= _PROFILE_CACHE_MAX:
+            _profile_cache.pop(next(iter(_profile_cache)))
+        _profile_cache[key] = (time.monotonic(), result)
+    return {**result, "skills": list(result["skills"])} if result else None
 
 
 def upsert_profile(user_id: int, **kwargs) -> dict:
@@ -652,6 +969,7 @@ def upsert_profile(user_id: int, **kwargs) -> dict:
 
     conn.commit()
     conn.close()
+    _invalidate_profile(user_id)
     return get_profile(user_id)
 
 
@@ -792,13 +1110,19 @@ def complete_trace(trace_id: int, status: str = "completed", output: str = "", t
     conn.close()
 
 
-def get_traces(user_id: int, limit: int = 20) -> list[dict]:
-    """Get recent agent traces for a user."""
+def get_traces(user_id: int, limit: int = 20, agent_name: str | None = None) -> list[dict]:
+    """Get recent agent traces for a user, optionally for one agent."""
     conn = get_db()
-    rows = conn.execute(
-        "SELECT * FROM agent_traces WHERE user_id = ? ORDER BY started_at DESC LIMIT ?",
-        (user_id, limit),
-    ).fetchall()
+    if agent_name:
+        rows = conn.execute(
+            "SELECT * FROM agent_traces WHERE user_id = ? AND agent_name = ? ORDER BY started_at DESC LIMIT ?",
+            (user_id, agent_name, limit),
+        ).fetchall()
+    else:
+        rows = conn.execute(
+            "SELECT * FROM agent_traces WHERE user_id = ? ORDER BY started_at DESC LIMIT ?",
+            (user_id, limit),
+        ).fetchall()
     conn.close()
     return [dict(row) for row in rows]
 
@@ -948,6 +1272,30 @@ def create_notification(user_id: int, type: str, title: str, message: str, data:
     return nid
 
 
+def create_notifications(user_id: int, notifications: list[dict]) -> int:
+    """Create several notifications for a user in one transaction.
+
+    Each dict carries type, title, message and optionally data (JSON string).
+    Returns the number of notifications created.
+    """
+    if not notifications:
+        return 0
+    conn = get_db()
+    now = datetime.now().isoformat()
+    try:
+        conn.executemany(
+            "INSERT INTO notifications (user_id, type, title, message, data, read, created_at) VALUES (?, ?, ?, ?, ?, 0, ?)",
+            [(user_id, n["type"], n["title"], n["message"], n.get("data", "{}"), now) for n in notifications],
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return len(notifications)
+
+
 def get_notifications(user_id: int, unread_only: bool = False, limit: int = 50) -> list[dict]:
     """Get notifications for a user, most recent first."""
     conn = get_db()
@@ -1068,6 +1416,23 @@ def get_goal_steps(goal_id: int) -> list[dict]:
     return [dict(row) for row in rows]
 
 
+def get_goal_steps_many(goal_ids: list[int]) -> dict[int, list[dict]]:
+    """Get the steps of several goals in one query, keyed by goal ID."""
+    steps_by_goal: dict[int, list[dict]] = {goal_id: [] for goal_id in goal_ids}
+    if not goal_ids:
+        return steps_by_goal
+    conn = get_db()
+    placeholders = ", ".join("?" * len(goal_ids))
+    rows = conn.execute(
+        f"SELECT * FROM goal_steps WHERE goal_id IN ({placeholders}) ORDER BY goal_id, step_number ASC",
+        goal_ids,
+    ).fetchall()
+    conn.close()
+    for row in rows:
+        steps_by_goal[row["goal_id"]].append(dict(row))
+    return steps_by_goal
+
+
 def update_goal_status(goal_id: int, status: str) -> None:
     """Update a goal's status."""
     conn = get_db()
@@ -1184,6 +1549,29 @@ def create_task_result(task_id: int, result_type: str, data: str = "{}") -> int:
     return result_id
 
 
+def get_company_research(company_name: str, max_age_hours: int = 24) -> dict | None:
+    """Get cached research for a company if it was fetched within max_age_hours."""
+    conn = get_db()
+    cutoff = (datetime.now() - timedelta(hours=max_age_hours)).isoformat()
+    row = conn.execute(
+        "SELECT data FROM company_research_cache WHERE company_key = ? AND fetched_at > ?",
+        (company_name.strip().lower(), cutoff),
+    ).fetchone()
+    conn.close()
+    return json.loads(row["data"]) if row else None
+
+
+def save_company_research(company_name: str, data: dict) -> None:
+    """Cache research for a company, replacing any earlier entry."""
+    conn = get_db()
+    conn.execute(
+        "INSERT OR REPLACE INTO company_research_cache (company_key, data, fetched_at) VALUES (?, ?, ?)",
+        (company_name.strip().lower(), json.dumps(data), datetime.now().isoformat()),
+    )
+    conn.commit()
+    conn.close()
+
+
 def get_task_results(task_id: int) -> list[dict]:
     """Get all results for an autonomous task."""
     conn = get_db()
@@ -1265,6 +1653,57 @@ def log_goal_suggestion(user_id: int, trigger_type: str, cooldown_key: str, conf
     return log_id
 
 
+def bulk_create_goal_suggestions(user_id: int, suggestions: list[dict]) -> list[int]:
+    """Create agent-suggested goals with their steps, anti-spam log entries and
+    notifications in a single transaction. Returns the new goal IDs in order.
+
+    Each suggestion dict carries title, description, trigger_type, confidence,
+    cooldown_key and agent_steps (a list of {"title", "agent_name"} dicts).
+    """
+    if not suggestions:
+        return []
+    conn = get_db()
+    now = datetime.now().isoformat()
+    goal_ids = []
+    steps, logs, notifications = [], [], []
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        for s in suggestions:
+            cursor = conn.execute(
+                "INSERT INTO goals (user_id, title, description, status, origin, trigger_type, created_at, updated_at) VALUES (?, ?, ?, 'suggested', 'agent_suggested', ?, ?, ?)",
+                (user_id, s["title"], s["description"], s["trigger_type"], now, now),
+            )
+            goal_id = cursor.lastrowid
+            goal_ids.append(goal_id)
+            for i, step in enumerate(s.get("agent_steps", []), 1):
+                steps.append((goal_id, i, step.get("title", ""), "", step.get("agent_name", ""), now))
+            logs.append((user_id, s["trigger_type"], s["cooldown_key"], s["confidence"], goal_id, now))
+            notifications.append((
+                user_id, "goal_suggested", f"Suggestion: {s['title']}", s["description"],
+                json.dumps({"goal_id": goal_id, "trigger_type": s["trigger_type"], "confidence": s["confidence"]}),
+                now,
+            ))
+        conn.executemany(
+            "INSERT INTO goal_steps (goal_id, step_number, title, description, agent_name, status, created_at) VALUES (?, ?, ?, ?, ?, 'pending', ?)",
+            steps,
+        )
+        conn.executemany(
+            "INSERT INTO goal_suggestion_log (user_id, trigger_type, cooldown_key, confidence, goal_id, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            logs,
+        )
+        conn.executemany(
+            "INSERT INTO notifications (user_id, type, title, message, data, read, created_at) VALUES (?, ?, ?, ?, ?, 0, ?)",
+            notifications,
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return goal_ids
+
+
 def get_recent_suggestions(user_id: int, hours: int = 24) -> list[dict]:
     """Get suggestions created in the last N hours for anti-spam."""
     conn = get_db()
@@ -28,9 +28,9 @@ def get_embedding(text: str) -> list[float] | None:
         return None
 
     try:
-        from openai import OpenAI
+        from .utils.llm_client import get_openai_client
 
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client(api_key)
         response = client.embeddings.create(
             model="text-embedding-3-small",
             input=text[:8000],  # model limit safety
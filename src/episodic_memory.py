@@ -7,11 +7,11 @@ Categories: fact, preference, goal, outcome.
 import json
 import os
 
-from openai import OpenAI
 from dotenv import load_dotenv
 
 from . import database as db
 from . import embeddings
+from .utils.llm_client import get_openai_client
 
 load_dotenv()
 
@@ -88,15 +88,14 @@ def extract_memories_from_output(agent_output: str, user_message: str = "") -> l
     """Use a cheap LLM call to extract memorable facts from agent output."""
     provider = os.getenv("LLM_PROVIDER", "groq")
     if provider == "ollama":
-        client = OpenAI(
-            api_key="ollama",
-            base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434/v1"),
+        client = get_openai_client(
+            "ollama", os.getenv("OLLAMA_BASE_URL", "http://localhost:11434/v1"),
         )
     else:
         api_key = os.getenv("GROQ_API_KEY")
         if not api_key:
             return []
-        client = OpenAI(api_key=api_key, base_url="https://api.groq.com/openai/v1")
+        client = get_openai_client(api_key, "https://api.groq.com/openai/v1")
 
     try:
         response = client.chat.completions.create(
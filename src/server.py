@@ -1,40 +1,31 @@
 import os
 import json
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from functools import cache
 
 from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel
+import orjson
 from dotenv import load_dotenv
-from openai import OpenAI
 from fastapi.requests import Request
 from fastapi.responses import JSONResponse
 
 from . import database as db
 from .auth import hash_password, verify_password, create_token, get_current_user, verify_google_token
 from .tools.base import ToolRegistry
-from .tools.job_search import JobSearchTool
-from .tools.jd_parser import JDParserTool
-from .tools.resume_analyzer import ResumeAnalyzerTool
-from .tools.skills_matcher import SkillsMatcherTool
-from .tools.ats_scorer import ATSScorerTool
-from .tools.interview_prep import InterviewPrepTool
-from .tools.cover_letter import CoverLetterTool
-from .tools.resume_rewriter import ResumeRewriterTool
-from .tools.company_researcher import CompanyResearcherTool
-from .tools.github_analyzer import GitHubAnalyzerTool
-from .tools.salary_research import SalaryResearchTool
-from .tools.email_drafter import EmailDrafterTool
-from .tools.learning_path import LearningPathTool
-from .tools.mock_interview import MockInterviewTool
-from .tools.web_fetch import WebFetchTool
-from .agents.orchestrator import Orchestrator
 from .agents.router import AgentRouter, RoutingDecision
-from .agents.planner import GoalPlanner
-from .episodic_memory import EpisodicMemory
 from .websocket_manager import ws_manager, authenticate_ws
+from .cancellation import CancelFlags
+from .utils.llm_client import get_async_openai_client, get_openai_client
 
 load_dotenv()
 
@@ -45,7 +36,14 @@ async def lifespan(app: FastAPI):
     # Start background scheduler for proactive notifications
     from .background import start_scheduler, stop_scheduler
     start_scheduler()
+    # Relay notifications pushed by Celery workers and scheduler threads
+    relay = asyncio.create_task(ws_manager.relay_published())
     yield
+    relay.cancel()
+    try:
+        await relay
+    except asyncio.CancelledError:
+        pass
     stop_scheduler()
 
 
@@ -65,6 +63,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads (analysis, pipeline, conversation lists).
+# Starlette skips text/event-stream, so SSE chat frames still flush per chunk.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -277,6 +279,8 @@ def health_check():
 @app.post("/api/search")
 def search_jobs(req: SearchRequest, user: dict = Depends(get_current_user)):
     """Search for jobs across multiple boards."""
+    from .tools.job_search import JobSearchTool
+
     tool = JobSearchTool()
     result = tool.execute(keywords=req.keywords, max_results=req.max_results)
     return result
@@ -285,6 +289,10 @@ def search_jobs(req: SearchRequest, user: dict = Depends(get_current_user)):
 @app.post("/api/analyze")
 def analyze_job(req: AnalyzeRequest, user: dict = Depends(get_current_user)):
     """Analyze a JD against a resume using the Match agent pipeline."""
+    from .tools.jd_parser import JDParserTool
+    from .tools.resume_analyzer import ResumeAnalyzerTool
+    from .tools.ats_scorer import ATSScorerTool
+
     # Parse JD
     jd_tool = JDParserTool()
     jd_result = jd_tool.execute(source=req.jd_text)
@@ -331,11 +339,14 @@ def analyze_job(req: AnalyzeRequest, user: dict = Depends(get_current_user)):
 @app.post("/api/pipeline")
 def run_pipeline(req: PipelineRequest, user: dict = Depends(get_current_user)):
     """Run the full multi-agent pipeline (Match -> Forge -> Coach)."""
+    from .tools.resume_analyzer import ResumeAnalyzerTool
+    from .agents.orchestrator import Orchestrator
+
     # Get resume text — either directly provided or from file
     resume_text = req.resume_text.strip()
     if not resume_text and req.resume_path:
         resume_tool = ResumeAnalyzerTool()
-        resume_result = resume_tool.execute(file_path=req.resume_path)
+        resume_result = resume_tool.execute(file_path=req.resume_path, include_sections=False)
         if not resume_result.get("success"):
             raise HTTPException(status_code=400, detail=resume_result.get("error"))
         resume_text = resume_result.get("raw_text", "")
@@ -400,31 +411,7 @@ def update_application(app_id: int, req: UpdateApplicationRequest, user: dict =
 @app.get("/api/dashboard")
 def get_dashboard(user: dict = Depends(get_current_user)):
     """Aggregated stats for the user's dashboard."""
-    jobs = db.get_jobs(user_id=user["id"])
-    applications = db.get_applications(user_id=user["id"])
-    conversations = db.get_conversations(user_id=user["id"])
-    resumes = db.get_resumes(user["id"])
-    profile = db.get_profile(user["id"])
-
-    status_counts = {}
-    for app in applications:
-        s = app.get("status", "saved")
-        status_counts[s] = status_counts.get(s, 0) + 1
-
-    recent_apps = applications[:5]
-
-    return {
-        "total_jobs_saved": len(jobs),
-        "total_applications": len(applications),
-        "total_conversations": len(conversations),
-        "total_resumes": len(resumes),
-        "has_profile": profile is not None,
-        "application_status": status_counts,
-        "recent_applications": [
-            {"title": a.get("title", ""), "company": a.get("company", ""), "status": a.get("status", ""), "updated_at": a.get("updated_at", "")}
-            for a in recent_apps
-        ],
-    }
+    return db.get_dashboard_bundle(user["id"])
 
 
 # --- Learning Path ---
@@ -479,7 +466,8 @@ def generate_learning_path(user: dict = Depends(get_current_user)):
 @app.get("/api/profile")
 def get_profile(user: dict = Depends(get_current_user)):
     """Get the current user's profile."""
-    profile = db.get_profile(user["id"])
+    # Uncached: an edit served by another worker must show up immediately
+    profile = db.get_profile(user["id"], fresh=True)
     if not profile:
         return {"user_id": user["id"], "target_role": "", "experience_level": "", "skills": [], "bio": "", "linkedin_url": "", "github_username": "", "location": ""}
     return profile
@@ -555,6 +543,7 @@ def delete_conversation(conv_id: int, user: dict = Depends(get_current_user)):
     if not conv:
         raise HTTPException(status_code=404, detail="Conversation not found")
     db.delete_conversation(conv_id)
+    _history_cache.pop(conv_id, None)
     return {"message": "Conversation deleted"}
 
 
@@ -579,15 +568,8 @@ def get_conversation_messages(conv_id: int, user: dict = Depends(get_current_use
 
 # --- File extraction ---
 
-@app.post("/api/extract-text")
-async def extract_text(file: UploadFile = File(...), user: dict = Depends(get_current_user)):
-    """Extract text from an uploaded file (.txt, .md, .pdf)."""
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="No file provided")
-
-    ext = os.path.splitext(file.filename)[1].lower()
-    content = await file.read()
-
+def _extract_upload_text(ext: str, content: bytes) -> str:
+    """Decode or parse uploaded file bytes into text. CPU-bound for PDFs."""
     if ext == ".pdf":
         try:
             import fitz
@@ -605,6 +587,23 @@ async def extract_text(file: UploadFile = File(...), user: dict = Depends(get_cu
             text = content.decode("latin-1")
     else:
         raise HTTPException(status_code=400, detail=f"Unsupported file type: {ext}")
+    return text
+
+
+@app.post("/api/extract-text")
+async def extract_text(file: UploadFile = File(...), user: dict = Depends(get_current_user)):
+    """Extract text from an uploaded file (.txt, .md, .pdf)."""
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="No file provided")
+
+    ext = os.path.splitext(file.filename)[1].lower()
+    if ext not in (".pdf", ".txt", ".md", ".text"):
+        raise HTTPException(status_code=400, detail=f"Unsupported file type: {ext}")
+
+    # Read the spooled upload and parse it off the event loop — PDF parsing
+    # with PyMuPDF would otherwise stall every other request on this worker.
+    content = await asyncio.to_thread(file.file.read)
+    text = await asyncio.to_thread(_extract_upload_text, ext, content)
 
     return {"text": text, "filename": file.filename, "char_count": len(text)}
 
@@ -645,8 +644,26 @@ DOCUMENT HANDLING:
 - If it's another document type, summarize and help the user with whatever they need"""
 
 
-# Build a chat tool registry with all tools
+# Build a chat tool registry with all tools. Tool modules are imported here
+# rather than at module top so /api/health and auth routes don't pay for
+# requests/bs4 and the agent stack on cold start.
 def _build_chat_registry() -> ToolRegistry:
+    from .tools.job_search import JobSearchTool
+    from .tools.jd_parser import JDParserTool
+    from .tools.resume_analyzer import ResumeAnalyzerTool
+    from .tools.skills_matcher import SkillsMatcherTool
+    from .tools.ats_scorer import ATSScorerTool
+    from .tools.interview_prep import InterviewPrepTool
+    from .tools.cover_letter import CoverLetterTool
+    from .tools.resume_rewriter import ResumeRewriterTool
+    from .tools.company_researcher import CompanyResearcherTool
+    from .tools.github_analyzer import GitHubAnalyzerTool
+    from .tools.salary_research import SalaryResearchTool
+    from .tools.email_drafter import EmailDrafterTool
+    from .tools.learning_path import LearningPathTool
+    from .tools.mock_interview import MockInterviewTool
+    from .tools.web_fetch import WebFetchTool
+
     registry = ToolRegistry()
     registry.register(JobSearchTool())
     registry.register(JDParserTool())
@@ -665,14 +682,59 @@ def _build_chat_registry() -> ToolRegistry:
     registry.register(WebFetchTool())
     return registry
 
-CHAT_REGISTRY = _build_chat_registry()
+
+@cache
+def _get_chat_registry() -> ToolRegistry:
+    """Build the chat tool registry on first use and reuse it afterwards."""
+    return _build_chat_registry()
+
+
+@cache
+def _get_chat_tool_specs() -> list[dict]:
+    """OpenAI function specs for the chat registry. Tools are static, so build once."""
+    return _get_chat_registry().to_openai_specs()
+
+
 MAX_TOOL_ROUNDS = int(os.getenv("MAX_TOOL_ROUNDS", "6"))
+MAX_HISTORY_TOKENS = int(os.getenv("MAX_HISTORY_TOKENS", "6000"))
+MAX_TOOL_RESULT_TOKENS = int(os.getenv("MAX_TOOL_RESULT_TOKENS", "1000"))
+MAX_AGENT_OUTPUT_TOKENS = int(os.getenv("MAX_AGENT_OUTPUT_TOKENS", "750"))
+
+# Streamed content deltas are coalesced into one SSE frame until either
+# limit is reached, instead of one frame per token.
+SSE_FLUSH_CHARS = int(os.getenv("SSE_FLUSH_CHARS", "32"))
+SSE_FLUSH_INTERVAL = float(os.getenv("SSE_FLUSH_INTERVAL", "0.02"))
+
+
+class _DeltaBuffer:
+    """Accumulates streamed content deltas and releases them in batches."""
+
+    def __init__(self):
+        self._parts: list[str] = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+
+    def add(self, text: str) -> str:
+        """Buffer a delta; return the batched text once a flush is due, else ''."""
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= SSE_FLUSH_CHARS or time.monotonic() - self._last_flush >= SSE_FLUSH_INTERVAL:
+            return self.flush()
+        return ""
+
+    def flush(self) -> str:
+        """Return and clear whatever is buffered."""
+        text = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        self._last_flush = time.monotonic()
+        return text
 
 # Agent router for smart dispatch
 _agent_router = AgentRouter()
 
-# Active dispatch tracking for cancellation (Phase 6)
-_active_dispatches: dict[int, dict] = {}  # conversation_id -> {"cancel_requested": False}
+# Active dispatch tracking for cancellation (Phase 6) — shared across workers
+_active_dispatches = CancelFlags("chat", ttl=600)
 
 # Friendly agent names for status messages
 _AGENT_STATUS = {
@@ -683,27 +745,47 @@ _AGENT_STATUS = {
 }
 
 # Simple TTL cache for tool results (5-minute expiry)
-_tool_cache: dict[str, tuple[float, dict]] = {}
+# Oldest entry first; tool calls run concurrently in worker threads, so every
+# access goes through the lock
+_tool_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+_tool_cache_lock = threading.Lock()
 _CACHE_TTL = 300  # seconds
+_TOOL_CACHE_MAX = 100
 _CACHEABLE_TOOLS = {"search_jobs", "research_company", "analyze_github", "research_salary", "fetch_url"}
 
 
-def _get_llm_client():
+def _llm_client_config() -> dict | None:
+    """Connection settings for the configured LLM provider, or None if unset."""
     provider = os.getenv("LLM_PROVIDER", "groq")
     if provider == "ollama":
-        return OpenAI(
-            api_key="ollama",
-            base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434/v1"),
-        )
+        return {
+            "api_key": "ollama",
+            "base_url": os.getenv("OLLAMA_BASE_URL", "http://localhost:11434/v1"),
+        }
     api_key = os.getenv("GROQ_API_KEY")
     if not api_key:
         return None
-    return OpenAI(api_key=api_key, base_url="https://api.groq.com/openai/v1")
+    return {"api_key": api_key, "base_url": "https://api.groq.com/openai/v1"}
+
+
+def _get_llm_client():
+    config = _llm_client_config()
+    return get_openai_client(**config) if config else None
+
+
+def _get_async_llm_client():
+    """Async client for the streaming chat path (no thread pinned per request)."""
+    config = _llm_client_config()
+    return get_async_openai_client(**config) if config else None
 
 
 def _truncate_title(text: str, max_len: int = 40) -> str:
     """Truncate text to max_len at a word boundary."""
-    text = text.strip().replace("\n", " ")
+    if len(text) <= max_len and "\n" not in text:
+        return text.strip()
+    text = text.strip()
+    if "\n" in text:
+        text = text.replace("\n", " ")
     if len(text) <= max_len:
         return text
     truncated = text[:max_len]
@@ -713,18 +795,51 @@ def _truncate_title(text: str, max_len: int = 40) -> str:
     return truncated + "..."
 
 
+# Recent chat history per conversation. Messages are append-only, so each
+# turn only fetches rows newer than the last cached one.
+_history_cache: dict[int, list[dict]] = {}
+_HISTORY_CACHE_MAX = 1024
+
+
+def _load_chat_history(conversation_id: int, limit: int = 20) -> list[dict]:
+    """Return the latest `limit` messages of a conversation, oldest first."""
+    cached = _history_cache.get(conversation_id, [])
+    after_id = cached[-1]["id"] if cached else 0
+    history = (cached + db.get_chat_history_after(conversation_id, after_id, limit))[-limit:]
+    if conversation_id not in _history_cache and len(_history_cache) >= _HISTORY_CACHE_MAX:
+        _history_cache.pop(next(iter(_history_cache)), None)
+    _history_cache[conversation_id] = history
+    return history
+
+
+def _history_messages(history: list[dict], max_tokens: int = MAX_HISTORY_TOKENS) -> list[dict]:
+    """Convert stored chat history to LLM messages within a token budget.
+
+    Uses the ~4 chars/token heuristic and drops the oldest messages first, so a
+    few long replies can't push the conversation past the model's context.
+    """
+    budget = max_tokens * 4
+    kept = []
+    for msg in reversed(history):
+        budget -= len(msg["content"])
+        if budget < 0:
+            break
+        kept.append({"role": msg["role"], "content": msg["content"]})
+    kept.reverse()
+    return kept
+
+
 def _execute_tool_call(name: str, arguments: dict) -> dict:
     """Execute a tool by name and return its result, with caching for eligible tools."""
-    import time
-
-    tool = CHAT_REGISTRY.get(name)
+    tool = _get_chat_registry().get(name)
     if tool is None:
         return {"success": False, "error": f"Unknown tool: {name}"}
 
     # Check cache for cacheable tools
     if name in _CACHEABLE_TOOLS:
         cache_key = f"{name}:{json.dumps(arguments, sort_keys=True)}"
-        cached = _tool_cache.get(cache_key)
+        with _tool_cache_lock:
+            cached = _tool_cache.get(cache_key)
         if cached:
             ts, result = cached
             if time.time() - ts < _CACHE_TTL:
@@ -738,15 +853,118 @@ def _execute_tool_call(name: str, arguments: dict) -> dict:
     # Store in cache
     if name in _CACHEABLE_TOOLS:
         cache_key = f"{name}:{json.dumps(arguments, sort_keys=True)}"
-        _tool_cache[cache_key] = (time.time(), result)
-        # Evict old entries (keep cache bounded)
-        if len(_tool_cache) > 100:
-            oldest_key = min(_tool_cache, key=lambda k: _tool_cache[k][0])
-            del _tool_cache[oldest_key]
+        with _tool_cache_lock:
+            _tool_cache[cache_key] = (time.time(), result)
+            _tool_cache.move_to_end(cache_key)
+            # Evict the oldest entries (keep cache bounded)
+            while len(_tool_cache) > _TOOL_CACHE_MAX:
+                _tool_cache.popitem(last=False)
 
     return result
 
 
+def _run_tool_call(tool_call: dict) -> dict:
+    """Execute one OpenAI-format tool call dict (function name + JSON arguments)."""
+    function = tool_call["function"]
+    return _execute_tool_call(function["name"], _parse_tool_arguments(function["arguments"]))
+
+
+def _parse_tool_arguments(raw: str | None) -> dict:
+    """Decode the JSON arguments of an LLM tool call, tolerating bad JSON."""
+    try:
+        args = orjson.loads(raw or "{}")
+    except orjson.JSONDecodeError:
+        return {}
+    return args if isinstance(args, dict) else {}
+
+
+def _dump_json(value) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Pre-encoded `data: {"type":"<event>"` prefixes for the SSE event types
+# the chat stream emits; unknown types are encoded on demand.
+_SSE_PREFIXES: dict[str, bytes] = {
+    event_type: b'data: {"type":' + orjson.dumps(event_type)
+    for event_type in (
+        "content", "conversation_id", "routing", "done", "tool_status",
+        "agent_status", "evaluator", "agent_reasoning", "trace_ids",
+        "negotiation_round", "negotiation_result",
+    )
+}
+
+# Goal auto-execution events (GoalPlanner.auto_execute)
+_GOAL_SSE_PREFIXES: dict[str, bytes] = {
+    event_type: b'data: {"type":' + orjson.dumps(event_type)
+    for event_type in ("goal_step_start", "goal_step_complete", "goal_replan", "goal_complete")
+}
+
+
+def _sse_event(event_type: str, data: dict | None = None) -> bytes:
+    """Encode one SSE frame as `data: {"type": event_type, **data}`.
+
+    The payload is serialized once and spliced after the cached type
+    prefix instead of merging dicts and re-serializing per frame.
+    """
+    prefix = (
+        _SSE_PREFIXES.get(event_type)
+        or _GOAL_SSE_PREFIXES.get(event_type)
+        or b'data: {"type":' + orjson.dumps(event_type)
+    )
+    if not data:
+        return prefix + b"}\n\n"
+    return prefix + b"," + orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)[1:] + b"\n\n"
+
+
+def _serialize_tool_result(result: dict, max_tokens: int = MAX_TOOL_RESULT_TOKENS) -> str:
+    """Serialize a tool result for the LLM as compact JSON within a token budget.
+
+    Uses the same ~4 chars/token estimate as the history budget. Oversized
+    results keep every top-level key; long lists lose their tail and long
+    strings are cut, so the LLM still gets valid, parseable JSON.
+    """
+    max_chars = max_tokens * 4
+    result_str = _dump_json(result)
+    if len(result_str) <= max_chars:
+        return result_str
+    if isinstance(result, dict):
+        result_str = _dump_json(_trim_tool_result(result, max_chars))
+    if len(result_str) > max_chars:
+        result_str = result_str[:max_chars] + "\n... (truncated)"
+    return result_str
+
+
+def _trim_tool_result(result: dict, max_chars: int) -> dict:
+    """Shrink the largest fields of a tool result so it fits in max_chars."""
+    sizes = {key: len(_dump_json(value)) for key, value in result.items()}
+    overhead = sum(len(_dump_json(key)) + 2 for key in result) + 2
+    fair_share = max_chars // max(1, len(result))
+    large = {key for key, size in sizes.items() if size > fair_share}
+    small_total = sum(size for key, size in sizes.items() if key not in large)
+    share = max(0, max_chars - overhead - small_total) // max(1, len(large))
+
+    trimmed = {}
+    for key, value in result.items():
+        if key not in large:
+            trimmed[key] = value
+        elif isinstance(value, list):
+            kept, used = [], 2
+            for item in value:
+                item_size = len(_dump_json(item)) + 1
+                if used + item_size > share - 24:  # leave room for the marker
+                    break
+                kept.append(item)
+                used += item_size
+            if len(kept) < len(value):
+                kept.append(f"... ({len(value) - len(kept)} more)")
+            trimmed[key] = kept
+        elif isinstance(value, str):
+            trimmed[key] = value[:max(0, share - 20)] + "... (truncated)"
+        else:
+            trimmed[key] = _dump_json(value)[:max(0, share - 20)] + "... (truncated)"
+    return trimmed
+
+
 def _clean_response(text: str) -> str:
     """Strip any leaked function call syntax from LLM responses."""
     import re
@@ -787,10 +1005,9 @@ def chat(req: ChatRequest, user: dict = Depends(get_current_user)):
     system_content = SYSTEM_PROMPT + _build_user_context(user, profile, default_resume)
 
     # Build conversation messages from history
-    history = db.get_chat_history(conversation_id, limit=20)
+    history = _load_chat_history(conversation_id)
     messages = [{"role": "system", "content": system_content}]
-    for msg in history[:-1]:
-        messages.append({"role": msg["role"], "content": msg["content"]})
+    messages.extend(_history_messages(history[:-1]))
 
     # Build the user message, injecting file content if attached
     user_content = req.message
@@ -807,7 +1024,7 @@ def chat(req: ChatRequest, user: dict = Depends(get_current_user)):
         return {"response": response, "conversation_id": conversation_id}
 
     # Agentic loop: let the LLM call tools, feed results back, repeat
-    tool_specs = CHAT_REGISTRY.to_openai_specs()
+    tool_specs = _get_chat_tool_specs()
     response = ""
 
     try:
@@ -826,39 +1043,37 @@ def chat(req: ChatRequest, user: dict = Depends(get_current_user)):
             # If the LLM wants to call tools, execute them and loop
             if message.tool_calls:
                 # Add the assistant's tool call message
+                tool_calls = [
+                    {
+                        "id": tc.id,
+                        "type": "function",
+                        "function": {
+                            "name": tc.function.name,
+                            "arguments": tc.function.arguments,
+                        },
+                    }
+                    for tc in message.tool_calls
+                ]
                 messages.append({
                     "role": "assistant",
                     "content": message.content,
-                    "tool_calls": [
-                        {
-                            "id": tc.id,
-                            "type": "function",
-                            "function": {
-                                "name": tc.function.name,
-                                "arguments": tc.function.arguments,
-                            },
-                        }
-                        for tc in message.tool_calls
-                    ],
+                    "tool_calls": tool_calls,
                 })
 
-                # Execute each tool call and add results
-                for tc in message.tool_calls:
-                    func_name = tc.function.name
-                    try:
-                        func_args = json.loads(tc.function.arguments)
-                    except json.JSONDecodeError:
-                        func_args = {}
+                # Execute the tool calls concurrently and add results in call order
+                if len(tool_calls) > 1:
+                    with ThreadPoolExecutor(max_workers=len(tool_calls)) as pool:
+                        results = list(pool.map(_run_tool_call, tool_calls))
+                else:
+                    results = [_run_tool_call(tc) for tc in tool_calls]
 
-                    result = _execute_tool_call(func_name, func_args)
+                for tc, result in zip(tool_calls, results):
                     # Truncate large results to avoid context overflow
-                    result_str = json.dumps(result, indent=2)
-                    if len(result_str) > 4000:
-                        result_str = result_str[:4000] + "\n... (truncated)"
+                    result_str = _serialize_tool_result(result)
 
                     messages.append({
                         "role": "tool",
-                        "tool_call_id": tc.id,
+                        "tool_call_id": tc["id"],
                         "content": result_str,
                     })
                 continue  # Loop back to let LLM process tool results
@@ -895,9 +1110,50 @@ _TOOL_STATUS = {
     "fetch_url": "Reading webpage",
 }
 
+# Complete tool_status SSE frames for the known tools, encoded once
+_TOOL_STATUS_SSE: dict[str, bytes] = {
+    name: _sse_event("tool_status", {"tool": name, "status": status})
+    for name, status in _TOOL_STATUS.items()
+}
+
+
+def _tool_status_frame(func_name: str) -> bytes:
+    return _TOOL_STATUS_SSE.get(func_name) or _sse_event(
+        "tool_status", {"tool": func_name, "status": f"Using {func_name}"}
+    )
+
+
+# Rendered USER CONTEXT profile blocks: user_id -> (version_key, context string).
+# The profile changes rarely, so most chat turns reuse the cached string.
+_user_ctx_cache: dict[int, tuple[tuple, str]] = {}
+_USER_CTX_CACHE_MAX = 1000
+
 
 def _build_user_context(user: dict, profile: dict | None, default_resume: dict | None, memories_text: str = "") -> str:
     """Build user context string for system prompt injection."""
+    version_key = (user.get("name"), profile.get("updated_at") if profile else None)
+    cached = _user_ctx_cache.get(user["id"])
+    if cached and cached[0] == version_key:
+        result = cached[1]
+    else:
+        result = _render_user_context(user, profile)
+        if len(_user_ctx_cache) >= _USER_CTX_CACHE_MAX:
+            _user_ctx_cache.pop(next(iter(_user_ctx_cache)))
+        _user_ctx_cache[user["id"]] = (version_key, result)
+    if default_resume:
+        result = (result or "\n\nUSER CONTEXT:") + _resume_context(default_resume)
+    if memories_text:
+        result += f"\n\n{memories_text}"
+    return result
+
+
+def _resume_context(default_resume: dict) -> str:
+    """Format the resume preview portion of the user context."""
+    return f"\n\nResume on file ({default_resume['name']}):\n{default_resume['content'][:2000]}"
+
+
+def _render_user_context(user: dict, profile: dict | None) -> str:
+    """Format the profile portion of the user context."""
     parts = []
     if user.get("name"):
         parts.append(f"Name: {user['name']}")
@@ -911,114 +1167,117 @@ def _build_user_context(user: dict, profile: dict | None, default_resume: dict |
             parts.append(f"Skills: {skills_str}")
         if profile.get("location"):
             parts.append(f"Location: {profile['location']}")
-    if default_resume:
-        resume_preview = default_resume["content"][:2000]
-        parts.append(f"\nResume on file ({default_resume['name']}):\n{resume_preview}")
-    result = ""
-    if parts:
-        result = "\n\nUSER CONTEXT:\n" + "\n".join(parts)
-    if memories_text:
-        result += f"\n\n{memories_text}"
-    return result
+    if not parts:
+        return ""
+    return "\n\nUSER CONTEXT:\n" + "\n".join(parts)
+
 
+async def _generate_direct_llm(client, messages, tool_specs):
+    """Generator for direct LLM path with tool calling (general chat).
 
-def _generate_direct_llm(client, messages, tool_specs):
-    """Generator for direct LLM path with tool calling (general chat)."""
+    Each round is a single streaming request with tools enabled: content
+    deltas go straight to the user, while tool-call deltas are accumulated
+    and executed before the next round.
+    """
     full_response = ""
 
     for _round in range(MAX_TOOL_ROUNDS + 1):
         is_last_round = _round >= MAX_TOOL_ROUNDS
 
-        completion = client.chat.completions.create(
+        stream = await client.chat.completions.create(
             model=os.getenv("LLM_MODEL", "llama-3.3-70b-versatile"),
             messages=messages,
             tools=tool_specs if not is_last_round else None,
             tool_choice="auto" if not is_last_round else None,
             max_tokens=1024,
             temperature=0.6,
-            stream=False,
+            stream=True,
         )
 
-        message = completion.choices[0].message
-
-        if message.tool_calls:
-            messages.append({
-                "role": "assistant",
-                "content": message.content,
-                "tool_calls": [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.function.name,
-                            "arguments": tc.function.arguments,
-                        },
-                    }
-                    for tc in message.tool_calls
-                ],
-            })
+        round_content = ""
+        pending_calls: dict[int, dict] = {}  # stream index -> OpenAI tool_call dict
+        buffer = _DeltaBuffer()
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                round_content += delta.content
+                if text := buffer.add(delta.content):
+                    yield ("content", {"text": text})
+            for tc_delta in delta.tool_calls or []:
+                call = pending_calls.setdefault(tc_delta.index, {
+                    "id": "",
+                    "type": "function",
+                    "function": {"name": "", "arguments": ""},
+                })
+                if tc_delta.id:
+                    call["id"] = tc_delta.id
+                if tc_delta.function:
+                    if tc_delta.function.name:
+                        call["function"]["name"] += tc_delta.function.name
+                    if tc_delta.function.arguments:
+                        call["function"]["arguments"] += tc_delta.function.arguments
+        if text := buffer.flush():
+            yield ("content", {"text": text})
+        full_response += round_content
+
+        if not pending_calls:
+            break
 
-            for tc in message.tool_calls:
-                func_name = tc.function.name
-                status = _TOOL_STATUS.get(func_name, f"Using {func_name}")
-                yield ("tool_status", {"tool": func_name, "status": status})
+        tool_calls = [pending_calls[i] for i in sorted(pending_calls)]
+        messages.append({
+            "role": "assistant",
+            "content": round_content or None,
+            "tool_calls": tool_calls,
+        })
 
-                try:
-                    func_args = json.loads(tc.function.arguments)
-                except json.JSONDecodeError:
-                    func_args = {}
+        for tc in tool_calls:
+            yield ("_frame", _tool_status_frame(tc["function"]["name"]))
 
-                result = _execute_tool_call(func_name, func_args)
-                result_str = json.dumps(result, indent=2)
-                if len(result_str) > 4000:
-                    result_str = result_str[:4000] + "\n... (truncated)"
+        # Tools are I/O-bound; run this turn's calls concurrently
+        results = await asyncio.gather(*(
+            asyncio.to_thread(_run_tool_call, tc) for tc in tool_calls
+        ))
 
-                messages.append({
-                    "role": "tool",
-                    "tool_call_id": tc.id,
-                    "content": result_str,
-                })
-            continue
-
-        # Final response — stream it
-        stream = client.chat.completions.create(
-            model=os.getenv("LLM_MODEL", "llama-3.3-70b-versatile"),
-            messages=messages,
-            max_tokens=1024,
-            temperature=0.6,
-            stream=True,
-        )
-        full_response = ""
-        for chunk in stream:
-            delta = chunk.choices[0].delta
-            if delta.content:
-                full_response += delta.content
-                yield ("content", {"text": delta.content})
-        break
+        for tc, result in zip(tool_calls, results):
+            messages.append({
+                "role": "tool",
+                "tool_call_id": tc["id"],
+                "content": _serialize_tool_result(result),
+            })
 
     yield ("_final", full_response)
 
 
-def _generate_agent_dispatch(client, messages, routing, user_message, resume_text, profile, user_id=None, conversation_id=None, cancel_check=None):
+async def _generate_agent_dispatch(client, messages, routing, user_message, resume_text, profile, user_id=None, conversation_id=None, cancel_check=None):
     """Generator for agent-dispatched path. Uses orchestrator with message bus, evaluator, and structured communication."""
+    from .agents.orchestrator import Orchestrator
+
     orchestrator = Orchestrator(provider=os.getenv("LLM_PROVIDER", "groq"))
 
-    # Collect events from orchestrator callbacks
-    events = []
+    # Orchestrator callbacks fire on the dispatch worker thread; hand their
+    # events to the event loop through a queue so they stream out live.
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+
+    def emit(evt):
+        loop.call_soon_threadsafe(events.put_nowait, evt)
 
     def on_status(agent_name, status):
         friendly = _AGENT_STATUS.get(agent_name, f"Running {agent_name} agent")
         msg = friendly if status == "running" else f"{agent_name.capitalize()} {'done' if status == 'complete' else 'failed'}"
-        events.append(("agent_status", {"agent": agent_name, "status": status, "message": msg}))
+        emit(("agent_status", {"agent": agent_name, "status": status, "message": msg}))
 
     def on_thought(agent_name, thought, tool_name):
-        events.append(("agent_reasoning", {"agent": agent_name, "thought": thought[:300], "tool": tool_name}))
+        emit(("agent_reasoning", {"agent": agent_name, "thought": thought[:300], "tool": tool_name}))
 
     def on_evaluator(decision):
-        events.append(("evaluator", decision))
+        emit(("evaluator", decision))
 
-    # Dispatch with structured communication
-    results = orchestrator.dispatch(
+    # Dispatch with structured communication (sync agents run in a worker thread)
+    dispatch = asyncio.ensure_future(asyncio.to_thread(
+        orchestrator.dispatch,
         routing=routing,
         user_message=user_message,
         resume_text=resume_text,
@@ -1029,11 +1288,13 @@ def _generate_agent_dispatch(client, messages, routing, user_message, resume_tex
         cancel_check=cancel_check,
         on_agent_thought=on_thought,
         on_evaluator=on_evaluator,
-    )
+    ))
+    # Runs after every callback already queued by the worker thread
+    dispatch.add_done_callback(lambda _: events.put_nowait(None))
 
-    # Yield all collected events
-    for evt in events:
+    while (evt := await events.get()) is not None:
         yield evt
+    results = dispatch.result()
 
     # Emit trace IDs for feedback UI
     trace_ids = [r.trace_id for r in results if r.trace_id is not None]
@@ -1047,12 +1308,13 @@ def _generate_agent_dispatch(client, messages, routing, user_message, resume_tex
         yield ("_final", partial)
         return
 
-    # Build synthesis prompt with agent outputs
-    agent_context = ""
-    for r in results:
-        if r.success:
-            output_preview = r.output[:3000]
-            agent_context += f"\n\n[{r.agent_name.upper()} AGENT RESULTS]\n{output_preview}\n"
+    # Build synthesis prompt with agent outputs, each within the same
+    # ~4 chars/token budget used for history and tool results
+    max_chars = MAX_AGENT_OUTPUT_TOKENS * 4
+    agent_context = "".join(
+        f"\n\n[{r.agent_name.upper()} AGENT RESULTS]\n{r.output[:max_chars]}\n"
+        for r in results if r.success
+    )
 
     if agent_context:
         messages.append({
@@ -1065,7 +1327,7 @@ def _generate_agent_dispatch(client, messages, routing, user_message, resume_tex
         })
 
     # Stream the final synthesized response
-    stream = client.chat.completions.create(
+    stream = await client.chat.completions.create(
         model=os.getenv("LLM_MODEL", "llama-3.3-70b-versatile"),
         messages=messages,
         max_tokens=2048,
@@ -1073,17 +1335,41 @@ def _generate_agent_dispatch(client, messages, routing, user_message, resume_tex
         stream=True,
     )
     full_response = ""
-    for chunk in stream:
+    buffer = _DeltaBuffer()
+    async for chunk in stream:
         delta = chunk.choices[0].delta
         if delta.content:
             full_response += delta.content
-            yield ("content", {"text": delta.content})
+            if text := buffer.add(delta.content):
+                yield ("content", {"text": text})
+    if text := buffer.flush():
+        yield ("content", {"text": text})
 
     yield ("_final", full_response)
 
 
+_NO_CLIENT_FRAME = _sse_event("content", {"text": "AI backend not configured. Set LLM_PROVIDER=ollama for local inference or GROQ_API_KEY for cloud."})
+
+
+_RESUME_KEYWORDS = ("resume", "cv", "experience", "skills", "background", "qualification")
+
+
+def _needs_resume_context(routing: RoutingDecision, req: ChatRequest) -> bool:
+    """Whether this turn's messages should include the resume preview."""
+    if routing.intent != "general_chat" or req.file_content:
+        return True
+    message = req.message.lower()
+    return any(keyword in message for keyword in _RESUME_KEYWORDS)
+
+
+async def _no_client_stream(conversation_id: int):
+    """SSE stream returned when no LLM backend is configured."""
+    yield _NO_CLIENT_FRAME
+    yield _sse_event("done", {"conversation_id": conversation_id})
+
+
 @app.post("/api/chat/stream")
-def chat_stream(req: ChatRequest, user: dict = Depends(get_current_user)):
+async def chat_stream(req: ChatRequest, user: dict = Depends(get_current_user)):
     """Streaming chat endpoint using Server-Sent Events.
 
     Flow:
@@ -1095,30 +1381,58 @@ def chat_stream(req: ChatRequest, user: dict = Depends(get_current_user)):
 
     if conversation_id is None:
         title = _truncate_title(req.message)
-        conversation_id = db.create_conversation(title, user_id=user["id"])
+        conversation_id = await asyncio.to_thread(db.create_conversation, title, user_id=user["id"])
     else:
-        conv = db.get_conversation_for_user(conversation_id, user["id"])
+        conv = await asyncio.to_thread(db.get_conversation_for_user, conversation_id, user["id"])
         if not conv:
             raise HTTPException(status_code=404, detail="Conversation not found")
 
-    db.save_chat_message("user", req.message, conversation_id)
+    await asyncio.to_thread(db.save_chat_message, "user", req.message, conversation_id)
 
-    # Gather user context
-    profile = db.get_profile(user["id"])
-    default_resume = db.get_default_resume(user["id"])
+    # Without an LLM backend none of the context below would be used
+    client = _get_async_llm_client()
+    if not client:
+        return StreamingResponse(_no_client_stream(conversation_id), media_type="text/event-stream")
+
+    # Gather user context, episodic memories, history and the routing decision
+    # concurrently. Routing only waits on the (fast) profile/resume lookups.
+    from .episodic_memory import EpisodicMemory
 
-    # Retrieve episodic memories
     memory = EpisodicMemory(user["id"])
-    memories_text = memory.recall_as_context(limit=10)
+    profile_task = asyncio.create_task(asyncio.to_thread(db.get_profile, user["id"]))
+    resume_task = asyncio.create_task(asyncio.to_thread(db.get_default_resume, user["id"]))
+
+    async def route_message():
+        profile, default_resume = await asyncio.gather(profile_task, resume_task)
+        return await asyncio.to_thread(
+            _agent_router.route,
+            req.message,
+            has_resume=default_resume is not None,
+            has_profile=profile is not None,
+        )
 
-    # Build system prompt
-    system_content = SYSTEM_PROMPT + _build_user_context(user, profile, default_resume, memories_text)
+    profile, default_resume, memories_text, history, routing = await asyncio.gather(
+        profile_task,
+        resume_task,
+        asyncio.to_thread(memory.recall_as_context, limit=10),
+        asyncio.to_thread(_load_chat_history, conversation_id),
+        route_message(),
+    )
+
+    # Build system prompt. It only changes when the profile does, so the
+    # system + history prefix stays byte-identical between turns and the
+    # provider's prompt (prefix) cache can reuse it. The resume preview (most
+    # of the prefill, skipped on casual turns) and memories (recalled fresh
+    # each turn) vary per turn, so they go after the history instead.
+    system_content = SYSTEM_PROMPT + _build_user_context(user, profile, None)
 
     # Build conversation messages
-    history = db.get_chat_history(conversation_id, limit=20)
     messages = [{"role": "system", "content": system_content}]
-    for msg in history[:-1]:
-        messages.append({"role": msg["role"], "content": msg["content"]})
+    messages.extend(_history_messages(history[:-1]))
+    if default_resume and _needs_resume_context(routing, req):
+        messages.append({"role": "system", "content": _resume_context(default_resume).lstrip()})
+    if memories_text:
+        messages.append({"role": "system", "content": memories_text})
 
     user_content = req.message
     if req.file_content:
@@ -1127,35 +1441,20 @@ def chat_stream(req: ChatRequest, user: dict = Depends(get_current_user)):
         user_content = f"{req.message}\n\n[Attached file: {file_label}]\n---\n{truncated}\n---"
     messages.append({"role": "user", "content": user_content})
 
-    client = _get_llm_client()
-
-    # Route the message
-    routing = _agent_router.route(
-        req.message,
-        has_resume=default_resume is not None,
-        has_profile=profile is not None,
-    )
-
     resume_text = default_resume["content"] if default_resume else ""
 
-    def generate():
+    async def generate():
         nonlocal conversation_id
-        if not client:
-            yield f"data: {json.dumps({'type': 'content', 'text': 'AI backend not configured. Set LLM_PROVIDER=ollama for local inference or GROQ_API_KEY for cloud.'})}\n\n"
-            yield f"data: {json.dumps({'type': 'done', 'conversation_id': conversation_id})}\n\n"
-            return
-
         # Register for cancellation
-        _active_dispatches[conversation_id] = {"cancel_requested": False}
+        await asyncio.to_thread(_active_dispatches.start, conversation_id)
 
         def dispatch_cancel_check():
-            state = _active_dispatches.get(conversation_id, {})
-            return state.get("cancel_requested", False)
+            return _active_dispatches.is_cancelled(conversation_id)
 
-        yield f"data: {json.dumps({'type': 'conversation_id', 'conversation_id': conversation_id})}\n\n"
+        yield _sse_event("conversation_id", {"conversation_id": conversation_id})
 
         # Emit routing decision to frontend
-        yield f"data: {json.dumps({'type': 'routing', 'intent': routing.intent, 'agents': routing.agents})}\n\n"
+        yield _sse_event("routing", {"intent": routing.intent, "agents": routing.agents})
 
         full_response = ""
 
@@ -1165,21 +1464,20 @@ def chat_stream(req: ChatRequest, user: dict = Depends(get_current_user)):
 
             if routing.intent == "general_chat" or not routing.agents:
                 # Direct LLM path with tool calling
-                gen = _generate_direct_llm(client, messages, CHAT_REGISTRY.to_openai_specs())
+                gen = _generate_direct_llm(client, messages, _get_chat_tool_specs())
             elif routing.intent == "multi_step":
                 # Create a goal plan and execute the first step
                 try:
-                    plan = _goal_planner.create_plan(req.message, _build_user_context(user, profile, default_resume, ""))
-                    goal_id = _goal_planner.save_plan(user["id"], plan)
+                    planner = _get_goal_planner()
+                    plan = await asyncio.to_thread(planner.create_plan, req.message, _build_user_context(user, profile, default_resume, ""))
+                    goal_id = await asyncio.to_thread(planner.save_plan, user["id"], plan)
                     plan_title = plan["title"]
                     plan_step_count = len(plan["steps"])
-                    status_data = json.dumps({
-                        "type": "agent_status",
+                    multi_step_prefix_events.append(_sse_event("agent_status", {
                         "agent": "planner",
                         "status": "complete",
                         "message": f"Created plan: {plan_title} ({plan_step_count} steps)",
-                    })
-                    multi_step_prefix_events.append(f"data: {status_data}\n\n")
+                    }))
 
                     first_step = plan["steps"][0] if plan["steps"] else None
                     if first_step:
@@ -1202,7 +1500,7 @@ def chat_stream(req: ChatRequest, user: dict = Depends(get_current_user)):
                             cancel_check=dispatch_cancel_check,
                         )
                     else:
-                        gen = _generate_direct_llm(client, messages, CHAT_REGISTRY.to_openai_specs())
+                        gen = _generate_direct_llm(client, messages, _get_chat_tool_specs())
                 except Exception:
                     gen = _generate_agent_dispatch(
                         client, messages, routing, req.message, resume_text, profile,
@@ -1221,36 +1519,26 @@ def chat_stream(req: ChatRequest, user: dict = Depends(get_current_user)):
             for evt in multi_step_prefix_events:
                 yield evt
 
-            for event_type, event_data in gen:
+            async for event_type, event_data in gen:
                 if event_type == "_final":
                     full_response = event_data
-                elif event_type == "tool_status":
-                    yield f"data: {json.dumps({'type': 'tool_status', **event_data})}\n\n"
-                elif event_type == "agent_status":
-                    yield f"data: {json.dumps({'type': 'agent_status', **event_data})}\n\n"
-                elif event_type == "evaluator":
-                    yield f"data: {json.dumps({'type': 'evaluator', **event_data})}\n\n"
-                elif event_type == "agent_reasoning":
-                    yield f"data: {json.dumps({'type': 'agent_reasoning', **event_data})}\n\n"
-                elif event_type == "trace_ids":
-                    yield f"data: {json.dumps({'type': 'trace_ids', **event_data})}\n\n"
-                elif event_type == "negotiation_round":
-                    yield f"data: {json.dumps({'type': 'negotiation_round', **event_data})}\n\n"
-                elif event_type == "negotiation_result":
-                    yield f"data: {json.dumps({'type': 'negotiation_result', **event_data})}\n\n"
-                elif event_type == "content":
-                    yield f"data: {json.dumps({'type': 'content', **event_data})}\n\n"
+                elif event_type == "_frame":
+                    yield event_data  # already-encoded SSE bytes
+                elif event_type in _SSE_PREFIXES:
+                    yield _sse_event(event_type, event_data)
 
         except Exception as e:
             full_response = f"Something went wrong — {str(e)[:200]}. Mind trying again?"
-            yield f"data: {json.dumps({'type': 'content', 'text': full_response})}\n\n"
+            yield _sse_event("content", {"text": full_response})
 
         full_response = _clean_response(full_response)
-        db.save_chat_message("assistant", full_response, conversation_id)
-        yield f"data: {json.dumps({'type': 'done', 'conversation_id': conversation_id})}\n\n"
+        # Stored before `done`: the next turn may be served by another
+        # worker and must find this reply in the history
+        await asyncio.to_thread(db.save_chat_message, "assistant", full_response, conversation_id)
+        yield _sse_event("done", {"conversation_id": conversation_id})
 
         # Clean up active dispatch tracking
-        _active_dispatches.pop(conversation_id, None)
+        await asyncio.to_thread(_active_dispatches.finish, conversation_id)
 
     return StreamingResponse(generate(), media_type="text/event-stream")
 
@@ -1262,9 +1550,7 @@ def cancel_chat(conv_id: int, user: dict = Depends(get_current_user)):
     if not conv:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    state = _active_dispatches.get(conv_id)
-    if state:
-        state["cancel_requested"] = True
+    if _active_dispatches.request_cancel(conv_id):
         return {"message": "Cancel requested"}
     return {"message": "No active dispatch found"}
 
@@ -1314,7 +1600,12 @@ def mark_all_read(user: dict = Depends(get_current_user)):
 
 # --- Goals ---
 
-_goal_planner = GoalPlanner()
+@cache
+def _get_goal_planner():
+    """Create the shared GoalPlanner on first use (pulls in the agent stack)."""
+    from .agents.planner import GoalPlanner
+
+    return GoalPlanner()
 
 
 @app.post("/api/goals")
@@ -1334,8 +1625,8 @@ def create_goal(req: CreateGoalRequest, user: dict = Depends(get_current_user)):
             parts.append(f"Experience: {profile['experience_level']}")
         user_context = "User context:\n" + "\n".join(parts)
 
-    plan = _goal_planner.create_plan(req.goal_text, user_context)
-    goal_id = _goal_planner.save_plan(user["id"], plan)
+    plan = _get_goal_planner().create_plan(req.goal_text, user_context)
+    goal_id = _get_goal_planner().save_plan(user["id"], plan)
 
     return {
         "goal_id": goal_id,
@@ -1348,9 +1639,10 @@ def create_goal(req: CreateGoalRequest, user: dict = Depends(get_current_user)):
 def list_goals(status: str | None = None, user: dict = Depends(get_current_user)):
     """List user's goals with progress."""
     goals = db.get_goals(user["id"], status=status)
+    steps_by_goal = db.get_goal_steps_many([g["id"] for g in goals])
     result = []
     for g in goals:
-        steps = db.get_goal_steps(g["id"])
+        steps = steps_by_goal[g["id"]]
         completed = sum(1 for s in steps if s["status"] == "completed")
         result.append({
             **g,
@@ -1364,7 +1656,7 @@ def list_goals(status: str | None = None, user: dict = Depends(get_current_user)
 @app.get("/api/goals/{goal_id}")
 def get_goal_detail(goal_id: int, user: dict = Depends(get_current_user)):
     """Get goal detail with steps."""
-    status = _goal_planner.get_plan_status(goal_id, user["id"])
+    status = _get_goal_planner().get_plan_status(goal_id, user["id"])
     if not status:
         raise HTTPException(status_code=404, detail="Goal not found")
     return status
@@ -1381,7 +1673,7 @@ def execute_next_goal_step(goal_id: int, user: dict = Depends(get_current_user))
     default_resume = db.get_default_resume(user["id"])
     resume_text = default_resume["content"] if default_resume else ""
 
-    result = _goal_planner.execute_next_step(
+    result = _get_goal_planner().execute_next_step(
         goal_id=goal_id,
         user_id=user["id"],
         resume_text=resume_text,
@@ -1395,7 +1687,7 @@ def execute_next_goal_step(goal_id: int, user: dict = Depends(get_current_user))
 
 
 # Active goal auto-executions (for cancellation)
-_active_goal_executions: dict[int, dict] = {}  # goal_id -> {"cancel_requested": False}
+_active_goal_executions = CancelFlags("goal", ttl=3600)
 
 
 @app.post("/api/goals/{goal_id}/auto-execute")
@@ -1410,24 +1702,23 @@ def auto_execute_goal(goal_id: int, user: dict = Depends(get_current_user)):
     resume_text = default_resume["content"] if default_resume else ""
 
     # Register for cancellation
-    _active_goal_executions[goal_id] = {"cancel_requested": False}
+    _active_goal_executions.start(goal_id)
 
     def cancel_check():
-        state = _active_goal_executions.get(goal_id, {})
-        return state.get("cancel_requested", False)
+        return _active_goal_executions.is_cancelled(goal_id)
 
     def generate():
         try:
-            for event_type, event_data in _goal_planner.auto_execute(
+            for event_type, event_data in _get_goal_planner().auto_execute(
                 goal_id=goal_id,
                 user_id=user["id"],
                 resume_text=resume_text,
                 profile=profile,
                 cancel_check=cancel_check,
             ):
-                yield f"data: {json.dumps({'type': event_type, **event_data})}\n\n"
+                yield _sse_event(event_type, event_data)
         finally:
-            _active_goal_executions.pop(goal_id, None)
+            _active_goal_executions.finish(goal_id)
 
     return StreamingResponse(generate(), media_type="text/event-stream")
 
@@ -1439,9 +1730,7 @@ def cancel_goal_execution(goal_id: int, user: dict = Depends(get_current_user)):
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
 
-    state = _active_goal_executions.get(goal_id)
-    if state:
-        state["cancel_requested"] = True
+    if _active_goal_executions.request_cancel(goal_id):
         return {"message": "Cancel requested"}
     return {"message": "No active execution found"}
 
@@ -1472,9 +1761,7 @@ async def websocket_endpoint(ws: WebSocket):
         return
 
     # Re-register with manager (authenticate_ws already accepted)
-    if user_id not in ws_manager._connections:
-        ws_manager._connections[user_id] = []
-    ws_manager._connections[user_id].append(ws)
+    ws_manager._connections.setdefault(user_id, set()).add(ws)
 
     try:
         while True:
@@ -1488,9 +1775,7 @@ async def websocket_endpoint(ws: WebSocket):
                 elif msg_type == "cancel" and msg.get("conversation_id"):
                     # Cancel active dispatch via WebSocket
                     conv_id = msg["conversation_id"]
-                    state = _active_dispatches.get(conv_id)
-                    if state:
-                        state["cancel_requested"] = True
+                    if await asyncio.to_thread(_active_dispatches.request_cancel, conv_id):
                         await ws.send_json({"type": "cancel_ack", "conversation_id": conv_id})
             except json.JSONDecodeError:
                 pass
@@ -1526,6 +1811,7 @@ def launch_task(req: LaunchTaskRequest, user: dict = Depends(get_current_user)):
                 user_id=user["id"],
                 company_name=company,
                 task_db_id=task_db_id,
+                refresh=bool(req.config.get("refresh")),
             )
             celery_task_id = result.id
         elif req.task_type == "job_monitor":
@@ -8,63 +8,38 @@ import json
 
 from ..celery_app import celery_app
 from .. import database as db
-from .base_task import AutonomousTask
+from .base_task import SingletonTask
 
 
-@celery_app.task(base=AutonomousTask, bind=True, name="src.tasks.app_tracker.track_all_applications")
+@celery_app.task(base=SingletonTask, bind=True, name="src.tasks.app_tracker.track_all_applications")
 def track_all_applications(self):
     """Check application status for all users."""
-    conn = db.get_db()
-    users = conn.execute(
-        "SELECT DISTINCT user_id FROM applications WHERE user_id IS NOT NULL AND status = 'applied'"
-    ).fetchall()
-    conn.close()
+    user_ids = db.iter_batched_ids(
+        "SELECT DISTINCT user_id FROM applications WHERE status = 'applied' "
+        "AND user_id > ? ORDER BY user_id LIMIT ?"
+    )
 
-    results = []
-    for row in users:
-        user_id = row["user_id"]
-        try:
-            result = _check_user_applications(user_id)
-            results.append(result)
-            self.checkpoint({"completed_users": [r["user_id"] for r in results]})
-        except Exception as e:
-            results.append({"user_id": user_id, "error": str(e)})
-
-    return {"users_checked": len(results), "results": results}
+    return self.scan_users(user_ids, _check_user_applications, count_key="users_checked")
 
 
 def _check_user_applications(user_id: int) -> dict:
     """Check for stale applications and create reminders."""
     from datetime import datetime, timedelta
 
-    apps = db.get_applications(user_id=user_id, status="applied")
-    now = datetime.now()
-    cutoff = (now - timedelta(days=7)).isoformat()
-
-    stale_count = 0
-    for app in apps:
-        updated_at = app.get("updated_at", "")
-        if updated_at < cutoff:
-            app_id = app.get("id")
-            title = app.get("title", "Unknown")
-            company = app.get("company", "Unknown")
+    cutoff = (datetime.now() - timedelta(days=7)).isoformat()
 
-            # Deduplicate: check for existing unread notification
-            conn = db.get_db()
-            existing = conn.execute(
-                "SELECT id FROM notifications WHERE user_id = ? AND type = 'application_followup' AND data LIKE ? AND read = 0",
-                (user_id, f'%"application_id": {app_id}%'),
-            ).fetchone()
-            conn.close()
+    # Only stale apps without an unread follow-up reminder come back
+    stale_apps = db.get_stale_applications_without_followup(user_id, stale_before=cutoff)
 
-            if not existing:
-                db.create_notification(
-                    user_id=user_id,
-                    type="application_followup",
-                    title="Follow up on application",
-                    message=f'Your application for "{title}" at {company} has been pending for over a week. Consider following up.',
-                    data=json.dumps({"application_id": app_id}),
-                )
-                stale_count += 1
+    # One connection and transaction for all of this user's reminders
+    db.create_notifications(user_id, [
+        {
+            "type": "application_followup",
+            "title": "Follow up on application",
+            "message": f'Your application for "{app.get("title", "Unknown")}" at {app.get("company", "Unknown")} has been pending for over a week. Consider following up.',
+            "data": json.dumps({"application_id": app["id"]}),
+        }
+        for app in stale_apps
+    ])
 
-    return {"user_id": user_id, "stale_reminders": stale_count}
+    return {"user_id": user_id, "stale_reminders": len(stale_apps)}
@@ -1,19 +1,77 @@
 """Base class for autonomous tasks with checkpointing and crash recovery."""
 
 import json
+import queue
+import threading
+import time
+import uuid
+from collections import deque
 from datetime import datetime
+from typing import Any, Callable, Iterable
 
 from celery import Task
 
 from .. import database as db
 
+# Per-user errors kept in a periodic scan's result summary
+MAX_ERROR_SAMPLES = 20
+
+# Checkpoint writes are handed to a background writer so a task's loop never
+# waits on SQLite. Only the latest state per task is written; older pending
+# states for the same task are dropped.
+_checkpoint_queue: queue.Queue = queue.Queue()
+_checkpoint_thread: threading.Thread | None = None
+_checkpoint_thread_lock = threading.Lock()
+
+
+def _checkpoint_writer() -> None:
+    """Drain the checkpoint queue forever, coalescing updates per task."""
+    while True:
+        pending = dict([_checkpoint_queue.get()])
+        received = 1
+        while True:
+            try:
+                task_db_id, state = _checkpoint_queue.get_nowait()
+            except queue.Empty:
+                break
+            pending[task_db_id] = state
+            received += 1
+
+        for task_db_id, state in pending.items():
+            try:
+                db.update_autonomous_task(task_db_id, state=state, status="running")
+            except Exception:
+                pass
+        for _ in range(received):
+            _checkpoint_queue.task_done()
+
+
+def _enqueue_checkpoint(task_db_id: int, state: str) -> None:
+    """Queue a checkpoint write, starting the writer thread in this process if needed."""
+    global _checkpoint_thread
+    with _checkpoint_thread_lock:
+        # Also restarts the writer in forked worker children, where the
+        # parent's thread does not exist
+        if _checkpoint_thread is None or not _checkpoint_thread.is_alive():
+            _checkpoint_thread = threading.Thread(
+                target=_checkpoint_writer, name="checkpoint-writer", daemon=True
+            )
+            _checkpoint_thread.start()
+    _checkpoint_queue.put_nowait((task_db_id, state))
+
+
+def flush_checkpoints() -> None:
+    """Block until every queued checkpoint has been written."""
+    if _checkpoint_thread is not None and _checkpoint_thread.is_alive():
+        _checkpoint_queue.join()
+
 
 class AutonomousTask(Task):
     """Base Celery task with checkpoint/restore and failure handling.
 
     Subclasses implement run() and can call self.checkpoint() to save
-    intermediate progress. On crash/restart, self.restore() loads the
-    last checkpoint.
+    intermediate progress (at most once per checkpoint_interval unless
+    forced). On crash/restart, self.restore() loads the last checkpoint.
 
     Limits:
     - Max runtime: 1 hour per execution (enforced by Celery time_limit)
@@ -24,20 +82,60 @@ class AutonomousTask(Task):
     max_retries = 3
     _task_db_id: int | None = None
 
-    def checkpoint(self, state_dict: dict) -> None:
-        """Save intermediate progress to the database."""
+    # Minimum seconds between checkpoint writes; override per task
+    checkpoint_interval = 30.0
+    _last_checkpoint: tuple[int | None, float] = (None, 0.0)  # (task_db_id, monotonic time)
+
+    def checkpoint(self, state_dict: dict, force: bool = False) -> None:
+        """Save intermediate progress to the database.
+
+        Calls within checkpoint_interval of the last write for the same task
+        are skipped unless force=True, so per-item loops can checkpoint
+        freely. The state is serialized now but written by a background
+        thread, so the caller does not wait on the database.
+        """
         if self._task_db_id:
+            now = time.monotonic()
+            last_id, last_at = self._last_checkpoint
+            if not force and last_id == self._task_db_id and now - last_at < self.checkpoint_interval:
+                return
+            self._last_checkpoint = (self._task_db_id, now)
             try:
-                db.update_autonomous_task(
-                    self._task_db_id,
-                    state=json.dumps(state_dict),
-                    status="running",
-                )
+                _enqueue_checkpoint(self._task_db_id, json.dumps(state_dict))
             except Exception:
                 pass
 
+    def scan_users(self, user_ids: Iterable[int], scan: Callable[[int], Any], count_key: str = "users_scanned") -> dict:
+        """Run scan(user_id) for every user, checkpointing progress as it goes.
+
+        A failing user is counted and the scan moves on. The summary holds
+        counts plus a bounded sample of errors, so memory and the returned
+        summary stay the same size however many users are scanned.
+        """
+        successes = failures = 0
+        error_samples = deque(maxlen=MAX_ERROR_SAMPLES)
+        last_user_id = None
+        for user_id in user_ids:
+            try:
+                scan(user_id)
+                successes += 1
+            except Exception as e:
+                failures += 1
+                error_samples.append({"user_id": user_id, "error": str(e)})
+            last_user_id = user_id
+            self.checkpoint({"last_user_id": user_id, "successes": successes, "failures": failures})
+
+        self.checkpoint({"last_user_id": last_user_id, "successes": successes, "failures": failures}, force=True)
+        return {
+            count_key: successes + failures,
+            "successes": successes,
+            "failures": failures,
+            "errors": list(error_samples),
+        }
+
     def restore(self, task_db_id: int) -> dict | None:
         """Load last checkpoint state. Returns None if no checkpoint."""
+        flush_checkpoints()
         try:
             task = db.get_autonomous_task(task_db_id)
             if task and task.get("state"):
@@ -50,6 +148,7 @@ class AutonomousTask(Task):
         """Handle task failure — create notification and update status."""
         db_id = kwargs.get("task_db_id") or (args[0] if args else None)
         user_id = kwargs.get("user_id")
+        flush_checkpoints()  # a late "running" write must not overwrite the status
 
         if db_id:
             try:
@@ -71,6 +170,7 @@ class AutonomousTask(Task):
 
     def on_success(self, retval, task_id, args, kwargs):
         """Handle task completion — update status."""
+        flush_checkpoints()
         db_id = kwargs.get("task_db_id") or (args[0] if args else None)
         if db_id:
             try:
@@ -92,3 +192,53 @@ class AutonomousTask(Task):
         )
         self._task_db_id = task_db_id
         return task_db_id
+
+
+# Deletes the lock only if it still holds this run's token, so a run that
+# outlived its lock never releases the next run's lock
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class SingletonTask(AutonomousTask):
+    """AutonomousTask that runs at most one instance per task name at a time.
+
+    Periodic all-users scans are enqueued by Beat on a fixed schedule; if a
+    run overruns its interval, the next one is skipped instead of scanning
+    every user a second time in parallel. The lock lives in the Redis broker
+    and expires with the task time limit in case a worker dies holding it.
+    """
+
+    abstract = True
+    _lock_client = None
+
+    @property
+    def lock_client(self):
+        if SingletonTask._lock_client is None:
+            import redis
+            from ..celery_app import REDIS_URL
+            SingletonTask._lock_client = redis.Redis.from_url(REDIS_URL)
+        return SingletonTask._lock_client
+
+    def __call__(self, *args, **kwargs):
+        key = f"task_lock:{self.name}"
+        token = uuid.uuid4().hex
+        expiry = self.time_limit or self.app.conf.task_time_limit or 3600
+        try:
+            acquired = self.lock_client.set(key, token, nx=True, ex=expiry)
+        except Exception:
+            # Lock store unreachable: run unguarded rather than not at all
+            return super().__call__(*args, **kwargs)
+        if not acquired:
+            return {"skipped": True, "reason": "previous run still in progress"}
+        try:
+            return super().__call__(*args, **kwargs)
+        finally:
+            try:
+                self.lock_client.eval(_RELEASE_LOCK_SCRIPT, 1, key, token)
+            except Exception:
+                pass
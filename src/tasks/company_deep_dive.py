@@ -10,10 +10,16 @@ from ..celery_app import celery_app
 from .. import database as db
 from .base_task import AutonomousTask
 
+RESEARCH_CACHE_HOURS = 24
+
 
 @celery_app.task(base=AutonomousTask, bind=True, name="src.tasks.company_deep_dive.research_company")
-def research_company(self, user_id: int, company_name: str, task_db_id: int | None = None):
-    """Run deep research on a company and create a detailed report."""
+def research_company(self, user_id: int, company_name: str, task_db_id: int | None = None, refresh: bool = False):
+    """Run deep research on a company and create a detailed report.
+
+    Research fetched within the last RESEARCH_CACHE_HOURS is reused unless
+    `refresh` is set, so repeated requests for one company skip the fetch.
+    """
     self._task_db_id = task_db_id
 
     # Restore checkpoint if resuming
@@ -30,15 +36,22 @@ def research_company(self, user_id: int, company_name: str, task_db_id: int | No
     if state:
         result = state.get("result", result)
 
-    # Research the company
-    try:
-        from ..tools.company_researcher import CompanyResearcherTool
-        tool = CompanyResearcherTool()
-        research = tool.execute(company_name=company_name)
-        result["sections"]["overview"] = research
-        self.checkpoint({"result": result, "phase": "overview_done"})
-    except Exception as e:
-        result["sections"]["overview"] = {"error": str(e)}
+    # Research the company, reusing a recent fetch when there is one
+    if "overview" not in result["sections"]:
+        cached = None if refresh else db.get_company_research(company_name, max_age_hours=RESEARCH_CACHE_HOURS)
+        if cached is not None:
+            result["sections"]["overview"] = cached
+        else:
+            try:
+                from ..tools.company_researcher import CompanyResearcherTool
+                tool = CompanyResearcherTool()
+                research = tool.execute(query=company_name)
+                result["sections"]["overview"] = research
+                if research.get("success"):
+                    db.save_company_research(company_name, research)
+                self.checkpoint({"result": result, "phase": "overview_done"})
+            except Exception as e:
+                result["sections"]["overview"] = {"error": str(e)}
 
     # Store result
     if task_db_id:
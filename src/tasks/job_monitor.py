@@ -1,38 +1,25 @@
 """Job monitor task — scans job boards for new postings matching user criteria.
 
 Periodic Celery task that runs the Scout agent per user with saved search queries.
-Checkpoints after each user to survive crashes.
+Checkpoints its progress periodically to survive crashes.
 """
 
 import json
 
 from ..celery_app import celery_app
 from .. import database as db
-from .base_task import AutonomousTask
+from .base_task import SingletonTask
 
 
-@celery_app.task(base=AutonomousTask, bind=True, name="src.tasks.job_monitor.monitor_jobs_for_all_users")
+@celery_app.task(base=SingletonTask, bind=True, name="src.tasks.job_monitor.monitor_jobs_for_all_users")
 def monitor_jobs_for_all_users(self):
     """Scan for new jobs for all users with profiles and saved jobs."""
-    conn = db.get_db()
-    users = conn.execute(
-        "SELECT DISTINCT u.id FROM users u "
-        "JOIN user_profiles up ON up.user_id = u.id "
-        "WHERE up.target_role != ''"
-    ).fetchall()
-    conn.close()
+    user_ids = db.iter_batched_ids(
+        "SELECT user_id FROM user_profiles "
+        "WHERE target_role != '' AND user_id > ? ORDER BY user_id LIMIT ?"
+    )
 
-    results = []
-    for row in users:
-        user_id = row["id"]
-        try:
-            result = _scan_for_user(user_id)
-            results.append(result)
-            self.checkpoint({"completed_users": [r["user_id"] for r in results]})
-        except Exception as e:
-            results.append({"user_id": user_id, "error": str(e)})
-
-    return {"users_scanned": len(results), "results": results}
+    return self.scan_users(user_ids, _scan_for_user)
 
 
 def _scan_for_user(user_id: int) -> dict:
@@ -65,13 +52,8 @@ def _scan_for_user(user_id: int) -> dict:
         return {"user_id": user_id, "new_jobs": 0}
 
     # Check which jobs are new (not already saved)
-    existing_urls = set()
-    saved = db.get_jobs(user_id=user_id, limit=100)
-    for j in saved:
-        if j.get("url"):
-            existing_urls.add(j["url"])
-
-    new_jobs = [j for j in jobs if j.get("url") and j["url"] not in existing_urls]
+    new_urls = db.filter_new_job_urls(user_id, [j.get("url") for j in jobs])
+    new_jobs = [j for j in jobs if j.get("url") in new_urls]
 
     if new_jobs:
         db.create_notification(
@@ -1,19 +1,36 @@
+from importlib import import_module
+
 from .base import Tool, ToolRegistry
-from .jd_parser import JDParserTool
-from .resume_analyzer import ResumeAnalyzerTool
-from .skills_matcher import SkillsMatcherTool
-from .ats_scorer import ATSScorerTool
-from .company_researcher import CompanyResearcherTool
-from .cover_letter import CoverLetterTool
-from .job_search import JobSearchTool
-from .interview_prep import InterviewPrepTool
-from .resume_rewriter import ResumeRewriterTool
-from .github_analyzer import GitHubAnalyzerTool
-from .salary_research import SalaryResearchTool
-from .email_drafter import EmailDrafterTool
-from .learning_path import LearningPathTool
-from .mock_interview import MockInterviewTool
-from .web_fetch import WebFetchTool
+
+# Concrete tools are resolved lazily (PEP 562) so importing ``src.tools.base``
+# does not drag in requests/bs4 for every tool module.
+_LAZY_TOOLS = {
+    "JDParserTool": ".jd_parser",
+    "ResumeAnalyzerTool": ".resume_analyzer",
+    "SkillsMatcherTool": ".skills_matcher",
+    "ATSScorerTool": ".ats_scorer",
+    "CompanyResearcherTool": ".company_researcher",
+    "CoverLetterTool": ".cover_letter",
+    "JobSearchTool": ".job_search",
+    "InterviewPrepTool": ".interview_prep",
+    "ResumeRewriterTool": ".resume_rewriter",
+    "GitHubAnalyzerTool": ".github_analyzer",
+    "SalaryResearchTool": ".salary_research",
+    "EmailDrafterTool": ".email_drafter",
+    "LearningPathTool": ".learning_path",
+    "MockInterviewTool": ".mock_interview",
+    "WebFetchTool": ".web_fetch",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_TOOLS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "Tool",
@@ -2,6 +2,7 @@ import re
 from typing import Any
 
 from .base import Tool
+from ..utils.phrase_match import find_phrases
 
 
 class ATSScorerTool(Tool):
@@ -26,53 +27,70 @@ class ATSScorerTool(Tool):
         "headers_as_caps": r"^[A-Z\s]{20,}$",
     }
 
-    @property
-    def name(self) -> str:
-        return "score_ats"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Score a resume against ATS (Applicant Tracking System) criteria. "
-            "Checks keyword match rate against a job description, section "
-            "completeness, formatting quality, and returns an overall ATS "
-            "compatibility score with specific improvement suggestions."
-        )
+    # Action verbs (strong resume language)
+    ACTION_VERBS = [
+        "built", "developed", "designed", "implemented", "led",
+        "created", "managed", "improved", "delivered", "launched",
+        "architected", "optimized", "automated", "integrated",
+    ]
 
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "resume_text": {
-                    "type": "string",
-                    "description": "The full text of the resume",
-                },
-                "jd_keywords": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Keywords extracted from the job description",
-                },
-                "required_skills": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Required skills from the job description",
-                    "default": [],
-                },
+    # Compiled once at class load rather than looked up per call
+    _FORMATTING_PATTERNS = {
+        issue_name: re.compile(pattern)
+        for issue_name, pattern in FORMATTING_PENALTIES.items()
+    }
+    # Character sets equivalent to the single-class penalty patterns above;
+    # testing them against set(resume) replaces a regex pass per class
+    _PENALTY_CHAR_SETS = {
+        "tables": frozenset("|┌┐└┘├┤┬┴┼─│"),
+        "special_chars": frozenset("★●◆►▪"),
+    }
+    _EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+    _PHONE_RE = re.compile(r"[\+]?[\d\s\-\(\)]{10,}")
+    _METRICS_RE = re.compile(r"\d+[kK+%]|\d{3,}")
+
+    name = "score_ats"
+
+    description = (
+        "Score a resume against ATS (Applicant Tracking System) criteria. "
+        "Checks keyword match rate against a job description, section "
+        "completeness, formatting quality, and returns an overall ATS "
+        "compatibility score with specific improvement suggestions."
+    )
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "resume_text": {
+                "type": "string",
+                "description": "The full text of the resume",
             },
-            "required": ["resume_text", "jd_keywords"],
-        }
+            "jd_keywords": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Keywords extracted from the job description",
+            },
+            "required_skills": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Required skills from the job description",
+                "default": [],
+            },
+        },
+        "required": ["resume_text", "jd_keywords"],
+    }
 
     def _check_keyword_density(
-        self, resume: str, keywords: list[str]
+        self, resume: str, keywords: list[str], present: set[str] | None = None
     ) -> dict[str, Any]:
         """Check how many JD keywords appear in the resume."""
-        resume_lower = resume.lower()
+        if present is None:
+            present = find_phrases(resume.lower(), [kw.lower() for kw in keywords])
         found = []
         missing = []
 
         for kw in keywords:
-            if kw.lower() in resume_lower:
+            if kw.lower() in present:
                 found.append(kw)
             else:
                 missing.append(kw)
@@ -86,19 +104,19 @@ class ATSScorerTool(Tool):
             "keyword_match_rate": match_rate,
         }
 
-    def _check_sections(self, resume: str) -> dict[str, Any]:
+    def _check_sections(
+        self, resume: str, present: set[str] | None = None
+    ) -> dict[str, Any]:
         """Check which expected sections are present."""
-        resume_lower = resume.lower()
+        if present is None:
+            present = find_phrases(resume.lower(), self.EXPECTED_SECTIONS)
         found_sections = []
         missing_sections = []
 
         for section in self.EXPECTED_SECTIONS:
-            # Check if section header exists (with colon or on its own line)
-            pattern = rf"(?:^|\n)\s*{re.escape(section)}[\s:]*(?:\n|$)"
-            if re.search(pattern, resume_lower):
-                found_sections.append(section)
-            # Also check without strict line matching
-            elif section in resume_lower:
+            # Any mention counts, header line or not (a header match always
+            # implies a substring match, so no per-section regex is needed)
+            if section in present:
                 found_sections.append(section)
             else:
                 missing_sections.append(section)
@@ -113,14 +131,25 @@ class ATSScorerTool(Tool):
             "section_completeness": completeness,
         }
 
-    def _check_formatting(self, resume: str) -> dict[str, Any]:
+    def _check_formatting(
+        self, resume: str, present: set[str] | None = None
+    ) -> dict[str, Any]:
         """Check for ATS-unfriendly formatting."""
+        if present is None:
+            present = find_phrases(resume.lower(), self.ACTION_VERBS)
         issues = []
         score = 100
 
+        # Distinct characters, collected in one pass over the text. Character
+        # class checks become set lookups, and the email and metrics regexes
+        # only run when the '@' or digit they need is present.
+        chars = set(resume)
+
         # Check for problematic characters
-        for issue_name, pattern in self.FORMATTING_PENALTIES.items():
-            if re.search(pattern, resume):
+        for issue_name, pattern in self._FORMATTING_PATTERNS.items():
+            char_set = self._PENALTY_CHAR_SETS.get(issue_name)
+            found = not chars.isdisjoint(char_set) if char_set else pattern.search(resume)
+            if found:
                 issues.append(f"Contains {issue_name.replace('_', ' ')}")
                 score -= 10
 
@@ -134,8 +163,8 @@ class ATSScorerTool(Tool):
             score -= 5
 
         # Check for contact info
-        has_email = bool(re.search(r"[\w.+-]+@[\w-]+\.[\w.-]+", resume))
-        has_phone = bool(re.search(r"[\+]?[\d\s\-\(\)]{10,}", resume))
+        has_email = "@" in chars and bool(self._EMAIL_RE.search(resume))
+        has_phone = bool(self._PHONE_RE.search(resume))
 
         if not has_email:
             issues.append("No email address found")
@@ -144,21 +173,16 @@ class ATSScorerTool(Tool):
             issues.append("No phone number found")
             score -= 5
 
-        # Check for action verbs (strong resume language)
-        action_verbs = [
-            "built", "developed", "designed", "implemented", "led",
-            "created", "managed", "improved", "delivered", "launched",
-            "architected", "optimized", "automated", "integrated",
-        ]
-        resume_lower = resume.lower()
-        verbs_found = [v for v in action_verbs if v in resume_lower]
+        # Check for action verbs
+        verbs_found = [v for v in self.ACTION_VERBS if v in present]
 
         if len(verbs_found) < 3:
             issues.append("Few action verbs — use more active language")
             score -= 10
 
         # Check for quantified achievements
-        has_numbers = bool(re.search(r"\d+[kK+%]|\d{3,}", resume))
+        has_digits = any(c.isdecimal() for c in chars)  # what \d matches
+        has_numbers = has_digits and bool(self._METRICS_RE.search(resume))
         if not has_numbers:
             issues.append("No quantified achievements (numbers, percentages)")
             score -= 10
@@ -196,9 +220,15 @@ class ATSScorerTool(Tool):
         resume_text = kwargs["resume_text"]
         jd_keywords = kwargs["jd_keywords"]
 
-        keyword_data = self._check_keyword_density(resume_text, jd_keywords)
-        section_data = self._check_sections(resume_text)
-        formatting_data = self._check_formatting(resume_text)
+        # One scan of the resume covers JD keywords, section names and verbs;
+        # each check then reads its own phrases out of the shared hit set
+        present = find_phrases(
+            resume_text.lower(),
+            [kw.lower() for kw in jd_keywords] + self.EXPECTED_SECTIONS + self.ACTION_VERBS,
+        )
+        keyword_data = self._check_keyword_density(resume_text, jd_keywords, present)
+        section_data = self._check_sections(resume_text, present)
+        formatting_data = self._check_formatting(resume_text, present)
 
         overall_score = self._calculate_overall_score(
             keyword_data, section_data, formatting_data
@@ -1,6 +1,9 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
+_METADATA_ATTRS = ("name", "description", "parameters")
+
 
 class Tool(ABC):
     """Base class for all agent tools.
@@ -10,41 +13,53 @@ class Tool(ABC):
     and description to decide which tool to invoke.
     """
 
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Unique identifier the agent uses to select this tool."""
-        pass
+    # Declared as class attributes by each tool (a property also works when
+    # a value has to be computed per instance)
 
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """Human-readable description of what this tool does.
-        The agent reads this to decide when to use the tool."""
-        pass
+    # Unique identifier the agent uses to select this tool.
+    name: str
 
-    @property
-    @abstractmethod
-    def parameters(self) -> dict:
-        """JSON schema describing the expected input parameters.
-        Used for structured tool calling with the LLM."""
-        pass
+    # Human-readable description of what this tool does.
+    # The agent reads this to decide when to use the tool.
+    description: str
+
+    # JSON schema describing the expected input parameters.
+    # Used for structured tool calling with the LLM.
+    parameters: dict
 
     @abstractmethod
     def execute(self, **kwargs) -> dict[str, Any]:
         """Run the tool with the given parameters and return results."""
         pass
 
+    async def execute_async(self, **kwargs) -> dict[str, Any]:
+        """Run execute() in a worker thread.
+
+        Lets a coordinator asyncio.gather() several tools, so their network
+        calls overlap and the batch takes as long as the slowest tool.
+        """
+        return await asyncio.to_thread(self.execute, **kwargs)
+
     def to_openai_spec(self) -> dict:
-        """Convert this tool to OpenAI function calling format."""
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.parameters,
-            },
-        }
+        """Convert this tool to OpenAI function calling format.
+
+        Tools whose metadata are plain class attributes build the spec once
+        per class; treat the returned dict as read-only.
+        """
+        cls = type(self)
+        spec = cls.__dict__.get("_openai_spec")
+        if spec is None:
+            spec = {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.parameters,
+                },
+            }
+            if not any(isinstance(getattr(cls, attr, None), property) for attr in _METADATA_ATTRS):
+                cls._openai_spec = spec
+        return spec
 
 
 class ToolRegistry:
@@ -56,10 +71,12 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools: dict[str, Tool] = {}
+        self._specs: list[dict] | None = None  # built on first use, reset by register()
 
     def register(self, tool: Tool) -> None:
         """Register a tool so the agent can use it."""
         self._tools[tool.name] = tool
+        self._specs = None
 
     def get(self, name: str) -> Tool | None:
         """Look up a tool by name."""
@@ -70,5 +87,10 @@ class ToolRegistry:
         return list(self._tools.values())
 
     def to_openai_specs(self) -> list[dict]:
-        """Convert all tools to OpenAI function calling format."""
-        return [tool.to_openai_spec() for tool in self._tools.values()]
+        """Convert all tools to OpenAI function calling format.
+
+        The list is shared between calls; treat it as read-only.
+        """
+        if self._specs is None:
+            self._specs = [tool.to_openai_spec() for tool in self._tools.values()]
+        return self._specs
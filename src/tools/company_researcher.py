@@ -1,8 +1,76 @@
-import requests
-from bs4 import BeautifulSoup
+import re
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from .base import Tool
+from ..utils.html_extract import declared_charset, extract_page, read_capped
+
+_STRIPPED_TAGS = ("script", "style", "nav", "footer")
+_URL_PREFIXES = ("http://", "https://")
+# Anything that can't appear in a hostname label: spaces, punctuation, and the
+# combining accents NFKD splits off letters (so "é" leaves an "e" behind)
+_HOSTNAME_JUNK = re.compile(r"[^a-z0-9-]")
+
+FETCH_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+MAX_PAGE_BYTES = 512 * 1024
+MAX_TEXT_CHARS = 5000
+_HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+# Runs the constructed-URL and bare-domain probes side by side
+_FETCH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="company-fetch")
+
+# Successful research by normalized query. Agents in one dispatch (and the
+# deep-dive task) often look up the same company repeatedly.
+RESEARCH_CACHE_TTL = 3600  # seconds
+_RESEARCH_CACHE_MAX = 256
+_research_cache: dict[str, tuple[float, dict]] = {}
+_research_cache_lock = threading.Lock()
+
+# requests and bs4 are imported on first fetch, not at module load, so
+# building an agent's tool registry doesn't pay for them up front
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    """Return the pooled session shared by all fetches, creating it on first use.
+
+    One session means the fallback URL and repeat lookups of the same site
+    reuse open connections instead of a new TCP+TLS handshake.
+    """
+    global _session
+    if _session is not None:
+        return _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util import make_headers
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            session.headers.update({
+                "User-Agent": (
+                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                    "AppleWebKit/537.36 (KHTML, like Gecko) "
+                    "Chrome/120.0.0.0 Safari/537.36"
+                ),
+                # gzip/deflate, plus br when brotli is installed; HTML compresses
+                # 3-5x and raw.read(decode_content=True) undoes it
+                "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+            })
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=16,
+                max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+    return _session
 
 
 class CompanyResearcherTool(Tool):
@@ -13,82 +81,99 @@ class CompanyResearcherTool(Tool):
     an interview.
     """
 
-    @property
-    def name(self) -> str:
-        return "research_company"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Research a company by fetching its website content. "
-            "Use when user asks about a company, wants to prepare for "
-            "an interview at a specific company, or mentions a company name. "
-            "Returns the company's mission, products, and key details."
-        )
-
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "Company name or website URL to research",
-                },
+    name = "research_company"
+
+    description = (
+        "Research a company by fetching its website content. "
+        "Use when user asks about a company, wants to prepare for "
+        "an interview at a specific company, or mentions a company name. "
+        "Returns the company's mission, products, and key details."
+    )
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Company name or website URL to research",
             },
-            "required": ["query"],
-        }
+        },
+        "required": ["query"],
+    }
 
     def _build_url(self, query: str) -> str:
         """Turn a company name or URL into a fetchable URL."""
-        if query.startswith("http://") or query.startswith("https://"):
+        if query.startswith(_URL_PREFIXES):
             return query
         # Try constructing a URL from the company name
-        clean = query.lower().replace(" ", "").replace(",", "").replace(".", "")
+        clean = _HOSTNAME_JUNK.sub("", unicodedata.normalize("NFKD", query.lower()))
         return f"https://www.{clean}.com"
 
     def _fetch_page(self, url: str) -> str | None:
-        """Fetch a webpage and extract its text content."""
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            )
-        }
-        try:
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            for tag in soup(["script", "style", "nav", "footer"]):
-                tag.decompose()
+        """Fetch a webpage and extract its text content.
 
-            # Try to get meta description
-            meta_desc = ""
-            meta_tag = soup.find("meta", attrs={"name": "description"})
-            if meta_tag and meta_tag.get("content"):
-                meta_desc = meta_tag["content"]
+        The body is streamed and cut off at MAX_PAGE_BYTES; only the first
+        MAX_TEXT_CHARS characters of text are kept, so the rest of a large
+        page is never downloaded or parsed. Non-HTML responses are skipped.
+        """
+        from requests import RequestException
 
-            title = soup.title.string if soup.title else ""
-            body_text = soup.get_text(separator="\n", strip=True)
-
-            return f"Title: {title}\nDescription: {meta_desc}\n\n{body_text[:5000]}"
-        except requests.RequestException:
+        try:
+            with _get_session().get(url, timeout=FETCH_TIMEOUT, stream=True) as response:
+                response.raise_for_status()
+                content_type = response.headers.get("Content-Type", "")
+                if content_type and not content_type.startswith(_HTML_CONTENT_TYPES):
+                    return None
+                content = read_capped(response, MAX_PAGE_BYTES)
+                charset = declared_charset(response)
+
+            title, meta_desc, body_text = extract_page(
+                content, charset, max_chars=MAX_TEXT_CHARS, stripped_tags=_STRIPPED_TAGS,
+            )
+            return f"Title: {title}\nDescription: {meta_desc}\n\n{body_text}"
+        except RequestException:
             return None
 
     def execute(self, **kwargs) -> dict[str, Any]:
         query = kwargs["query"]
+        key = query.strip().lower()
+        with _research_cache_lock:
+            cached = _research_cache.get(key)
+        if cached and time.monotonic() - cached[0] < RESEARCH_CACHE_TTL:
+            return dict(cached[1])
+
+        result = self._research(query)
+        if result["success"]:
+            with _research_cache_lock:
+                if key not in _research_cache and len(_research_cache) >= _RESEARCH_CACHE_MAX:
+                    _research_cache.pop(next(iter(_research_cache)))
+                _research_cache[key] = (time.monotonic(), result)
+            return dict(result)
+        return result
+
+    def _research(self, query: str) -> dict[str, Any]:
+        """Fetch and extract the company's site, uncached."""
         url = self._build_url(query)
 
-        content = self._fetch_page(url)
-
-        if content is None:
-            # Try with just the query as-is if URL construction failed
-            if not query.startswith("http"):
-                alt_url = f"https://{query}"
-                content = self._fetch_page(alt_url)
+        # Also try the query as-is in case URL construction guessed wrong
+        candidates = [url]
+        if not query.startswith("http") and f"https://{query}" != url:
+            candidates.append(f"https://{query}")
+
+        if len(candidates) == 1:
+            content = self._fetch_page(url)
+        else:
+            # Probe all candidates at once, so a dead guess costs one timeout
+            # in parallel rather than before the fallback even starts. The
+            # constructed URL still wins when more than one page loads.
+            futures = [_FETCH_POOL.submit(self._fetch_page, candidate) for candidate in candidates]
+            content = None
+            for future in futures:
+                content = future.result()
+                if content is not None:
+                    break
+            for future in futures:
+                future.cancel()
 
         if content is None:
             return {
@@ -3,6 +3,11 @@ from typing import Any
 from .base import Tool
 
 
+def _bullets(heading: str, items: list[str]) -> str:
+    """A section heading followed by its items, one per line."""
+    return heading + "\n" + "\n".join(f"  - {item}" for item in items)
+
+
 class CoverLetterTool(Tool):
     """Generates a structured cover letter framework.
 
@@ -12,65 +17,64 @@ class CoverLetterTool(Tool):
     points that should be addressed.
     """
 
-    @property
-    def name(self) -> str:
-        return "generate_cover_letter"
+    name = "generate_cover_letter"
 
-    @property
-    def description(self) -> str:
-        return (
-            "Generate a tailored cover letter framework based on job analysis results. "
-            "Takes matched skills, missing skills, company context, and candidate "
-            "background to produce a structured cover letter."
-        )
+    description = (
+        "Generate a tailored cover letter framework based on job analysis results. "
+        "Takes matched skills, missing skills, company context, and candidate "
+        "background to produce a structured cover letter."
+    )
 
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "candidate_name": {
-                    "type": "string",
-                    "description": "The candidate's full name",
-                },
-                "company_name": {
-                    "type": "string",
-                    "description": "The company being applied to",
-                },
-                "role_title": {
-                    "type": "string",
-                    "description": "The job title being applied for",
-                },
-                "matched_skills": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Skills that match the job requirements",
-                },
-                "missing_skills": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Required skills the candidate lacks",
-                },
-                "key_experiences": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Relevant experiences to highlight",
-                },
-                "company_context": {
-                    "type": "string",
-                    "description": "Brief context about the company",
-                    "default": "",
-                },
+    parameters = {
+        "type": "object",
+        "properties": {
+            "candidate_name": {
+                "type": "string",
+                "description": "The candidate's full name",
             },
-            "required": [
-                "candidate_name",
-                "company_name",
-                "role_title",
-                "matched_skills",
-                "missing_skills",
-                "key_experiences",
-            ],
-        }
+            "company_name": {
+                "type": "string",
+                "description": "The company being applied to",
+            },
+            "role_title": {
+                "type": "string",
+                "description": "The job title being applied for",
+            },
+            "matched_skills": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Skills that match the job requirements",
+            },
+            "missing_skills": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Required skills the candidate lacks",
+            },
+            "key_experiences": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Relevant experiences to highlight",
+            },
+            "company_context": {
+                "type": "string",
+                "description": "Brief context about the company",
+                "default": "",
+            },
+            "include_structure": {
+                "type": "boolean",
+                "description": "Also return the letter split into named sections",
+                "default": True,
+            },
+        },
+        "required": [
+            "candidate_name",
+            "company_name",
+            "role_title",
+            "matched_skills",
+            "missing_skills",
+            "key_experiences",
+        ],
+    }
 
     def execute(self, **kwargs) -> dict[str, Any]:
         name = kwargs["candidate_name"]
@@ -81,72 +85,54 @@ class CoverLetterTool(Tool):
         experiences = kwargs["key_experiences"]
         company_ctx = kwargs.get("company_context", "")
 
-        # Build strength points from matched skills
-        strength_points = []
-        for skill in matched[:5]:  # Top 5 matches
-            strength_points.append(
-                f"Demonstrated proficiency in {skill}"
-            )
+        strength_skills = matched[:5]  # Top 5 matches
+        growth_skills = missing[:3]  # Top 3 gaps
+        highlighted = experiences[:4]
 
-        # Build growth narrative for missing skills
-        growth_points = []
-        for skill in missing[:3]:  # Top 3 gaps
-            growth_points.append(
-                f"Eager to deepen expertise in {skill} — "
-                f"with a strong foundation in related areas"
-            )
+        opening = (
+            f"Dear Hiring Manager,\n\n"
+            f"I am writing to express my interest in the {role} position "
+            f"at {company}."
+        )
+        company_connection = (
+            f"What draws me to {company} is {company_ctx}"
+            if company_ctx
+            else f"I am excited about the opportunity to contribute to {company}'s mission."
+        )
+        closing = (
+            f"\nI would welcome the opportunity to discuss how my skills "
+            f"and experience can contribute to your team.\n\n"
+            f"Best regards,\n{name}"
+        )
 
-        # Structure the letter
-        letter = {
-            "opening": (
-                f"Dear Hiring Manager,\n\n"
-                f"I am writing to express my interest in the {role} position "
-                f"at {company}."
-            ),
-            "company_connection": (
-                f"What draws me to {company} is {company_ctx}"
-                if company_ctx
-                else f"I am excited about the opportunity to contribute to {company}'s mission."
-            ),
-            "strengths_paragraph": (
-                "My background aligns well with this role:\n"
-                + "\n".join(f"  - {point}" for point in strength_points)
-            ),
-            "experience_highlights": (
-                "Key experiences I would bring:\n"
-                + "\n".join(f"  - {exp}" for exp in experiences[:4])
-            ),
+        # Each section is built once and serves both the letter (sections
+        # separated by a blank line) and the optional structure
+        strength_points = [f"Demonstrated proficiency in {skill}" for skill in strength_skills]
+        growth_points = [
+            f"Eager to deepen expertise in {skill} — with a strong foundation in related areas"
+            for skill in growth_skills
+        ]
+        sections = {
+            "opening": opening,
+            "company_connection": company_connection,
+            "strengths_paragraph": _bullets("My background aligns well with this role:", strength_points),
+            "experience_highlights": _bullets("Key experiences I would bring:", highlighted),
             "growth_narrative": (
-                "Areas where I am actively growing:\n"
-                + "\n".join(f"  - {point}" for point in growth_points)
-            ) if growth_points else "",
-            "closing": (
-                f"\nI would welcome the opportunity to discuss how my skills "
-                f"and experience can contribute to your team.\n\n"
-                f"Best regards,\n{name}"
+                _bullets("Areas where I am actively growing:", growth_points) if growth_points else ""
             ),
+            "closing": closing,
         }
+        full_letter = "\n\n".join(text for text in sections.values() if text)
 
-        # Combine into full text
-        sections = [
-            letter["opening"],
-            letter["company_connection"],
-            letter["strengths_paragraph"],
-            letter["experience_highlights"],
-        ]
-        if letter["growth_narrative"]:
-            sections.append(letter["growth_narrative"])
-        sections.append(letter["closing"])
-
-        full_letter = "\n\n".join(sections)
-
-        return {
+        result = {
             "success": True,
             "cover_letter": full_letter,
-            "structure": letter,
             "stats": {
-                "strengths_highlighted": len(strength_points),
-                "gaps_addressed": len(growth_points),
-                "experiences_included": min(len(experiences), 4),
+                "strengths_highlighted": len(strength_skills),
+                "gaps_addressed": len(growth_skills),
+                "experiences_included": len(highlighted),
             },
         }
+        if kwargs.get("include_structure", True):
+            result["structure"] = sections
+        return result
@@ -2,18 +2,49 @@
 
 Safety guards:
 - depth >= 1 → refuse (no recursive delegation)
-- total_runs[0] >= 5 → refuse (global cap per dispatch)
+- total_runs[0] >= MAX_DELEGATIONS → refuse (global cap per dispatch)
 - sub-agents get NO delegate tool (only memory tools)
 """
 
+import threading
 from typing import Any, Callable
 
 from .base import Tool
 
+MAX_DELEGATIONS = 5
+
+# Guards the shared run counter; an agent may fire several delegations at once
+_runs_lock = threading.Lock()
+
 
 class DelegateToAgentTool(Tool):
     """Tool that lets an agent delegate a sub-task to another agent."""
 
+    name = "delegate_to_agent"
+
+    description = (
+        "Delegate a sub-task to another specialized agent. "
+        "Use when you need data or analysis from another agent's expertise. "
+        "Scout finds jobs, Match analyzes compatibility, "
+        "Forge writes materials, Coach prepares interviews."
+    )
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "agent_name": {
+                "type": "string",
+                "enum": ["scout", "match", "forge", "coach"],
+                "description": "Which agent to delegate to",
+            },
+            "task_description": {
+                "type": "string",
+                "description": "What you need the other agent to do",
+            },
+        },
+        "required": ["agent_name", "task_description"],
+    }
+
     def __init__(self):
         self._user_id: int | None = None
         self._message_bus = None
@@ -22,6 +53,10 @@ class DelegateToAgentTool(Tool):
         self._provider: str = "groq"
         self._model: str | None = None
         self._cancel_check: Callable[[], bool] | None = None
+        # Idle sub-agents by (agent_name, provider, model, user_id). An agent is
+        # checked out while it runs, so concurrent delegations never share one.
+        self._idle_agents: dict[tuple, list] = {}
+        self._idle_lock = threading.Lock()
 
     def set_context(
         self,
@@ -40,37 +75,8 @@ class DelegateToAgentTool(Tool):
         self._provider = provider
         self._model = model
         self._cancel_check = cancel_check
-
-    @property
-    def name(self) -> str:
-        return "delegate_to_agent"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Delegate a sub-task to another specialized agent. "
-            "Use when you need data or analysis from another agent's expertise. "
-            "Scout finds jobs, Match analyzes compatibility, "
-            "Forge writes materials, Coach prepares interviews."
-        )
-
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "agent_name": {
-                    "type": "string",
-                    "enum": ["scout", "match", "forge", "coach"],
-                    "description": "Which agent to delegate to",
-                },
-                "task_description": {
-                    "type": "string",
-                    "description": "What you need the other agent to do",
-                },
-            },
-            "required": ["agent_name", "task_description"],
-        }
+        with self._idle_lock:
+            self._idle_agents.clear()
 
     def execute(self, **kwargs) -> dict[str, Any]:
         agent_name = kwargs.get("agent_name", "")
@@ -86,13 +92,6 @@ class DelegateToAgentTool(Tool):
                 "error": "Cannot delegate from a sub-agent (max depth 1)",
             }
 
-        # Safety: global run cap
-        if self._total_runs[0] >= 5:
-            return {
-                "success": False,
-                "error": "Delegation limit reached (max 5 sub-agent runs per dispatch)",
-            }
-
         # Import here to avoid circular imports
         from ..agents.orchestrator import Orchestrator
 
@@ -100,29 +99,18 @@ class DelegateToAgentTool(Tool):
         if not factory:
             return {"success": False, "error": f"Unknown agent: {agent_name}"}
 
-        # Increment global counter
-        self._total_runs[0] += 1
+        # Safety: global run cap, checked and claimed in one step
+        with _runs_lock:
+            if self._total_runs[0] >= MAX_DELEGATIONS:
+                return {
+                    "success": False,
+                    "error": f"Delegation limit reached (max {MAX_DELEGATIONS} sub-agent runs per dispatch)",
+                }
+            self._total_runs[0] += 1
 
+        key = (agent_name, self._provider, self._model, self._user_id)
         try:
-            # Create sub-agent with NO delegate tool (only memory tools)
-            agent = factory(self._provider, self._model)
-
-            # Register memory tools if we have a user
-            if self._user_id:
-                try:
-                    from .memory_tools import RecallMemoryTool, StoreMemoryTool, RecallTraceTool
-
-                    recall = RecallMemoryTool()
-                    recall.set_user_id(self._user_id)
-                    store = StoreMemoryTool()
-                    store.set_user_id(self._user_id)
-                    recall_trace = RecallTraceTool()
-                    recall_trace.set_user_id(self._user_id)
-                    agent.registry.register(recall)
-                    agent.registry.register(store)
-                    agent.registry.register(recall_trace)
-                except ImportError:
-                    pass
+            agent = self._checkout_agent(key, factory)
 
             # Create trace for sub-agent
             trace_id = None
@@ -148,6 +136,10 @@ class DelegateToAgentTool(Tool):
                 cancel_check=self._cancel_check,
             )
 
+            # run() resets the agent's memory, so it can serve the next delegation
+            with self._idle_lock:
+                self._idle_agents.setdefault(key, []).append(agent)
+
             return {
                 "success": True,
                 "agent": agent_name,
@@ -159,3 +151,31 @@ class DelegateToAgentTool(Tool):
                 "success": False,
                 "error": f"Delegation to {agent_name} failed: {str(e)[:500]}",
             }
+
+    def _checkout_agent(self, key: tuple, factory):
+        """Reuse an idle sub-agent for this key, or build one."""
+        with self._idle_lock:
+            idle = self._idle_agents.get(key)
+            if idle:
+                return idle.pop()
+
+        # Create sub-agent with NO delegate tool (only memory tools)
+        agent = factory(self._provider, self._model)
+
+        # Register memory tools if we have a user
+        if self._user_id:
+            try:
+                from .memory_tools import RecallMemoryTool, StoreMemoryTool, RecallTraceTool
+
+                recall = RecallMemoryTool()
+                recall.set_user_id(self._user_id)
+                store = StoreMemoryTool()
+                store.set_user_id(self._user_id)
+                recall_trace = RecallTraceTool()
+                recall_trace.set_user_id(self._user_id)
+                agent.registry.register(recall)
+                agent.registry.register(store)
+                agent.registry.register(recall_trace)
+            except ImportError:
+                pass
+        return agent
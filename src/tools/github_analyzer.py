@@ -1,7 +1,156 @@
-import requests
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from typing import Any
 
+import requests
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 from .base import Tool
+from ..utils.http_client import get_http_session, response_json
+
+# Language breakdowns are one API call per repo; fetch them side by side over
+# the shared connection pool instead of one round trip at a time
+_LANGUAGE_POOL = ThreadPoolExecutor(max_workers=10, thread_name_prefix="github-languages")
+_REST_ACCEPT = {"Accept": "application/vnd.github.v3+json"}
+
+# Repos, topics and language sizes in one request. GraphQL needs a token;
+# without one (or if the query fails) the REST endpoints are used instead.
+_REPOS_QUERY = """
+query($login: String!, $count: Int!) {
+  user(login: $login) {
+    repositories(first: $count, ownerAffiliations: OWNER, isFork: false,
+                 orderBy: {field: UPDATED_AT, direction: DESC}) {
+      nodes {
+        name
+        description
+        stargazerCount
+        forkCount
+        updatedAt
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+        languages(first: 20, orderBy: {field: SIZE, direction: DESC}) {
+          edges { size node { name } }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _auth_headers() -> dict:
+    """Bearer auth when GITHUB_TOKEN is set (5000 requests/hour instead of 60)."""
+    token = os.getenv("GITHUB_TOKEN")
+    return {"Authorization": f"bearer {token}"} if token else {}
+
+
+def _rest_headers() -> dict:
+    return {**_REST_ACCEPT, **_auth_headers()}
+
+
+# Successful API responses by (username, request). Profiles are analyzed
+# repeatedly within a session, and unauthenticated calls are limited to 60/hour.
+# Expired REST entries are kept so they can be revalidated with their ETag.
+GITHUB_CACHE_TTL = 1800  # seconds
+_GITHUB_CACHE_MAX = 512
+_github_cache: dict[tuple, tuple[float, str | None, Any]] = {}  # key -> (expires_at, etag, body)
+_github_cache_lock = threading.Lock()
+
+
+def _cache_entry(key: tuple) -> tuple[float, str | None, Any] | None:
+    with _github_cache_lock:
+        return _github_cache.get(key)
+
+
+def _cache_get(key: tuple) -> Any | None:
+    """Return the cached body if it hasn't expired."""
+    entry = _cache_entry(key)
+    if entry and time.monotonic() < entry[0]:
+        return entry[2]
+    return None
+
+
+def _cache_put(key: tuple, body: Any, etag: str | None = None) -> None:
+    # ±10% jitter so entries stored together don't all expire (and refetch) together
+    expires_at = time.monotonic() + GITHUB_CACHE_TTL * random.uniform(0.9, 1.1)
+    with _github_cache_lock:
+        if key not in _github_cache and len(_github_cache) >= _GITHUB_CACHE_MAX:
+            _github_cache.pop(next(iter(_github_cache)))
+        _github_cache[key] = (expires_at, etag, body)
+
+
+def invalidate_cache(username: str) -> None:
+    """Drop cached GitHub responses for a user, so the next analysis refetches."""
+    user = username.lower()
+    with _github_cache_lock:
+        for key in [key for key in _github_cache if key[0] == user]:
+            del _github_cache[key]
+
+
+@cache
+def _framework_automaton():
+    """Aho-Corasick automaton over FRAMEWORK_INDICATORS, built on first use.
+
+    Each indicator maps to (position, framework) so matches can be put back
+    in the table's order.
+    """
+    automaton = ahocorasick.Automaton()
+    for position, (indicator, framework) in enumerate(GitHubAnalyzerTool._FW_ITEMS):
+        automaton.add_word(indicator, (position, framework))
+    automaton.make_automaton()
+    return automaton
+
+
+def _get_json(
+    username: str,
+    url: str,
+    params: dict | None = None,
+    timeout: int = 10,
+    fields: tuple[str, ...] | None = None,
+) -> Any:
+    """GET a GitHub REST endpoint, served from the cache when fresh.
+
+    With `fields`, a list body is trimmed to just those keys per item before
+    it is cached, so the cache holds only what the caller reads.
+
+    An expired entry is revalidated with If-None-Match; GitHub answers 304
+    with no body when nothing changed, and 304s don't count against the
+    rate limit. Raises requests.RequestException on failure; failures are
+    not cached.
+    """
+    key = (username.lower(), url, tuple(sorted((params or {}).items())))
+    entry = _cache_entry(key)
+    if entry and time.monotonic() < entry[0]:
+        return entry[2]
+
+    headers = _rest_headers()
+    if entry and entry[1]:
+        headers["If-None-Match"] = entry[1]
+    response = get_http_session().get(url, headers=headers, params=params, timeout=timeout)
+    if response.status_code == 304 and entry:
+        _cache_put(key, entry[2], entry[1])
+        return entry[2]
+    response.raise_for_status()
+    body = response_json(response)
+    if fields:
+        body = [{k: item[k] for k in fields if k in item} for item in body]
+    _cache_put(key, body, response.headers.get("ETag"))
+    return body
+
+
+# The only repo fields the analysis reads; a full REST repo object is ~100 keys
+_REPO_FIELDS = (
+    "name", "fork", "stargazers_count", "forks_count",
+    "updated_at", "description", "topics",
+)
 
 
 class GitHubAnalyzerTool(Tool):
@@ -9,7 +158,8 @@ class GitHubAnalyzerTool(Tool):
 
     Scans public repositories to identify programming languages,
     frameworks, contribution patterns, and project complexity.
-    Uses the GitHub public API (no auth needed for public profiles).
+    Uses the GitHub public API (no auth needed for public profiles; with
+    GITHUB_TOKEN set it makes a single GraphQL request instead).
     """
 
     # Map common repo topics/languages to skill categories
@@ -37,45 +187,40 @@ class GitHubAnalyzerTool(Tool):
         "tailwind": "Tailwind CSS",
         "graphql": "GraphQL",
     }
+    # Frozen (indicator, framework) pairs, iterated once per repo
+    _FW_ITEMS: tuple[tuple[str, str], ...] = tuple(FRAMEWORK_INDICATORS.items())
 
-    @property
-    def name(self) -> str:
-        return "analyze_github"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Analyze a GitHub profile to extract demonstrable skills. "
-            "Use when user mentions their GitHub username, shares a GitHub URL, "
-            "or asks to analyze their open source contributions. "
-            "Scans public repositories for languages, frameworks, and activity."
-        )
+    name = "analyze_github"
 
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "username": {
-                    "type": "string",
-                    "description": "GitHub username to analyze",
-                },
-                "max_repos": {
-                    "type": "integer",
-                    "description": "Maximum number of repos to analyze",
-                    "default": 20,
-                },
+    description = (
+        "Analyze a GitHub profile to extract demonstrable skills. "
+        "Use when user mentions their GitHub username, shares a GitHub URL, "
+        "or asks to analyze their open source contributions. "
+        "Scans public repositories for languages, frameworks, and activity."
+    )
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "username": {
+                "type": "string",
+                "description": "GitHub username to analyze",
             },
-            "required": ["username"],
-        }
+            "max_repos": {
+                "type": "integer",
+                "description": "Maximum number of repos to analyze",
+                "default": 20,
+            },
+        },
+        "required": ["username"],
+    }
 
     def _fetch_repos(self, username: str, max_repos: int) -> list[dict]:
         """Fetch public repos for a user."""
         try:
-            headers = {"Accept": "application/vnd.github.v3+json"}
-            response = requests.get(
+            return _get_json(
+                username,
                 f"https://api.github.com/users/{username}/repos",
-                headers=headers,
                 params={
                     "sort": "updated",
                     "direction": "desc",
@@ -83,46 +228,108 @@ class GitHubAnalyzerTool(Tool):
                     "type": "owner",
                 },
                 timeout=10,
+                fields=_REPO_FIELDS,
             )
-            response.raise_for_status()
-            return response.json()
         except requests.RequestException:
             return []
 
     def _fetch_languages(self, username: str, repo_name: str) -> dict:
         """Fetch language breakdown for a repo."""
         try:
-            response = requests.get(
+            return _get_json(
+                username,
                 f"https://api.github.com/repos/{username}/{repo_name}/languages",
-                headers={"Accept": "application/vnd.github.v3+json"},
                 timeout=5,
             )
-            response.raise_for_status()
-            return response.json()
         except requests.RequestException:
             return {}
 
+    def _fetch_graphql(self, username: str, max_repos: int) -> list[tuple[dict, dict]] | None:
+        """Fetch non-fork repos with their languages in a single GraphQL query.
+
+        Returns (repo, languages) pairs shaped like the REST responses, or
+        None when there is no token or the query fails.
+        """
+        headers = _auth_headers()
+        if not headers:
+            return None
+        count = min(max_repos, 100)
+        key = (username.lower(), "graphql", count)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+        try:
+            response = get_http_session().post(
+                "https://api.github.com/graphql",
+                headers=headers,
+                json={"query": _REPOS_QUERY, "variables": {"login": username, "count": count}},
+                timeout=10,
+            )
+            response.raise_for_status()
+            payload = response_json(response)
+            if payload.get("errors"):
+                return None
+            nodes = payload["data"]["user"]["repositories"]["nodes"]
+        except (requests.RequestException, ValueError, KeyError, TypeError):
+            return None
+
+        repos_with_languages = [
+            (
+                {
+                    "name": node["name"],
+                    "description": node.get("description"),
+                    "topics": [t["topic"]["name"] for t in node["repositoryTopics"]["nodes"]],
+                    "stargazers_count": node.get("stargazerCount", 0),
+                    "forks_count": node.get("forkCount", 0),
+                    "updated_at": node.get("updatedAt", ""),
+                },
+                {edge["node"]["name"]: edge["size"] for edge in node["languages"]["edges"]},
+            )
+            for node in nodes
+        ]
+        _cache_put(key, repos_with_languages)
+        return repos_with_languages
+
+    def _fetch_rest(self, username: str, max_repos: int) -> list[tuple[dict, dict]] | None:
+        """Fetch non-fork repos, then each one's languages concurrently.
+
+        Returns None when the user's repos can't be listed.
+        """
+        repos = self._fetch_repos(username, max_repos)
+        if not repos:
+            return None
+        active_repos = [repo for repo in repos if not repo.get("fork")]  # Skip forks
+        repo_languages = _LANGUAGE_POOL.map(
+            lambda repo: self._fetch_languages(username, repo["name"]), active_repos
+        )
+        return list(zip(active_repos, repo_languages))
+
     def _detect_frameworks(self, repo: dict) -> list[str]:
         """Detect frameworks from repo name, description, and topics."""
-        frameworks = []
         searchable = " ".join([
             repo.get("name", ""),
             repo.get("description", "") or "",
             " ".join(repo.get("topics", [])),
         ]).lower()
 
-        for indicator, framework in self.FRAMEWORK_INDICATORS.items():
-            if indicator in searchable:
-                frameworks.append(framework)
+        if AHOCORASICK_AVAILABLE:
+            # One pass over the text for all indicators
+            hits = {match for _, match in _framework_automaton().iter(searchable)}
+            return [framework for _, framework in sorted(hits)]
 
-        return frameworks
+        return [framework for indicator, framework in self._FW_ITEMS if indicator in searchable]
 
     def execute(self, **kwargs) -> dict[str, Any]:
         username = kwargs["username"]
         max_repos = kwargs.get("max_repos", 20)
 
-        repos = self._fetch_repos(username, max_repos)
-        if not repos:
+        # An empty GraphQL result also falls back, so REST decides whether
+        # the user exists
+        repos_with_languages = (
+            self._fetch_graphql(username, max_repos)
+            or self._fetch_rest(username, max_repos)
+        )
+        if repos_with_languages is None:
             return {
                 "success": False,
                 "error": f"Could not fetch repos for '{username}'. Check if the username exists and has public repos.",
@@ -135,12 +342,7 @@ class GitHubAnalyzerTool(Tool):
         total_stars = 0
         total_forks = 0
 
-        for repo in repos:
-            if repo.get("fork"):
-                continue  # Skip forks
-
-            # Get languages for this repo
-            languages = self._fetch_languages(username, repo["name"])
+        for repo, languages in repos_with_languages:
             for lang, bytes_count in languages.items():
                 all_languages[lang] = all_languages.get(lang, 0) + bytes_count
 
@@ -1,8 +1,22 @@
+from functools import lru_cache
 from typing import Any
 
 from .base import Tool
 
 
+@lru_cache(maxsize=128)
+def _situational_questions(company: str) -> tuple[dict, ...]:
+    """Situational questions for a company, formatted once per company."""
+    return tuple(
+        {
+            "question": q.format(company=company),
+            "category": "situational",
+            "focus": "problem solving",
+        }
+        for q in InterviewPrepTool.SITUATIONAL_TEMPLATES
+    )
+
+
 class InterviewPrepTool(Tool):
     """Generates likely interview questions based on a job description.
 
@@ -36,55 +50,55 @@ class InterviewPrepTool(Tool):
         "How would you onboard yourself in the first 30 days at {company}?",
     ]
 
-    @property
-    def name(self) -> str:
-        return "prepare_interview"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Generate interview preparation questions and talking points. "
-            "Use when user asks for help preparing for an interview, wants "
-            "practice questions, or mentions an upcoming interview. "
-            "Produces technical, behavioral, and situational questions."
-        )
-
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "role_title": {
-                    "type": "string",
-                    "description": "The job title",
-                },
-                "company_name": {
-                    "type": "string",
-                    "description": "The company name",
-                },
-                "required_skills": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Required skills from the JD",
-                },
-                "responsibilities": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Key responsibilities from the JD",
-                },
-                "candidate_experiences": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Candidate's key experiences from resume",
-                },
+    # The behavioral questions never change; built once and copied per call
+    _BEHAVIORAL_QUESTIONS = tuple(
+        {"question": q, "category": "behavioral", "focus": "soft skills"}
+        for q in BEHAVIORAL_TEMPLATES
+    )
+
+    name = "prepare_interview"
+
+    description = (
+        "Generate interview preparation questions and talking points. "
+        "Use when user asks for help preparing for an interview, wants "
+        "practice questions, or mentions an upcoming interview. "
+        "Produces technical, behavioral, and situational questions."
+    )
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "role_title": {
+                "type": "string",
+                "description": "The job title",
             },
-            "required": [
-                "role_title",
-                "company_name",
-                "required_skills",
-                "responsibilities",
-            ],
-        }
+            "company_name": {
+                "type": "string",
+                "description": "The company name",
+            },
+            "required_skills": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Required skills from the JD",
+            },
+            "responsibilities": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Key responsibilities from the JD",
+            },
+            "candidate_experiences": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Candidate's key experiences from resume",
+            },
+        },
+        "required": [
+            "role_title",
+            "company_name",
+            "required_skills",
+            "responsibilities",
+        ],
+    }
 
     def _generate_technical_questions(
         self, skills: list[str], responsibilities: list[str]
@@ -110,23 +124,14 @@ class InterviewPrepTool(Tool):
 
     def _generate_behavioral_questions(self) -> list[dict]:
         """Generate standard behavioral interview questions."""
-        return [
-            {"question": q, "category": "behavioral", "focus": "soft skills"}
-            for q in self.BEHAVIORAL_TEMPLATES
-        ]
+        # Copies, since execute() adds talking points to each question
+        return [dict(q) for q in self._BEHAVIORAL_QUESTIONS]
 
     def _generate_situational_questions(
         self, company: str
     ) -> list[dict]:
         """Generate situational questions."""
-        return [
-            {
-                "question": q.format(company=company),
-                "category": "situational",
-                "focus": "problem solving",
-            }
-            for q in self.SITUATIONAL_TEMPLATES
-        ]
+        return [dict(q) for q in _situational_questions(company)]
 
     def _generate_role_questions(
         self, role: str, company: str
@@ -156,27 +161,37 @@ class InterviewPrepTool(Tool):
         ]
 
     def _suggest_talking_points(
-        self, question: dict, experiences: list[str]
+        self,
+        question: dict,
+        experiences: list[str],
+        word_index: dict[str, set[int]] | None = None,
     ) -> list[str]:
-        """Suggest relevant talking points for a question."""
-        points = []
-        q_lower = question["question"].lower()
-
-        for exp in experiences:
-            exp_lower = exp.lower()
-            # If experience seems relevant to the question topic
-            focus = question.get("focus", "").lower()
-            if focus and any(
-                word in exp_lower
-                for word in focus.split()
-                if len(word) > 3
-            ):
-                points.append(f"Reference: {exp}")
-
+        """Suggest relevant talking points for a question.
+
+        `word_index` maps a focus word to the indices of the experiences that
+        mention it. It is filled lazily and shared across one execute() call,
+        so questions with the same focus scan the experiences only once.
+        """
+        if word_index is None:
+            word_index = {}
+        focus = question.get("focus", "").lower()
+
+        # An experience is relevant if it mentions any focus word
+        relevant: set[int] = set()
+        for word in focus.split():
+            if len(word) <= 3:
+                continue
+            if word not in word_index:
+                word_index[word] = {
+                    i for i, exp in enumerate(experiences) if word in exp.lower()
+                }
+            relevant |= word_index[word]
+
+        points = [f"Reference: {experiences[i]}" for i in sorted(relevant)[:2]]
         if not points:
             points.append("Prepare a specific example from your experience")
 
-        return points[:2]
+        return points
 
     def execute(self, **kwargs) -> dict[str, Any]:
         role = kwargs["role_title"]
@@ -193,9 +208,11 @@ class InterviewPrepTool(Tool):
         all_questions.extend(self._generate_situational_questions(company))
         all_questions.extend(self._generate_role_questions(role, company))
 
-        # Add talking points
+        # Add talking points; focus words repeat across questions, so their
+        # experience matches are shared
+        word_index: dict[str, set[int]] = {}
         for q in all_questions:
-            q["talking_points"] = self._suggest_talking_points(q, experiences)
+            q["talking_points"] = self._suggest_talking_points(q, experiences, word_index)
 
         # Group by category
         by_category = {}
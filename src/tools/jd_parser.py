@@ -1,11 +1,25 @@
+import hashlib
 import json
 import re
+import threading
 from typing import Any
 
 import requests
-from bs4 import BeautifulSoup
 
 from .base import Tool
+from ..utils.html_extract import declared_charset, extract_page, read_capped
+from ..utils.http_client import get_http_session
+
+# A colon ending a line (trailing whitespace allowed): where a header can end
+_HEADER_END = re.compile(r":[^\S\n]*$", re.MULTILINE)
+MAX_PAGE_BYTES = 512 * 1024  # only the first 8000 chars of text are kept anyway
+MAX_TEXT_CHARS = 8000  # Limit to avoid token overflow
+
+# Parsed sections by blake2b digest of the JD text; agents often reparse the
+# same description (or refetch the same URL) several times in a session
+_PARSE_CACHE_MAX = 256
+_parse_cache: dict[bytes, dict[str, str]] = {}
+_parse_cache_lock = threading.Lock()
 
 
 class JDParserTool(Tool):
@@ -16,35 +30,29 @@ class JDParserTool(Tool):
     Handles both plain text input and web URLs.
     """
 
-    @property
-    def name(self) -> str:
-        return "parse_job_description"
+    name = "parse_job_description"
 
-    @property
-    def description(self) -> str:
-        return (
-            "Parse a job description from text or URL. Extracts role title, "
-            "company name, required skills, preferred skills, experience level, "
-            "responsibilities, and important keywords."
-        )
+    description = (
+        "Parse a job description from text or URL. Extracts role title, "
+        "company name, required skills, preferred skills, experience level, "
+        "responsibilities, and important keywords."
+    )
 
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "source": {
-                    "type": "string",
-                    "description": "The job description text or a URL to fetch it from",
-                },
-                "is_url": {
-                    "type": "boolean",
-                    "description": "Whether the source is a URL to fetch",
-                    "default": False,
-                },
+    parameters = {
+        "type": "object",
+        "properties": {
+            "source": {
+                "type": "string",
+                "description": "The job description text or a URL to fetch it from",
             },
-            "required": ["source"],
-        }
+            "is_url": {
+                "type": "boolean",
+                "description": "Whether the source is a URL to fetch",
+                "default": False,
+            },
+        },
+        "required": ["source"],
+    }
 
     def _fetch_from_url(self, url: str) -> str:
         """Fetch and extract text content from a job posting URL."""
@@ -55,38 +63,40 @@ class JDParserTool(Tool):
                 "Chrome/120.0.0.0 Safari/537.36"
             )
         }
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        for tag in soup(["script", "style", "nav", "footer", "header"]):
-            tag.decompose()
-
-        text = soup.get_text(separator="\n", strip=True)
-        # Collapse excessive whitespace while preserving structure
-        text = re.sub(r"\n{3,}", "\n\n", text)
-        return text[:8000]  # Limit to avoid token overflow
+        with get_http_session().get(url, headers=headers, timeout=15, stream=True) as response:
+            response.raise_for_status()
+            content = read_capped(response, MAX_PAGE_BYTES)
+            charset = declared_charset(response)
+
+        _, _, text = extract_page(
+            content, charset, max_chars=MAX_TEXT_CHARS,
+            stripped_tags=("script", "style", "nav", "footer", "header"),
+        )
+        return text
 
     def _extract_sections(self, text: str) -> dict[str, str]:
-        """Pull out common JD sections using header patterns."""
+        """Pull out common JD sections using header patterns.
+
+        Only lines ending in a colon can be headers, so a single regex pass
+        finds the candidates and each section's body is sliced out of the
+        text in one piece, without touching the lines in between.
+        """
         sections = {}
         current_section = "overview"
-        current_lines = []
-
-        for line in text.split("\n"):
-            stripped = line.strip()
-            # Detect section headers (lines that look like headings)
-            if stripped and len(stripped) < 80 and stripped.endswith(":"):
-                if current_lines:
-                    sections[current_section] = "\n".join(current_lines)
-                current_section = stripped.rstrip(":").lower()
-                current_lines = []
-            else:
-                current_lines.append(line)
-
-        if current_lines:
-            sections[current_section] = "\n".join(current_lines)
+        body_start = 0  # offset of the current section's first line
+
+        for match in _HEADER_END.finditer(text):
+            line_start = text.rfind("\n", 0, match.start()) + 1
+            stripped = text[line_start:match.end()].strip()
+            if len(stripped) >= 80:  # a sentence that happens to end in ":"
+                continue
+            if line_start > body_start:
+                sections[current_section] = text[body_start:line_start - 1]
+            current_section = stripped.rstrip(":").lower()
+            body_start = match.end() + 1
+
+        if body_start <= len(text):
+            sections[current_section] = text[body_start:]
 
         return sections
 
@@ -105,11 +115,19 @@ class JDParserTool(Tool):
         else:
             text = source
 
-        sections = self._extract_sections(text)
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        with _parse_cache_lock:
+            sections = _parse_cache.get(key)
+        if sections is None:
+            sections = self._extract_sections(text)
+            with _parse_cache_lock:
+                if key not in _parse_cache and len(_parse_cache) >= _PARSE_CACHE_MAX:
+                    _parse_cache.pop(next(iter(_parse_cache)))
+                _parse_cache[key] = sections
 
         return {
             "success": True,
             "raw_text": text[:4000],
-            "sections": sections,
+            "sections": dict(sections),  # callers may edit; the cached dict stays intact
             "char_count": len(text),
         }
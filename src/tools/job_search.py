@@ -1,7 +1,37 @@
-import requests
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from typing import Any
 
+import requests
+
 from .base import Tool
+from ..utils.http_client import get_http_session, response_json
+
+# Job boards are queried side by side, so a search takes as long as the
+# slowest board rather than the sum of all of them
+_SOURCE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="job-sources")
+
+
+@lru_cache(maxsize=128)
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern | None:
+    """Case-insensitive alternation regex over the keywords.
+
+    Each job is scanned once, without lowercasing its (often large HTML)
+    fields. None when there are no keywords (nothing matches).
+    """
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(kw) for kw in keywords), re.IGNORECASE)
+
+
+def _job_key(title: str, company: str) -> tuple[str, str]:
+    """Deduplication key: the same title at the same company is one job.
+
+    casefold() rather than lower() so titles like "Straße"/"STRASSE" match.
+    """
+    return (title.casefold(), company.casefold())
 
 
 class JobSearchTool(Tool):
@@ -23,69 +53,75 @@ class JobSearchTool(Tool):
         },
     }
 
-    @property
-    def name(self) -> str:
-        return "search_jobs"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Search for jobs matching given keywords and skills. "
-            "Use when user wants to find job openings, asks about available "
-            "positions, or wants to explore the job market. "
-            "Returns titles, companies, tags, and application URLs from multiple job boards."
-        )
-
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "keywords": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": (
-                        "Search keywords — role titles, skills, or technologies "
-                        "(e.g. ['python', 'backend', 'ai engineer'])"
-                    ),
-                },
-                "max_results": {
-                    "type": "integer",
-                    "description": "Maximum number of results to return",
-                    "default": 10,
-                },
+    name = "search_jobs"
+
+    description = (
+        "Search for jobs matching given keywords and skills. "
+        "Use when user wants to find job openings, asks about available "
+        "positions, or wants to explore the job market. "
+        "Returns titles, companies, tags, and application URLs from multiple job boards."
+    )
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "keywords": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": (
+                    "Search keywords — role titles, skills, or technologies "
+                    "(e.g. ['python', 'backend', 'ai engineer'])"
+                ),
             },
-            "required": ["keywords"],
-        }
+            "max_results": {
+                "type": "integer",
+                "description": "Maximum number of results to return",
+                "default": 10,
+            },
+        },
+        "required": ["keywords"],
+    }
+
+    def _search_remoteok(
+        self, keywords: list[str], limit: int | None = None, seen: set | None = None
+    ) -> list[dict]:
+        """Search RemoteOK for matching jobs.
 
-    def _search_remoteok(self, keywords: list[str]) -> list[dict]:
-        """Search RemoteOK for matching jobs."""
+        Jobs whose key is already in `seen` are skipped (new keys are added
+        to it), and scanning stops once `limit` jobs have matched.
+        """
         try:
             headers = {"User-Agent": "SmartJobAgent/1.0"}
-            response = requests.get(
+            response = get_http_session().get(
                 self.SOURCES["remoteok"]["url"],
                 headers=headers,
                 timeout=10,
             )
             response.raise_for_status()
-            data = response.json()
+            data = response_json(response)
 
             # First item is metadata, skip it
             jobs = data[1:] if len(data) > 1 else []
 
             # Filter by keywords
             matched = []
-            keywords_lower = [k.lower() for k in keywords]
+            pattern = _keyword_pattern(tuple(keywords))
+            if seen is None:
+                seen = set()
 
             for job in jobs:
-                position = job.get("position", "").lower()
-                tags = [t.lower() for t in job.get("tags", [])]
-                company = job.get("company", "").lower()
-                description = job.get("description", "").lower()
-
-                searchable = f"{position} {' '.join(tags)} {company} {description}"
-
-                if any(kw in searchable for kw in keywords_lower):
+                if limit is not None and len(matched) >= limit:
+                    break
+                searchable = (
+                    f"{job.get('position', '')} {' '.join(job.get('tags', []))} "
+                    f"{job.get('company', '')} {job.get('description', '')}"
+                )
+
+                if pattern and pattern.search(searchable):
+                    key = _job_key(job.get("position", ""), job.get("company", ""))
+                    if key in seen:
+                        continue
+                    seen.add(key)
                     matched.append({
                         "title": job.get("position", ""),
                         "company": job.get("company", ""),
@@ -102,30 +138,40 @@ class JobSearchTool(Tool):
         except requests.RequestException:
             return []
 
-    def _search_arbeitnow(self, keywords: list[str]) -> list[dict]:
-        """Search Arbeitnow for matching jobs."""
+    def _search_arbeitnow(
+        self, keywords: list[str], limit: int | None = None, seen: set | None = None
+    ) -> list[dict]:
+        """Search Arbeitnow for matching jobs (see _search_remoteok for `limit`
+        and `seen`)."""
         try:
             search_query = "+".join(keywords)
-            response = requests.get(
+            response = get_http_session().get(
                 self.SOURCES["arbeitnow"]["url"],
                 params={"search": search_query},
                 timeout=10,
             )
             response.raise_for_status()
-            data = response.json()
+            data = response_json(response)
 
             jobs = data.get("data", [])
             matched = []
-            keywords_lower = [k.lower() for k in keywords]
+            pattern = _keyword_pattern(tuple(keywords))
+            if seen is None:
+                seen = set()
 
             for job in jobs:
-                title = job.get("title", "").lower()
-                description = job.get("description", "").lower()
-                tags = [t.lower() for t in job.get("tags", [])]
-
-                searchable = f"{title} {' '.join(tags)} {description}"
-
-                if any(kw in searchable for kw in keywords_lower):
+                if limit is not None and len(matched) >= limit:
+                    break
+                searchable = (
+                    f"{job.get('title', '')} {' '.join(job.get('tags', []))} "
+                    f"{job.get('description', '')}"
+                )
+
+                if pattern and pattern.search(searchable):
+                    key = _job_key(job.get("title", ""), job.get("company_name", ""))
+                    if key in seen:
+                        continue
+                    seen.add(key)
                     matched.append({
                         "title": job.get("title", ""),
                         "company": job.get("company_name", ""),
@@ -145,28 +191,30 @@ class JobSearchTool(Tool):
         keywords = kwargs["keywords"]
         max_results = kwargs.get("max_results", 10)
 
-        all_jobs = []
-
-        # Search all sources
-        all_jobs.extend(self._search_remoteok(keywords))
-        all_jobs.extend(self._search_arbeitnow(keywords))
+        # Search all sources concurrently; results stay in source order. Each
+        # source stops after max_results jobs that are unique within it. A
+        # later source can only repeat jobs an earlier one contributed, so
+        # the merge below still fills max_results whenever the full lists would.
+        searches = [self._search_remoteok, self._search_arbeitnow]
+        per_source = _SOURCE_POOL.map(
+            lambda search: search(keywords, limit=max_results, seen=set()), searches
+        )
 
-        # Deduplicate by title + company
-        seen = set()
+        # Deduplicate by title + company across sources, stopping at the cap
+        seen: set[tuple[str, str]] = set()
         unique_jobs = []
-        for job in all_jobs:
-            key = f"{job['title'].lower()}|{job['company'].lower()}"
+        for job in chain.from_iterable(per_source):
+            if len(unique_jobs) >= max_results:
+                break
+            key = _job_key(job["title"], job["company"])
             if key not in seen:
                 seen.add(key)
                 unique_jobs.append(job)
 
-        # Limit results
-        results = unique_jobs[:max_results]
-
         return {
             "success": True,
             "total_found": len(unique_jobs),
-            "returned": len(results),
-            "jobs": results,
+            "returned": len(unique_jobs),
+            "jobs": unique_jobs,
             "sources_searched": list(self.SOURCES.keys()),
         }
@@ -1,7 +1,63 @@
+from functools import lru_cache
 from typing import Any
 
 from .base import Tool
 
+_MILESTONE_TEMPLATES = (
+    "Complete introductory material for {skill}",
+    "Build a small project using {skill}",
+    "Apply {skill} in a portfolio project or contribution",
+)
+
+
+@lru_cache(maxsize=512)
+def _mapped_resources(skill_lower: str, level: str) -> tuple[str, ...] | None:
+    """RESOURCE_MAP entry for a skill: exact key first, then the first key
+    that contains or is contained in it. None when nothing matches.
+
+    The same skills recur across users, so each lookup is done once.
+    """
+    resource_map = LearningPathTool.RESOURCE_MAP
+    resources = resource_map.get(skill_lower)
+    if resources is None:
+        resources = next(
+            (r for key, r in resource_map.items() if key in skill_lower or skill_lower in key),
+            None,
+        )
+    if resources is None:
+        return None
+    return tuple(resources.get(level, []))
+
+
+@lru_cache(maxsize=1024)
+def _starting_level(skill_lower: str, known: frozenset[str]) -> str:
+    """'intermediate' when `known` (lowercased skills) includes one related
+    to the skill, else 'beginner'."""
+    group_id = LearningPathTool._SKILL_TO_GROUP.get(skill_lower)
+    if group_id is not None and not LearningPathTool._RELATED_GROUPS[group_id].isdisjoint(known):
+        return "intermediate"
+    return "beginner"
+
+
+@lru_cache(maxsize=1024)
+def _estimated_hours(skill_lower: str, level: str) -> int:
+    """Learning hours for a skill by complexity tier and starting level."""
+    tool = LearningPathTool
+    # Most skills are one word, so a set intersection settles the common
+    # case before any substring scan
+    words = skill_lower.split()
+    if not tool._COMPLEX_SKILLS.isdisjoint(words) or any(
+        cs in skill_lower for cs in tool._COMPLEX_SKILLS
+    ):
+        base_hours = tool._COMPLEX_HOURS
+    elif not tool._MODERATE_SKILLS.isdisjoint(words) or any(
+        ms in skill_lower for ms in tool._MODERATE_SKILLS
+    ):
+        base_hours = tool._MODERATE_HOURS
+    else:
+        base_hours = tool._BASIC_HOURS
+    return base_hours.get(level, 30)
+
 
 class LearningPathTool(Tool):
     """Generates a structured learning path based on skill gaps.
@@ -65,84 +121,83 @@ class LearningPathTool(Tool):
         },
     }
 
-    @property
-    def name(self) -> str:
-        return "generate_learning_path"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Generate a structured learning path based on skill gaps. "
-            "Creates a prioritized study plan with specific resources, "
-            "estimated timeframes, and milestones for each missing skill."
-        )
+    # Skills that transfer to each other; knowing one lets you start the
+    # others at intermediate
+    _RELATED_GROUPS: tuple[frozenset[str], ...] = (
+        frozenset({"python", "django", "flask", "fastapi"}),
+        frozenset({"javascript", "typescript", "react", "vue", "angular", "node"}),
+        frozenset({"java", "spring", "kotlin"}),
+        frozenset({"aws", "gcp", "azure", "cloud"}),
+        frozenset({"docker", "kubernetes", "devops"}),
+        frozenset({"sql", "postgresql", "mysql", "mongodb", "database"}),
+        frozenset({"machine learning", "deep learning", "ai", "tensorflow", "pytorch"}),
+    )
+    _SKILL_TO_GROUP: dict[str, int] = {
+        skill: i for i, group in enumerate(_RELATED_GROUPS) for skill in group
+    }
 
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "missing_skills": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Skills the candidate needs to learn (from gap analysis)",
-                },
-                "current_skills": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Skills the candidate already has (for context)",
-                    "default": [],
-                },
-                "target_role": {
-                    "type": "string",
-                    "description": "The role the candidate is targeting",
-                    "default": "",
-                },
-                "available_hours_per_week": {
-                    "type": "integer",
-                    "description": "Hours per week available for learning",
-                    "default": 10,
-                },
+    # Learning-time tiers, matched as substrings of the skill name
+    _COMPLEX_SKILLS = frozenset({
+        "kubernetes", "system design", "machine learning", "deep learning",
+        "distributed systems", "aws", "gcp", "azure",
+    })
+    _MODERATE_SKILLS = frozenset({
+        "react", "typescript", "docker", "sql", "graphql", "redux",
+        "python", "java", "go", "rust",
+    })
+    _COMPLEX_HOURS = {"beginner": 80, "intermediate": 50, "advanced": 100}
+    _MODERATE_HOURS = {"beginner": 40, "intermediate": 25, "advanced": 60}
+    _BASIC_HOURS = {"beginner": 20, "intermediate": 15, "advanced": 40}
+
+    name = "generate_learning_path"
+
+    description = (
+        "Generate a structured learning path based on skill gaps. "
+        "Creates a prioritized study plan with specific resources, "
+        "estimated timeframes, and milestones for each missing skill."
+    )
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "missing_skills": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Skills the candidate needs to learn (from gap analysis)",
             },
-            "required": ["missing_skills"],
-        }
+            "current_skills": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Skills the candidate already has (for context)",
+                "default": [],
+            },
+            "target_role": {
+                "type": "string",
+                "description": "The role the candidate is targeting",
+                "default": "",
+            },
+            "available_hours_per_week": {
+                "type": "integer",
+                "description": "Hours per week available for learning",
+                "default": 10,
+            },
+        },
+        "required": ["missing_skills"],
+    }
 
-    def _determine_level(self, skill: str, current_skills: list[str]) -> str:
-        """Determine what level to start at based on related skills."""
-        skill_lower = skill.lower()
-        current_lower = [s.lower() for s in current_skills]
+    def _determine_level(self, skill: str, known: frozenset[str]) -> str:
+        """Determine what level to start at based on related skills.
 
+        `known` is the candidate's current skills, lowercased.
+        """
         # If they know related technologies, they can start at intermediate
-        related_groups = [
-            {"python", "django", "flask", "fastapi"},
-            {"javascript", "typescript", "react", "vue", "angular", "node"},
-            {"java", "spring", "kotlin"},
-            {"aws", "gcp", "azure", "cloud"},
-            {"docker", "kubernetes", "devops"},
-            {"sql", "postgresql", "mysql", "mongodb", "database"},
-            {"machine learning", "deep learning", "ai", "tensorflow", "pytorch"},
-        ]
-
-        for group in related_groups:
-            if skill_lower in group:
-                overlap = group.intersection(set(current_lower))
-                if overlap:
-                    return "intermediate"
-
-        return "beginner"
+        return _starting_level(skill.lower(), known)
 
     def _get_resources(self, skill: str, level: str) -> list[str]:
         """Get learning resources for a skill at a given level."""
-        skill_lower = skill.lower()
-
-        # Try exact match first
-        if skill_lower in self.RESOURCE_MAP:
-            return self.RESOURCE_MAP[skill_lower].get(level, [])
-
-        # Try partial match
-        for key, resources in self.RESOURCE_MAP.items():
-            if key in skill_lower or skill_lower in key:
-                return resources.get(level, [])
+        resources = _mapped_resources(skill.lower(), level)
+        if resources is not None:
+            return list(resources)
 
         # Generic resources
         return [
@@ -153,26 +208,7 @@ class LearningPathTool(Tool):
 
     def _estimate_time(self, skill: str, level: str) -> dict[str, Any]:
         """Estimate learning time based on skill complexity and starting level."""
-        # Base hours by complexity
-        complex_skills = {
-            "kubernetes", "system design", "machine learning", "deep learning",
-            "distributed systems", "aws", "gcp", "azure",
-        }
-        moderate_skills = {
-            "react", "typescript", "docker", "sql", "graphql", "redux",
-            "python", "java", "go", "rust",
-        }
-
-        skill_lower = skill.lower()
-        if any(cs in skill_lower for cs in complex_skills):
-            base_hours = {"beginner": 80, "intermediate": 50, "advanced": 100}
-        elif any(ms in skill_lower for ms in moderate_skills):
-            base_hours = {"beginner": 40, "intermediate": 25, "advanced": 60}
-        else:
-            base_hours = {"beginner": 20, "intermediate": 15, "advanced": 40}
-
-        hours = base_hours.get(level, 30)
-        return {"estimated_hours": hours, "starting_level": level}
+        return {"estimated_hours": _estimated_hours(skill.lower(), level), "starting_level": level}
 
     def execute(self, **kwargs) -> dict[str, Any]:
         missing_skills = kwargs["missing_skills"]
@@ -182,10 +218,11 @@ class LearningPathTool(Tool):
 
         learning_paths = []
         total_hours = 0
+        known = frozenset(s.lower() for s in current_skills)
 
         # Prioritize: required skills first, sorted by estimated learning time
         for priority, skill in enumerate(missing_skills, 1):
-            level = self._determine_level(skill, current_skills)
+            level = self._determine_level(skill, known)
             resources = self._get_resources(skill, level)
             time_est = self._estimate_time(skill, level)
             weeks = max(1, round(time_est["estimated_hours"] / hours_per_week))
@@ -199,11 +236,7 @@ class LearningPathTool(Tool):
                 "estimated_hours": time_est["estimated_hours"],
                 "estimated_weeks": weeks,
                 "resources": resources,
-                "milestones": [
-                    f"Complete introductory material for {skill}",
-                    f"Build a small project using {skill}",
-                    f"Apply {skill} in a portfolio project or contribution",
-                ],
+                "milestones": [t.format(skill=skill) for t in _MILESTONE_TEMPLATES],
             })
 
         total_weeks = max(1, round(total_hours / hours_per_week))
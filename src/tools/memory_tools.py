@@ -4,52 +4,76 @@ These tools give agents the ability to recall past memories, store new ones,
 and review past work traces — all during their ReAct loop.
 """
 
+import threading
+from collections import OrderedDict
 from typing import Any
 
 from .base import Tool
 from .. import database as db
 from ..episodic_memory import EpisodicMemory
 
+# Bumped per user whenever StoreMemoryTool saves a memory, so cached recall
+# results from before the save are not served afterwards
+_memory_generation: dict[int, int] = {}
+_generation_lock = threading.Lock()
+
+
+def _generation(user_id: int) -> int:
+    with _generation_lock:
+        return _memory_generation.get(user_id, 0)
+
+
+def _bump_generation(user_id: int) -> None:
+    with _generation_lock:
+        _memory_generation[user_id] = _memory_generation.get(user_id, 0) + 1
+
 
 class RecallMemoryTool(Tool):
     """Tool for recalling user memories during agent execution."""
 
+    name = "recall_memory"
+
+    description = (
+        "Search the user's memory for relevant past information. "
+        "Returns facts, preferences, goals, and outcomes from previous conversations. "
+        "Use this when you need context about the user's background, preferences, or past results."
+    )
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Search term to find relevant memories (e.g. 'Python skills', 'target company', 'ATS score')",
+            },
+            "category": {
+                "type": "string",
+                "enum": ["fact", "preference", "goal", "outcome"],
+                "description": "Optional: filter by memory category",
+            },
+        },
+        "required": ["query"],
+    }
+
+    # Agents in a ReAct loop often repeat a query; a hit skips the query
+    # embedding and the search
+    SEARCH_CACHE_SIZE = 64
+
     def __init__(self):
         self._user_id: int | None = None
+        # (user_id, normalised query) -> (memory generation, results)
+        self._cache: OrderedDict[tuple[int, str], tuple[int, list[dict]]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._memory: EpisodicMemory | None = None  # built on first search, per user
 
     def set_user_id(self, user_id: int) -> None:
+        if user_id != self._user_id:
+            self._memory = None
+            with self._cache_lock:
+                for key in [key for key in self._cache if key[0] == self._user_id]:
+                    del self._cache[key]
         self._user_id = user_id
 
-    @property
-    def name(self) -> str:
-        return "recall_memory"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Search the user's memory for relevant past information. "
-            "Returns facts, preferences, goals, and outcomes from previous conversations. "
-            "Use this when you need context about the user's background, preferences, or past results."
-        )
-
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "Search term to find relevant memories (e.g. 'Python skills', 'target company', 'ATS score')",
-                },
-                "category": {
-                    "type": "string",
-                    "enum": ["fact", "preference", "goal", "outcome"],
-                    "description": "Optional: filter by memory category",
-                },
-            },
-            "required": ["query"],
-        }
-
     def execute(self, **kwargs) -> dict[str, Any]:
         if not self._user_id:
             return {"success": False, "error": "No user context available"}
@@ -58,9 +82,7 @@ class RecallMemoryTool(Tool):
         category = kwargs.get("category")
 
         if query:
-            # Use EpisodicMemory.search() for semantic search when available
-            memory = EpisodicMemory(self._user_id)
-            memories = memory.search(query, limit=10)
+            return self._search(query)
         elif category:
             memories = db.get_memories(self._user_id, category=category, limit=10)
         else:
@@ -80,46 +102,74 @@ class RecallMemoryTool(Tool):
             "count": len(results),
         }
 
+    def _search(self, query: str) -> dict[str, Any]:
+        """Search memories for a query, reusing results for a repeated query."""
+        key = (self._user_id, query.strip().lower())
+        generation = _generation(self._user_id)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached and cached[0] == generation:
+                self._cache.move_to_end(key)
+        if cached and cached[0] == generation:
+            results = cached[1]
+        else:
+            # Use EpisodicMemory.search() for semantic search when available
+            if self._memory is None:
+                self._memory = EpisodicMemory(self._user_id)
+            results = [
+                {
+                    "content": mem["content"],
+                    "category": mem["category"],
+                    "created_at": mem.get("created_at", ""),
+                }
+                for mem in self._memory.search(query, limit=10)
+            ]
+            with self._cache_lock:
+                self._cache[key] = (generation, results)
+                self._cache.move_to_end(key)
+                if len(self._cache) > self.SEARCH_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+
+        return {
+            "success": True,
+            "memories": [dict(r) for r in results],
+            "count": len(results),
+        }
+
 
 class StoreMemoryTool(Tool):
     """Tool for storing new memories during agent execution."""
 
+    name = "store_memory"
+
+    description = (
+        "Store an important fact or observation about the user for future reference. "
+        "Use this when you discover something worth remembering — skills, preferences, "
+        "job search results, ATS scores, interview outcomes, etc."
+    )
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "content": {
+                "type": "string",
+                "description": "The fact or observation to remember (be specific and concise)",
+            },
+            "category": {
+                "type": "string",
+                "enum": ["fact", "preference", "goal", "outcome"],
+                "description": "Category: fact (objective info), preference (user likes/dislikes), goal (career targets), outcome (results of actions)",
+            },
+        },
+        "required": ["content", "category"],
+    }
+
     def __init__(self):
         self._user_id: int | None = None
 
     def set_user_id(self, user_id: int) -> None:
         self._user_id = user_id
 
-    @property
-    def name(self) -> str:
-        return "store_memory"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Store an important fact or observation about the user for future reference. "
-            "Use this when you discover something worth remembering — skills, preferences, "
-            "job search results, ATS scores, interview outcomes, etc."
-        )
-
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "content": {
-                    "type": "string",
-                    "description": "The fact or observation to remember (be specific and concise)",
-                },
-                "category": {
-                    "type": "string",
-                    "enum": ["fact", "preference", "goal", "outcome"],
-                    "description": "Category: fact (objective info), preference (user likes/dislikes), goal (career targets), outcome (results of actions)",
-                },
-            },
-            "required": ["content", "category"],
-        }
-
     def execute(self, **kwargs) -> dict[str, Any]:
         if not self._user_id:
             return {"success": False, "error": "No user context available"}
@@ -139,6 +189,7 @@ class StoreMemoryTool(Tool):
             content=content,
             category=category,
         )
+        _bump_generation(self._user_id)
 
         return {
             "success": True,
@@ -150,42 +201,36 @@ class StoreMemoryTool(Tool):
 class RecallTraceTool(Tool):
     """Tool for recalling past agent work traces."""
 
+    name = "recall_past_work"
+
+    description = (
+        "Review summaries of past agent runs for this user. "
+        "Shows what agents did previously, what tools were used, and outcomes. "
+        "Useful for avoiding redundant work or building on past results."
+    )
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "agent_name": {
+                "type": "string",
+                "enum": ["scout", "match", "forge", "coach"],
+                "description": "Optional: filter by agent type",
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Number of past runs to retrieve (default 5, max 10)",
+            },
+        },
+        "required": [],
+    }
+
     def __init__(self):
         self._user_id: int | None = None
 
     def set_user_id(self, user_id: int) -> None:
         self._user_id = user_id
 
-    @property
-    def name(self) -> str:
-        return "recall_past_work"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Review summaries of past agent runs for this user. "
-            "Shows what agents did previously, what tools were used, and outcomes. "
-            "Useful for avoiding redundant work or building on past results."
-        )
-
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "agent_name": {
-                    "type": "string",
-                    "enum": ["scout", "match", "forge", "coach"],
-                    "description": "Optional: filter by agent type",
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "Number of past runs to retrieve (default 5, max 10)",
-                },
-            },
-            "required": [],
-        }
-
     def execute(self, **kwargs) -> dict[str, Any]:
         if not self._user_id:
             return {"success": False, "error": "No user context available"}
@@ -193,13 +238,7 @@ class RecallTraceTool(Tool):
         agent_name = kwargs.get("agent_name")
         limit = min(kwargs.get("limit", 5), 10)
 
-        traces = db.get_traces(self._user_id, limit=20)
-
-        # Filter by agent if specified
-        if agent_name:
-            traces = [t for t in traces if t.get("agent_name") == agent_name]
-
-        traces = traces[:limit]
+        traces = db.get_traces(self._user_id, limit=limit, agent_name=agent_name)
 
         results = []
         for trace in traces:
@@ -1,7 +1,95 @@
+import random
+import re
 from typing import Any
 
 from .base import Tool
 
+# Private generator for picking questions, independent of the global one
+_RNG = random.Random()
+
+# Question pools by (type, difficulty). {role}, {skill} and {skills} are filled
+# in from the request once a question has been picked.
+_QUESTIONS: dict[tuple[str, str], tuple[str, ...]] = {
+    ("behavioral", "easy"): (
+        "Tell me about a project you're proud of. What was your role and what did you accomplish?",
+        "Describe a time you had to learn something new quickly. How did you approach it?",
+        "Tell me about a time you received constructive feedback. How did you respond?",
+    ),
+    ("behavioral", "medium"): (
+        "Describe a situation where you had to make a difficult technical decision with incomplete information. What was the outcome?",
+        "Tell me about a time you disagreed with your team lead on an approach. How did you handle it?",
+        "Give me an example of a time you had to balance speed with quality. What trade-offs did you make?",
+    ),
+    ("behavioral", "hard"): (
+        "Tell me about the most complex cross-team project you've led. How did you coordinate across teams and handle conflicting priorities?",
+        "Describe a situation where a project you owned was failing. What did you do to turn it around?",
+        "Tell me about a time you had to push back on a product requirement you believed was wrong. What happened?",
+    ),
+    ("technical", "easy"): (
+        "Explain what {skill} is and when you would use it.",
+        "What's the difference between a SQL and NoSQL database? When would you choose each?",
+        "Explain the concept of version control and why it's important in software development.",
+    ),
+    ("technical", "medium"): (
+        "How would you design the architecture for a {role} project using {skills}?",
+        "Explain how you would handle error handling and logging in a production system.",
+        "Describe your approach to writing testable code. What patterns do you follow?",
+    ),
+    ("technical", "hard"): (
+        "Design a scalable system that handles 10M daily active users for a {role} application. Walk me through your architecture decisions.",
+        "How would you debug a production issue where response times have increased 10x but CPU and memory look normal?",
+        "Explain the CAP theorem and how it applies to a distributed system you've worked on.",
+    ),
+    ("situational", "easy"): (
+        "If a stakeholder asked you to skip code review to meet a deadline, what would you do?",
+        "Your teammate's PR has been open for 3 days. How do you approach giving feedback?",
+    ),
+    ("situational", "medium"): (
+        "You discover a security vulnerability in production. The fix will take 2 days but you have a demo tomorrow. What do you do?",
+        "Your team is split 50/50 on a technical approach. Both have valid trade-offs. How do you move forward?",
+    ),
+    ("situational", "hard"): (
+        "You've been asked to rewrite a legacy system that 5 teams depend on. How do you plan and execute this?",
+        "A critical service your team owns goes down at 2 AM. Walk me through your incident response.",
+    ),
+    ("system_design", "easy"): (
+        "Design a URL shortener service. What components would you need?",
+        "Design a simple task management API. What endpoints and data models would you use?",
+    ),
+    ("system_design", "medium"): (
+        "Design a real-time chat application. How would you handle message delivery, storage, and presence?",
+        "Design a job queue system that handles retries, dead letters, and priority ordering.",
+    ),
+    ("system_design", "hard"): (
+        "Design a distributed rate limiter that works across multiple data centers.",
+        "Design a news feed system similar to Twitter/X that handles 100M users with real-time updates.",
+    ),
+}
+
+_TIPS = {
+    "behavioral": "Use the STAR method: Situation, Task, Action, Result. Be specific with numbers and outcomes.",
+    "technical": "Think out loud. Start with high-level approach, then dive into details. It's OK to say 'I'd need to research that.'",
+    "situational": "Show your decision-making process. Explain trade-offs and how you'd communicate with stakeholders.",
+    "system_design": "Start with requirements and constraints. Draw the high-level architecture first, then drill into components.",
+}
+
+# Phrases that signal each part of a STAR answer
+_STAR_INDICATORS = {
+    "situation": ("when", "while", "during", "at my", "at the", "in my role", "project", "team"),
+    "task": ("needed to", "had to", "responsible for", "goal was", "challenge was", "tasked with", "objective"),
+    "action": ("i built", "i created", "i designed", "i led", "i implemented", "i decided", "i proposed", "i wrote", "i developed", "i analyzed"),
+    "result": ("resulted in", "led to", "improved", "reduced", "increased", "saved", "achieved", "delivered", "%", "percent"),
+}
+# One named group per STAR part, inside a lookahead so that a match never
+# consumes text another part's phrase overlaps (e.g. "i led to")
+_STAR_PATTERN = re.compile(
+    "(?=" + "|".join(
+        f"(?P<{part}>" + "|".join(re.escape(w) for w in words) + ")"
+        for part, words in _STAR_INDICATORS.items()
+    ) + ")",
+    re.IGNORECASE,
+)
+
 
 class MockInterviewTool(Tool):
     """Conducts a mock interview session by generating questions and evaluating answers.
@@ -18,175 +106,91 @@ class MockInterviewTool(Tool):
         "result": "Did the answer include measurable results or outcomes?",
     }
 
-    @property
-    def name(self) -> str:
-        return "mock_interview"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Conduct a mock interview session. Can generate interview questions "
-            "for a specific role, or evaluate a candidate's answer to a question "
-            "using the STAR method and provide detailed feedback with suggestions."
-        )
-
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "mode": {
-                    "type": "string",
-                    "description": "Mode: 'generate_question' to get a new question, 'evaluate_answer' to critique an answer",
-                    "enum": ["generate_question", "evaluate_answer"],
-                },
-                "role_title": {
-                    "type": "string",
-                    "description": "The job title for the mock interview",
-                },
-                "question_type": {
-                    "type": "string",
-                    "description": "Type of question: 'technical', 'behavioral', 'situational', 'system_design'",
-                    "default": "behavioral",
-                },
-                "difficulty": {
-                    "type": "string",
-                    "description": "Difficulty level: 'easy', 'medium', 'hard'",
-                    "default": "medium",
-                },
-                "question": {
-                    "type": "string",
-                    "description": "The interview question (required for evaluate_answer mode)",
-                    "default": "",
-                },
-                "answer": {
-                    "type": "string",
-                    "description": "The candidate's answer to evaluate (required for evaluate_answer mode)",
-                    "default": "",
-                },
-                "required_skills": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Skills required for the role (for question generation)",
-                    "default": [],
-                },
+    name = "mock_interview"
+
+    description = (
+        "Conduct a mock interview session. Can generate interview questions "
+        "for a specific role, or evaluate a candidate's answer to a question "
+        "using the STAR method and provide detailed feedback with suggestions."
+    )
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "mode": {
+                "type": "string",
+                "description": "Mode: 'generate_question' to get a new question, 'evaluate_answer' to critique an answer",
+                "enum": ["generate_question", "evaluate_answer"],
             },
-            "required": ["mode", "role_title"],
-        }
-
-    def _generate_question(
-        self, role: str, q_type: str, difficulty: str, skills: list[str]
-    ) -> dict[str, Any]:
-        """Generate a single interview question."""
-        questions = {
-            "behavioral": {
-                "easy": [
-                    "Tell me about a project you're proud of. What was your role and what did you accomplish?",
-                    "Describe a time you had to learn something new quickly. How did you approach it?",
-                    "Tell me about a time you received constructive feedback. How did you respond?",
-                ],
-                "medium": [
-                    "Describe a situation where you had to make a difficult technical decision with incomplete information. What was the outcome?",
-                    "Tell me about a time you disagreed with your team lead on an approach. How did you handle it?",
-                    "Give me an example of a time you had to balance speed with quality. What trade-offs did you make?",
-                ],
-                "hard": [
-                    "Tell me about the most complex cross-team project you've led. How did you coordinate across teams and handle conflicting priorities?",
-                    "Describe a situation where a project you owned was failing. What did you do to turn it around?",
-                    "Tell me about a time you had to push back on a product requirement you believed was wrong. What happened?",
-                ],
+            "role_title": {
+                "type": "string",
+                "description": "The job title for the mock interview",
             },
-            "technical": {
-                "easy": [
-                    f"Explain what {skills[0] if skills else 'REST APIs'} is and when you would use it.",
-                    "What's the difference between a SQL and NoSQL database? When would you choose each?",
-                    "Explain the concept of version control and why it's important in software development.",
-                ],
-                "medium": [
-                    f"How would you design the architecture for a {role.lower()} project using {', '.join(skills[:3]) if skills else 'modern technologies'}?",
-                    "Explain how you would handle error handling and logging in a production system.",
-                    "Describe your approach to writing testable code. What patterns do you follow?",
-                ],
-                "hard": [
-                    f"Design a scalable system that handles 10M daily active users for a {role.lower()} application. Walk me through your architecture decisions.",
-                    "How would you debug a production issue where response times have increased 10x but CPU and memory look normal?",
-                    "Explain the CAP theorem and how it applies to a distributed system you've worked on.",
-                ],
+            "question_type": {
+                "type": "string",
+                "description": "Type of question: 'technical', 'behavioral', 'situational', 'system_design'",
+                "default": "behavioral",
             },
-            "situational": {
-                "easy": [
-                    "If a stakeholder asked you to skip code review to meet a deadline, what would you do?",
-                    "Your teammate's PR has been open for 3 days. How do you approach giving feedback?",
-                ],
-                "medium": [
-                    "You discover a security vulnerability in production. The fix will take 2 days but you have a demo tomorrow. What do you do?",
-                    "Your team is split 50/50 on a technical approach. Both have valid trade-offs. How do you move forward?",
-                ],
-                "hard": [
-                    "You've been asked to rewrite a legacy system that 5 teams depend on. How do you plan and execute this?",
-                    "A critical service your team owns goes down at 2 AM. Walk me through your incident response.",
-                ],
+            "difficulty": {
+                "type": "string",
+                "description": "Difficulty level: 'easy', 'medium', 'hard'",
+                "default": "medium",
             },
-            "system_design": {
-                "easy": [
-                    "Design a URL shortener service. What components would you need?",
-                    "Design a simple task management API. What endpoints and data models would you use?",
-                ],
-                "medium": [
-                    "Design a real-time chat application. How would you handle message delivery, storage, and presence?",
-                    "Design a job queue system that handles retries, dead letters, and priority ordering.",
-                ],
-                "hard": [
-                    "Design a distributed rate limiter that works across multiple data centers.",
-                    "Design a news feed system similar to Twitter/X that handles 100M users with real-time updates.",
-                ],
+            "question": {
+                "type": "string",
+                "description": "The interview question (required for evaluate_answer mode)",
+                "default": "",
             },
-        }
-
-        q_list = questions.get(q_type, questions["behavioral"]).get(difficulty, questions["behavioral"]["medium"])
-
-        import random
-        question = random.choice(q_list)
+            "answer": {
+                "type": "string",
+                "description": "The candidate's answer to evaluate (required for evaluate_answer mode)",
+                "default": "",
+            },
+            "required_skills": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Skills required for the role (for question generation)",
+                "default": [],
+            },
+        },
+        "required": ["mode", "role_title"],
+    }
 
-        tips = {
-            "behavioral": "Use the STAR method: Situation, Task, Action, Result. Be specific with numbers and outcomes.",
-            "technical": "Think out loud. Start with high-level approach, then dive into details. It's OK to say 'I'd need to research that.'",
-            "situational": "Show your decision-making process. Explain trade-offs and how you'd communicate with stakeholders.",
-            "system_design": "Start with requirements and constraints. Draw the high-level architecture first, then drill into components.",
-        }
+    def _generate_question(
+        self, role: str, q_type: str, difficulty: str, skills: list[str]
+    ) -> dict[str, Any]:
+        """Generate a single interview question."""
+        q_list = (
+            _QUESTIONS.get((q_type, difficulty))
+            or _QUESTIONS.get(("behavioral", difficulty))
+            or _QUESTIONS[("behavioral", "medium")]
+        )
+        question = _RNG.choice(q_list).format(
+            role=role.lower(),
+            skill=skills[0] if skills else "REST APIs",
+            skills=", ".join(skills[:3]) if skills else "modern technologies",
+        )
 
         return {
             "question": question,
             "type": q_type,
             "difficulty": difficulty,
-            "tip": tips.get(q_type, "Be specific and use real examples from your experience."),
+            "tip": _TIPS.get(q_type, "Be specific and use real examples from your experience."),
         }
 
     def _evaluate_answer(
         self, question: str, answer: str, role: str
     ) -> dict[str, Any]:
         """Evaluate a candidate's answer using STAR method criteria."""
-        answer_lower = answer.lower()
         word_count = len(answer.split())
 
-        # STAR evaluation
-        star_scores = {}
-
-        # Situation indicators
-        situation_words = ["when", "while", "during", "at my", "at the", "in my role", "project", "team"]
-        star_scores["situation"] = any(w in answer_lower for w in situation_words)
-
-        # Task indicators
-        task_words = ["needed to", "had to", "responsible for", "goal was", "challenge was", "tasked with", "objective"]
-        star_scores["task"] = any(w in answer_lower for w in task_words)
-
-        # Action indicators
-        action_words = ["i built", "i created", "i designed", "i led", "i implemented", "i decided", "i proposed", "i wrote", "i developed", "i analyzed"]
-        star_scores["action"] = any(w in answer_lower for w in action_words)
-
-        # Result indicators
-        result_words = ["resulted in", "led to", "improved", "reduced", "increased", "saved", "achieved", "delivered", "%", "percent"]
-        star_scores["result"] = any(w in answer_lower for w in result_words)
+        # STAR evaluation: one scan of the answer, stopping once all four
+        # parts have been seen
+        star_scores = dict.fromkeys(_STAR_INDICATORS, False)
+        for match in _STAR_PATTERN.finditer(answer):
+            star_scores[match.lastgroup] = True
+            if all(star_scores.values()):
+                break
 
         # Calculate score
         star_count = sum(1 for v in star_scores.values() if v)
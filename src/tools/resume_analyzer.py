@@ -3,6 +3,14 @@ from typing import Any
 
 from .base import Tool
 
+_SECTION_MARKERS = frozenset({
+    "experience", "education", "skills", "projects",
+    "certifications", "summary", "objective", "awards",
+    "publications", "languages", "technical skills",
+    "work experience", "professional experience",
+})
+_LONGEST_MARKER = max(map(len, _SECTION_MARKERS))
+
 
 class ResumeAnalyzerTool(Tool):
     """Reads and structures resume content for analysis.
@@ -11,30 +19,29 @@ class ResumeAnalyzerTool(Tool):
     so the agent can compare it against job requirements.
     """
 
-    @property
-    def name(self) -> str:
-        return "analyze_resume"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Analyze resume content. Use when user shares their resume or CV "
-            "and wants feedback on structure, content, or ATS readiness. "
-            "Reads a resume file and extracts structured sections."
-        )
-
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "file_path": {
-                    "type": "string",
-                    "description": "Path to the resume text file",
-                },
+    name = "analyze_resume"
+
+    description = (
+        "Analyze resume content. Use when user shares their resume or CV "
+        "and wants feedback on structure, content, or ATS readiness. "
+        "Reads a resume file and extracts structured sections."
+    )
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "file_path": {
+                "type": "string",
+                "description": "Path to the resume text file",
             },
-            "required": ["file_path"],
-        }
+            "include_sections": {
+                "type": "boolean",
+                "description": "Whether to split the resume into sections (skip when only the text is needed)",
+                "default": True,
+            },
+        },
+        "required": ["file_path"],
+    }
 
     def _extract_sections(self, text: str) -> dict[str, str]:
         """Identify resume sections by common header patterns."""
@@ -42,18 +49,14 @@ class ResumeAnalyzerTool(Tool):
         current_section = "header"
         current_lines = []
 
-        section_markers = [
-            "experience", "education", "skills", "projects",
-            "certifications", "summary", "objective", "awards",
-            "publications", "languages", "technical skills",
-            "work experience", "professional experience",
-        ]
-
         for line in text.split("\n"):
-            stripped = line.strip().lower()
-            # Check if this line is a section header
-            clean = stripped.rstrip(":").rstrip()
-            if clean in section_markers:
+            stripped = line.strip()
+            # Check if this line is a section header. A line longer than any
+            # marker can only be one if trailing colons make up the excess,
+            # so most body lines are ruled out without further copies.
+            if (len(stripped) <= _LONGEST_MARKER or stripped[-1] == ":") and (
+                clean := stripped.lower().rstrip(":").rstrip()
+            ) in _SECTION_MARKERS:
                 if current_lines:
                     sections[current_section] = "\n".join(current_lines).strip()
                 current_section = clean
@@ -68,6 +71,7 @@ class ResumeAnalyzerTool(Tool):
 
     def execute(self, **kwargs) -> dict[str, Any]:
         file_path = kwargs["file_path"]
+        include_sections = kwargs.get("include_sections", True)
 
         if not os.path.exists(file_path):
             return {
@@ -90,11 +94,11 @@ class ResumeAnalyzerTool(Tool):
                 "error": "Resume file is empty",
             }
 
-        sections = self._extract_sections(text)
-
-        return {
+        result = {
             "success": True,
             "raw_text": text[:4000],
-            "sections": sections,
             "char_count": len(text),
         }
+        if include_sections:
+            result["sections"] = self._extract_sections(text)
+        return result
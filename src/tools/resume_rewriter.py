@@ -1,6 +1,38 @@
+import re
+from functools import reduce
+from operator import or_
 from typing import Any
 
 from .base import Tool
+from ..utils.phrase_match import find_phrases, find_phrases_each
+
+_DIGIT = re.compile(r"\d")
+# Passive phrasing worth replacing with an action verb
+_WEAK_PHRASES = (
+    "responsible for", "helped with", "worked on",
+    "assisted in", "involved in", "participated in",
+)
+# Inside a lookahead so overlapping phrases ("assisted involved in") all match
+_WEAK_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(p) for p in _WEAK_PHRASES) + "))"
+)
+
+
+def _keyword_terms(keywords: list[str]) -> list[tuple[str, str, list[str]]]:
+    """(keyword, lowercased, its words longer than 3 chars) for each keyword.
+
+    A keyword matches a bullet directly, or partially through any of its
+    longer words.
+    """
+    return [
+        (kw, kw.lower(), [w for w in kw.lower().split() if len(w) > 3])
+        for kw in keywords
+    ]
+
+
+def _term_phrases(terms: list[tuple[str, str, list[str]]]) -> list[str]:
+    """Every phrase a bullet is searched for on behalf of the keyword terms."""
+    return [kw_lower for _, kw_lower, _ in terms] + [w for _, _, words in terms for w in words]
 
 
 class ResumeRewriterTool(Tool):
@@ -12,69 +44,67 @@ class ResumeRewriterTool(Tool):
     existing experience.
     """
 
-    @property
-    def name(self) -> str:
-        return "rewrite_resume"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Rewrite resume bullet points to better match a job description. "
-            "Takes the candidate's experience and the target JD keywords, "
-            "then produces reframed bullets that emphasize relevant skills "
-            "and use the JD's language. Does not fabricate experience."
-        )
-
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "experience_bullets": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Original resume bullet points to rewrite",
-                },
-                "target_keywords": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Keywords from the target job description",
-                },
-                "role_title": {
-                    "type": "string",
-                    "description": "The job title being applied for",
-                },
-                "candidate_skills": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Skills the candidate actually has",
-                },
+    name = "rewrite_resume"
+
+    description = (
+        "Rewrite resume bullet points to better match a job description. "
+        "Takes the candidate's experience and the target JD keywords, "
+        "then produces reframed bullets that emphasize relevant skills "
+        "and use the JD's language. Does not fabricate experience."
+    )
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "experience_bullets": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Original resume bullet points to rewrite",
             },
-            "required": [
-                "experience_bullets",
-                "target_keywords",
-                "role_title",
-                "candidate_skills",
-            ],
-        }
+            "target_keywords": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Keywords from the target job description",
+            },
+            "role_title": {
+                "type": "string",
+                "description": "The job title being applied for",
+            },
+            "candidate_skills": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Skills the candidate actually has",
+            },
+        },
+        "required": [
+            "experience_bullets",
+            "target_keywords",
+            "role_title",
+            "candidate_skills",
+        ],
+    }
 
     def _find_relevant_keywords(
-        self, bullet: str, keywords: list[str]
+        self,
+        bullet: str,
+        keywords: list[str],
+        terms: list[tuple[str, str, list[str]]] | None = None,
+        present: set[str] | None = None,
     ) -> list[str]:
-        """Find which target keywords could apply to this bullet."""
-        bullet_lower = bullet.lower()
-        relevant = []
-        for kw in keywords:
-            kw_lower = kw.lower()
-            # Direct match
-            if kw_lower in bullet_lower:
-                relevant.append(kw)
-                continue
-            # Partial/related matches
-            words = kw_lower.split()
-            if any(w in bullet_lower for w in words if len(w) > 3):
-                relevant.append(kw)
-        return relevant
+        """Find which target keywords could apply to this bullet.
+
+        execute() passes the keyword terms and the phrases found in the
+        bullet, both worked out once per request; otherwise they are
+        computed here in a single scan of the bullet.
+        """
+        if terms is None:
+            terms = _keyword_terms(keywords)
+        if present is None:
+            present = find_phrases(bullet.lower(), _term_phrases(terms))
+        return [
+            kw for kw, kw_lower, words in terms
+            if kw_lower in present or any(w in present for w in words)
+        ]
 
     def _suggest_reframe(
         self,
@@ -82,8 +112,13 @@ class ResumeRewriterTool(Tool):
         relevant_keywords: list[str],
         all_keywords: list[str],
         skills: list[str],
+        present: set[str] | None = None,
     ) -> dict[str, Any]:
-        """Produce a reframing suggestion for a single bullet."""
+        """Produce a reframing suggestion for a single bullet.
+
+        `present`, when given, must include which _WEAK_PHRASES occur in
+        the lowercased bullet.
+        """
         suggestions = []
 
         # Suggest adding relevant keywords that aren't already present
@@ -98,21 +133,18 @@ class ResumeRewriterTool(Tool):
                 f"Incorporate keywords: {', '.join(keywords_to_add)}"
             )
 
-        # Check for weak language
-        weak_phrases = [
-            "responsible for", "helped with", "worked on",
-            "assisted in", "involved in", "participated in",
-        ]
-        for phrase in weak_phrases:
-            if phrase in bullet_lower:
+        # Check for weak language: one scan, reported in _WEAK_PHRASES order
+        if present is None:
+            present = {m.group(1) for m in _WEAK_PATTERN.finditer(bullet_lower)}
+        for phrase in _WEAK_PHRASES:
+            if phrase in present:
                 suggestions.append(
                     f"Replace '{phrase}' with a strong action verb "
                     f"(built, designed, implemented, led, optimized)"
                 )
 
         # Check for missing metrics
-        import re
-        has_numbers = bool(re.search(r"\d", bullet))
+        has_numbers = bool(_DIGIT.search(bullet))
         if not has_numbers:
             suggestions.append(
                 "Add quantified impact (e.g., 'processing 100k+ records', "
@@ -132,20 +164,32 @@ class ResumeRewriterTool(Tool):
         role = kwargs["role_title"]
         skills = kwargs["candidate_skills"]
 
+        # This request's keywords and the weak phrases are searched for in
+        # all bullets together, once for everything each is checked against
+        terms = _keyword_terms(keywords)
+        found = find_phrases_each(
+            [bullet.lower() for bullet in bullets],
+            _term_phrases(terms) + list(_WEAK_PHRASES),
+        )
+
         rewritten = []
-        for bullet in bullets:
-            relevant = self._find_relevant_keywords(bullet, keywords)
-            result = self._suggest_reframe(bullet, relevant, keywords, skills)
+        for bullet, present in zip(bullets, found):
+            relevant = self._find_relevant_keywords(bullet, keywords, terms, present)
+            result = self._suggest_reframe(bullet, relevant, keywords, skills, present)
             rewritten.append(result)
 
-        # Identify keywords not covered by any bullet
-        all_covered = set()
-        for item in rewritten:
-            all_covered.update(kw.lower() for kw in item["relevant_keywords"])
+        # Identify keywords not covered by any bullet: one bit per distinct
+        # lowercased keyword, OR'd together across the bullets' matches
+        bits = {kw_lower: 1 << i for i, kw_lower in enumerate(dict.fromkeys(t[1] for t in terms))}
+        covered = reduce(
+            or_,
+            (bits[kw.lower()] for item in rewritten for kw in item["relevant_keywords"]),
+            0,
+        )
 
         uncovered_keywords = [
-            kw for kw in keywords
-            if kw.lower() not in all_covered
+            kw for kw, kw_lower, _ in terms
+            if not covered & bits[kw_lower]
         ]
 
         return {
@@ -1,7 +1,45 @@
-import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import numpy as np
+import requests
+
 from .base import Tool
+from ..utils.http_client import get_http_session, response_json
+
+REMOTEOK_URL = "https://remoteok.com/api"
+
+# Both boards are queried side by side; a lookup waits for the slower one
+_SOURCE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="salary-sources")
+
+# RemoteOK serves one feed for every query, so a burst of salary lookups can
+# share a single download and parse of it
+FEED_CACHE_TTL = 600  # seconds
+_feed_cache: dict[str, tuple[float, Any]] = {}  # url -> (expires_at, data)
+# Held across the fetch, so concurrent callers wait for one refresh
+_feed_lock = threading.Lock()
+
+
+def _remoteok_feed() -> Any:
+    """The decoded RemoteOK feed, cached for FEED_CACHE_TTL seconds.
+
+    Raises requests.RequestException on failure; failures are not cached.
+    """
+    with _feed_lock:
+        entry = _feed_cache.get(REMOTEOK_URL)
+        if entry and time.monotonic() < entry[0]:
+            return entry[1]
+        response = get_http_session().get(
+            REMOTEOK_URL,
+            headers={"User-Agent": "KaziAI/1.0"},
+            timeout=10,
+        )
+        response.raise_for_status()
+        data = response_json(response)
+        _feed_cache[REMOTEOK_URL] = (time.monotonic() + FEED_CACHE_TTL, data)
+        return data
 
 
 class SalaryResearchTool(Tool):
@@ -12,52 +50,39 @@ class SalaryResearchTool(Tool):
     market-rate estimates for a given role.
     """
 
-    @property
-    def name(self) -> str:
-        return "research_salary"
+    name = "research_salary"
 
-    @property
-    def description(self) -> str:
-        return (
-            "Research market salary data for a specific role, location, and "
-            "experience level. Pulls from job boards with salary information "
-            "to estimate competitive compensation ranges."
-        )
+    description = (
+        "Research market salary data for a specific role, location, and "
+        "experience level. Pulls from job boards with salary information "
+        "to estimate competitive compensation ranges."
+    )
 
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "role_title": {
-                    "type": "string",
-                    "description": "The job title to research (e.g., 'Senior Backend Engineer')",
-                },
-                "location": {
-                    "type": "string",
-                    "description": "Target location or 'remote' (e.g., 'San Francisco', 'remote')",
-                    "default": "remote",
-                },
-                "experience_level": {
-                    "type": "string",
-                    "description": "Experience level: junior, mid, senior, lead",
-                    "default": "mid",
-                },
+    parameters = {
+        "type": "object",
+        "properties": {
+            "role_title": {
+                "type": "string",
+                "description": "The job title to research (e.g., 'Senior Backend Engineer')",
             },
-            "required": ["role_title"],
-        }
+            "location": {
+                "type": "string",
+                "description": "Target location or 'remote' (e.g., 'San Francisco', 'remote')",
+                "default": "remote",
+            },
+            "experience_level": {
+                "type": "string",
+                "description": "Experience level: junior, mid, senior, lead",
+                "default": "mid",
+            },
+        },
+        "required": ["role_title"],
+    }
 
     def _search_remoteok_salaries(self, keywords: list[str]) -> list[dict]:
         """Search RemoteOK for jobs with salary data."""
         try:
-            headers = {"User-Agent": "KaziAI/1.0"}
-            response = requests.get(
-                "https://remoteok.com/api",
-                headers=headers,
-                timeout=10,
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = _remoteok_feed()
             jobs = data[1:] if len(data) > 1 else []
 
             results = []
@@ -91,13 +116,13 @@ class SalaryResearchTool(Tool):
         """Search Arbeitnow for jobs with salary data."""
         try:
             search_query = "+".join(keywords)
-            response = requests.get(
+            response = get_http_session().get(
                 "https://www.arbeitnow.com/api/job-board-api",
                 params={"search": search_query},
                 timeout=10,
             )
             response.raise_for_status()
-            data = response.json()
+            data = response_json(response)
             jobs = data.get("data", [])
 
             results = []
@@ -123,11 +148,14 @@ class SalaryResearchTool(Tool):
     ) -> dict[str, Any]:
         """Estimate salary range from collected data points."""
         # Extract valid salary values
-        mins = [s["salary_min"] for s in salary_data if s.get("salary_min")]
-        maxs = [s["salary_max"] for s in salary_data if s.get("salary_max")]
-        all_values = mins + maxs
+        mins = np.fromiter(
+            (s["salary_min"] for s in salary_data if s.get("salary_min")), dtype=np.float64
+        )
+        maxs = np.fromiter(
+            (s["salary_max"] for s in salary_data if s.get("salary_max")), dtype=np.float64
+        )
 
-        if not all_values:
+        if not mins.size and not maxs.size:
             return {
                 "estimated_min": None,
                 "estimated_max": None,
@@ -144,12 +172,13 @@ class SalaryResearchTool(Tool):
         }
         mult = multipliers.get(experience_level, 1.0)
 
-        avg_min = sum(mins) / len(mins) if mins else min(all_values)
-        avg_max = sum(maxs) / len(maxs) if maxs else max(all_values)
+        # With only one side reported, the other falls back to its extreme
+        avg_min = mins.mean() if mins.size else maxs.min()
+        avg_max = maxs.mean() if maxs.size else mins.max()
 
-        # Apply experience adjustment
-        est_min = round(avg_min * mult / 1000) * 1000
-        est_max = round(avg_max * mult / 1000) * 1000
+        # Apply experience adjustment, to the nearest thousand
+        est_min = int(round(avg_min * mult / 1000)) * 1000
+        est_max = int(round(avg_max * mult / 1000)) * 1000
 
         data_points = len(salary_data)
         confidence = "high" if data_points >= 10 else "medium" if data_points >= 3 else "low"
@@ -169,10 +198,11 @@ class SalaryResearchTool(Tool):
         # Extract search keywords from role title
         keywords = [w for w in role.split() if len(w) > 2]
 
-        # Search multiple sources
+        # Search multiple sources concurrently; results stay in source order
         salary_data = []
-        salary_data.extend(self._search_remoteok_salaries(keywords))
-        salary_data.extend(self._search_arbeitnow_salaries(keywords))
+        searches = [self._search_remoteok_salaries, self._search_arbeitnow_salaries]
+        for postings in _SOURCE_POOL.map(lambda search: search(keywords), searches):
+            salary_data.extend(postings)
 
         # Filter to jobs with salary info
         with_salary = [s for s in salary_data if s.get("salary_min") or s.get("salary_max")]
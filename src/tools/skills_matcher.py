@@ -1,7 +1,19 @@
+from functools import lru_cache
 from typing import Any
 
 from .base import Tool
 
+# Joins normalized candidate skills into one string for containment checks;
+# skill names never contain it, so no match can span two skills
+_SEPARATOR = "\x00"
+
+
+@lru_cache(maxsize=2048)
+def _normalize_skill(skill: str) -> str:
+    """Lowercased, stripped skill name with aliases resolved."""
+    lowered = skill.lower().strip()
+    return SkillsMatcherTool.SKILL_ALIASES.get(lowered, lowered)
+
 
 class SkillsMatcherTool(Tool):
     """Compares skills between a job description and a resume.
@@ -31,71 +43,95 @@ class SkillsMatcherTool(Tool):
         "ci/cd": "ci cd",
     }
 
-    @property
-    def name(self) -> str:
-        return "match_skills"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Compare required skills from a job description against skills "
-            "found in a resume. Returns matched skills, missing skills, "
-            "and a match score."
-        )
-
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "required_skills": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Skills required by the job description",
-                },
-                "candidate_skills": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Skills the candidate has from their resume",
-                },
-                "preferred_skills": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Nice-to-have skills from the job description",
-                    "default": [],
-                },
+    name = "match_skills"
+
+    description = (
+        "Compare required skills from a job description against skills "
+        "found in a resume. Returns matched skills, missing skills, "
+        "and a match score."
+    )
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "required_skills": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Skills required by the job description",
             },
-            "required": ["required_skills", "candidate_skills"],
-        }
+            "candidate_skills": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Skills the candidate has from their resume",
+            },
+            "preferred_skills": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Nice-to-have skills from the job description",
+                "default": [],
+            },
+        },
+        "required": ["required_skills", "candidate_skills"],
+    }
 
     def _normalize(self, skill: str) -> str:
-        """Normalize a skill name for comparison."""
-        lowered = skill.lower().strip()
-        return self.SKILL_ALIASES.get(lowered, lowered)
-
-    def _find_match(self, skill: str, skill_set: set[str]) -> bool:
-        """Check if a skill matches any skill in the set, accounting for
-        partial matches (e.g., 'python' matches 'python 3')."""
+        """Normalize a skill name for comparison (memoized; the same skill
+        names recur across requests)."""
+        return _normalize_skill(skill)
+
+    def _find_match(
+        self, skill: str, candidates: tuple[frozenset[str], str, dict[str, list[str]]]
+    ) -> bool:
+        """Check if a skill matches any normalized candidate skill, accounting
+        for partial matches (e.g., 'python' matches 'python 3').
+
+        `candidates` comes from _index_candidates.
+        """
         normalized = self._normalize(skill)
-        for candidate in skill_set:
-            candidate_norm = self._normalize(candidate)
-            if normalized == candidate_norm:
-                return True
-            if normalized in candidate_norm or candidate_norm in normalized:
-                return True
-        return False
+        norms, joined, by_prefix = candidates
+        if not norms:
+            return False
+        if normalized in norms:
+            return True
+        # The skill inside a candidate
+        if normalized in joined:
+            return True
+        # A candidate inside the skill: only those starting with one of the
+        # skill's bigrams (or that are one of its characters, or empty) can be
+        keys = {normalized[i:i + 2] for i in range(len(normalized))}
+        keys.update(normalized)
+        keys.add("")
+        return any(
+            cn in normalized
+            for key in keys
+            for cn in by_prefix.get(key, ())
+        )
+
+    def _index_candidates(
+        self, skills: list[str]
+    ) -> tuple[frozenset[str], str, dict[str, list[str]]]:
+        """Normalize the candidate's skills once for every _find_match call.
+
+        Also indexes them by their first two characters, for the check of
+        a candidate skill inside a required one.
+        """
+        norms = frozenset(self._normalize(s) for s in skills)
+        by_prefix: dict[str, list[str]] = {}
+        for cn in norms:
+            by_prefix.setdefault(cn[:2], []).append(cn)
+        return norms, _SEPARATOR.join(norms), by_prefix
 
     def execute(self, **kwargs) -> dict[str, Any]:
         required = kwargs["required_skills"]
         candidate = kwargs["candidate_skills"]
         preferred = kwargs.get("preferred_skills", [])
 
-        candidate_set = set(candidate)
+        candidates = self._index_candidates(candidate)
 
         matched_required = []
         missing_required = []
         for skill in required:
-            if self._find_match(skill, candidate_set):
+            if self._find_match(skill, candidates):
                 matched_required.append(skill)
             else:
                 missing_required.append(skill)
@@ -103,7 +139,7 @@ class SkillsMatcherTool(Tool):
         matched_preferred = []
         missing_preferred = []
         for skill in preferred:
-            if self._find_match(skill, candidate_set):
+            if self._find_match(skill, candidates):
                 matched_preferred.append(skill)
             else:
                 missing_preferred.append(skill)
@@ -1,8 +1,12 @@
 import requests
-from bs4 import BeautifulSoup
 from typing import Any
 
 from .base import Tool
+from ..utils.html_extract import declared_charset, extract_page, read_capped
+from ..utils.http_client import get_http_session
+
+MAX_PAGE_BYTES = 2 * 1024 * 1024  # only the first 6000 chars of text are kept anyway
+MAX_TEXT_CHARS = 6000
 
 
 class WebFetchTool(Tool):
@@ -12,31 +16,25 @@ class WebFetchTool(Tool):
     portfolios, articles, company pages, or any other URL.
     """
 
-    @property
-    def name(self) -> str:
-        return "fetch_url"
-
-    @property
-    def description(self) -> str:
-        return (
-            "Fetch and read content from any URL the user shares. "
-            "Use this when the user pastes a link to a job posting, "
-            "article, portfolio, company page, or any other webpage. "
-            "Returns the page title, description, and main text content."
-        )
-
-    @property
-    def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "url": {
-                    "type": "string",
-                    "description": "The full URL to fetch (must start with http:// or https://)",
-                },
+    name = "fetch_url"
+
+    description = (
+        "Fetch and read content from any URL the user shares. "
+        "Use this when the user pastes a link to a job posting, "
+        "article, portfolio, company page, or any other webpage. "
+        "Returns the page title, description, and main text content."
+    )
+
+    parameters = {
+        "type": "object",
+        "properties": {
+            "url": {
+                "type": "string",
+                "description": "The full URL to fetch (must start with http:// or https://)",
             },
-            "required": ["url"],
-        }
+        },
+        "required": ["url"],
+    }
 
     def _fetch_page(self, url: str) -> dict[str, str] | None:
         """Fetch a webpage and extract structured content."""
@@ -48,30 +46,16 @@ class WebFetchTool(Tool):
             )
         }
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            for tag in soup(["script", "style", "nav", "footer", "header", "aside"]):
-                tag.decompose()
-
-            title = soup.title.string.strip() if soup.title and soup.title.string else ""
-
-            meta_desc = ""
-            meta_tag = soup.find("meta", attrs={"name": "description"})
-            if meta_tag and meta_tag.get("content"):
-                meta_desc = meta_tag["content"]
-
-            body_text = soup.get_text(separator="\n", strip=True)
-            # Collapse excessive blank lines
-            lines = [line for line in body_text.split("\n") if line.strip()]
-            body_text = "\n".join(lines)
+            with get_http_session().get(url, headers=headers, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                content = read_capped(response, MAX_PAGE_BYTES)
+                charset = declared_charset(response)
+            title, meta_desc, body_text = extract_page(content, charset, max_chars=MAX_TEXT_CHARS)
 
             return {
                 "title": title,
                 "description": meta_desc,
-                "content": body_text[:6000],
+                "content": body_text,
             }
         except requests.RequestException:
             return None
@@ -2,12 +2,36 @@
 
 import subprocess
 import json
+from functools import lru_cache
+
+try:
+    import pynvml  # in-process NVML bindings; no nvidia-smi subprocess
+    PYNVML_AVAILABLE = True
+except ImportError:
+    PYNVML_AVAILABLE = False
 
 
 def detect_gpu() -> dict:
-    """Detect available GPU and return info for model selection."""
+    """Detect available GPU and return info for model selection.
+
+    The GPU is probed once per process; each call returns a fresh copy.
+    """
+    return dict(_probe_gpu())
+
+
+@lru_cache(maxsize=1)
+def _probe_gpu() -> dict:
+    """Query the first GPU, through NVML when available, else nvidia-smi.
+
+    Cached: the hardware doesn't change.
+    """
     info = {"gpu_available": False, "name": None, "vram_mb": 0, "driver": None}
 
+    if PYNVML_AVAILABLE:
+        nvml_info = _probe_nvml()
+        if nvml_info is not None:
+            return nvml_info
+
     try:
         result = subprocess.run(
             ["nvidia-smi", "--query-gpu=name,memory.total,driver_version",
@@ -26,6 +50,29 @@ def detect_gpu() -> dict:
     return info
 
 
+def _probe_nvml() -> dict | None:
+    """Read the first GPU's details from NVML; None if NVML can't be used."""
+    try:
+        pynvml.nvmlInit()
+    except pynvml.NVMLError:  # no driver / no GPU
+        return None
+    try:
+        handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+        name = pynvml.nvmlDeviceGetName(handle)
+        driver = pynvml.nvmlSystemGetDriverVersion()
+        return {
+            "gpu_available": True,
+            # Older bindings return bytes
+            "name": name.decode() if isinstance(name, bytes) else name,
+            "vram_mb": pynvml.nvmlDeviceGetMemoryInfo(handle).total // (1024 * 1024),
+            "driver": driver.decode() if isinstance(driver, bytes) else driver,
+        }
+    except pynvml.NVMLError:
+        return None
+    finally:
+        pynvml.nvmlShutdown()
+
+
 def recommend_model(gpu_info: dict) -> str:
     """Recommend an Ollama model based on available VRAM."""
     vram = gpu_info.get("vram_mb", 0)
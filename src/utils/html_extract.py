@@ -0,0 +1,163 @@
+"""Page download and text extraction shared by the tools that read web pages."""
+
+import codecs
+from typing import Iterable
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    from lxml import etree, html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Page chrome dropped before the text is extracted
+STRIPPED_TAGS = ("script", "style", "nav", "footer", "header", "aside")
+
+
+def read_capped(response, max_bytes: int, chunk_size: int = 65536) -> bytes:
+    """Read at most max_bytes of a streamed (stream=True) response body.
+
+    Oversized pages are neither fully downloaded nor held in memory.
+    Transfer compression is undone as the body is read.
+    """
+    chunks = []
+    total = 0
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= max_bytes:
+            break
+    return b"".join(chunks)[:max_bytes]
+
+
+def declared_charset(response) -> str | None:
+    """The charset named in the Content-Type header, if any.
+
+    Only a declared charset is trusted; requests' ISO-8859-1 default for
+    text/* would garble UTF-8 pages.
+    """
+    content_type = response.headers.get("Content-Type", "")
+    return response.encoding if "charset=" in content_type.lower() else None
+
+
+def _known_charset(charset: str | None) -> str | None:
+    """The charset if Python has a codec for it, else None.
+
+    Servers declare labels like "utf8mb4" that no codec exists for.
+    """
+    if charset:
+        try:
+            codecs.lookup(charset)
+        except LookupError:
+            return None
+    return charset
+
+
+def decode_body(content: bytes, charset: str | None) -> str:
+    """Decode a page body with its declared charset, falling back to UTF-8."""
+    return content.decode(_known_charset(charset) or "utf-8", errors="replace")
+
+
+def extract_page(
+    content: bytes,
+    charset: str | None = None,
+    max_chars: int = 6000,
+    stripped_tags: Iterable[str] = STRIPPED_TAGS,
+) -> tuple[str, str, str]:
+    """Return (title, meta description, visible text) for an HTML page.
+
+    Uses the fastest parser installed: selectolax, then lxml, then
+    BeautifulSoup. The text is its non-blank lines, cut to max_chars.
+    """
+    stripped_tags = tuple(stripped_tags)
+    if SELECTOLAX_AVAILABLE:
+        title, meta_desc, body_text = _extract_with_selectolax(decode_body(content, charset), stripped_tags, max_chars)
+    elif LXML_AVAILABLE:
+        # Same decoding as the selectolax path; lxml alone assumes Latin-1
+        # for pages without a <meta> charset
+        utf8 = decode_body(content, charset).encode("utf-8")
+        title, meta_desc, body_text = _extract_with_lxml(utf8, stripped_tags, max_chars)
+    else:
+        title, meta_desc, body_text = _extract_with_soup(content, _known_charset(charset), stripped_tags, max_chars)
+    return title.strip(), meta_desc, body_text[:max_chars]
+
+
+def _join_text(strings: Iterable[str], max_chars: int) -> str:
+    """Newline-join the non-blank strings, stopping once max_chars are collected.
+
+    The caller only keeps that much, so the rest of the page's text nodes
+    are never visited.
+    """
+    parts = []
+    total = 0
+    for text in strings:
+        text = text.strip()
+        if not text:
+            continue
+        parts.append(text)
+        total += len(text) + 1
+        if total > max_chars:  # the joined text (total - 1 chars) is long enough
+            break
+    return "\n".join(parts)
+
+
+def _extract_with_selectolax(html: str, stripped_tags: tuple[str, ...], max_chars: int) -> tuple[str, str, str]:
+    """Extract with the lexbor C parser."""
+    tree = LexborHTMLParser(html)
+    for node in tree.css(",".join(stripped_tags)):
+        node.decompose()
+
+    meta_tag = tree.css_first('meta[name="description"]')
+    meta_desc = (meta_tag.attributes.get("content") or "") if meta_tag else ""
+    title_tag = tree.css_first("title")
+    title = title_tag.text() if title_tag else ""
+    text = tree.root.text(separator="\n", strip=True) if tree.root else ""
+    # Whitespace-only nodes come back as empty lines; get_text(strip=True) drops them
+    body_text = _join_text(text.split("\n"), max_chars)
+    return title, meta_desc, body_text
+
+
+def _extract_with_lxml(content: bytes, stripped_tags: tuple[str, ...], max_chars: int) -> tuple[str, str, str]:
+    """Extract with lxml directly from UTF-8 bytes.
+
+    Parsing and stripping both happen in C; there is no Python-level tree walk.
+    """
+    try:
+        doc = lxml_html.fromstring(content, parser=lxml_html.HTMLParser(encoding="utf-8"))
+    except (etree.ParserError, ValueError):  # empty or unparseable document
+        return "", "", ""
+    etree.strip_elements(doc, *stripped_tags, with_tail=False)
+
+    meta_tag = doc.find('.//meta[@name="description"]')
+    meta_desc = (meta_tag.get("content") or "") if meta_tag is not None else ""
+    title = doc.findtext(".//title") or ""
+    body_text = _join_text(doc.itertext(), max_chars)
+    return title, meta_desc, body_text
+
+
+def _extract_with_soup(
+    content: bytes, charset: str | None, stripped_tags: tuple[str, ...], max_chars: int,
+) -> tuple[str, str, str]:
+    """Extract with BeautifulSoup, imported only when the C parsers are missing."""
+    from bs4 import BeautifulSoup
+
+    # Raw bytes let the parser detect the page encoding when none is declared
+    soup = BeautifulSoup(content, "html.parser", from_encoding=charset)
+
+    # extract() detaches the subtree without tearing it down like decompose()
+    for tag in soup.find_all(stripped_tags):
+        tag.extract()
+
+    meta_desc = ""
+    meta_tag = soup.find("meta", attrs={"name": "description"})
+    if meta_tag and meta_tag.get("content"):
+        meta_desc = meta_tag["content"]
+
+    title = soup.title.string if soup.title and soup.title.string else ""
+    body_text = _join_text(soup.stripped_strings, max_chars)
+    return title, meta_desc, body_text
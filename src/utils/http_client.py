@@ -0,0 +1,42 @@
+"""Shared HTTP session for the tools that call public web APIs."""
+
+from functools import cache
+from typing import Any
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+@cache
+def get_http_session() -> requests.Session:
+    """Return the process-wide requests session.
+
+    Tools are instantiated per agent; one pooled session lets repeat calls
+    to the same host (job boards, the GitHub API) reuse a kept-alive
+    connection instead of paying a new TCP+TLS handshake each time.
+    Per-request headers such as User-Agent are still passed by each call.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def response_json(response: requests.Response) -> Any:
+    """Decode a JSON response body with orjson.
+
+    Several times faster than Response.json() on multi-megabyte job board
+    feeds. Like Response.json(), a malformed body raises a RequestException.
+    """
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.InvalidJSONError(str(e), response=response) from e
+
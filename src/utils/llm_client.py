@@ -0,0 +1,26 @@
+"""Shared OpenAI-compatible clients, one per API key and endpoint."""
+
+from functools import cache
+
+from openai import AsyncOpenAI, OpenAI
+
+
+@cache
+def get_openai_client(api_key: str, base_url: str | None = None) -> OpenAI:
+    """Return the process-wide client for this key/endpoint.
+
+    Agents, the evaluator and memory extraction are created per dispatch;
+    sharing the client lets them reuse pooled HTTP connections instead of
+    opening (and TLS-handshaking) a fresh pool for every request.
+    """
+    if base_url:
+        return OpenAI(api_key=api_key, base_url=base_url)
+    return OpenAI(api_key=api_key)
+
+
+@cache
+def get_async_openai_client(api_key: str, base_url: str | None = None) -> AsyncOpenAI:
+    """Async counterpart of get_openai_client, for the streaming chat path."""
+    if base_url:
+        return AsyncOpenAI(api_key=api_key, base_url=base_url)
+    return AsyncOpenAI(api_key=api_key)
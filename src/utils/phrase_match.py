@@ -0,0 +1,84 @@
+"""Multi-phrase substring search shared by the tools that match keyword lists."""
+
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import Callable
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Joins texts for a combined scan; a phrase without it can't span two texts
+_SEPARATOR = "\x00"
+
+
+@lru_cache(maxsize=256)
+def _keyword_automaton(keywords: tuple[str, ...]):
+    """Aho-Corasick automaton over lowercased keywords, reused per keyword set."""
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+def phrase_matcher(phrases: list[str]) -> Callable[[str], set[str]]:
+    """Build a reusable find_phrases() for a fixed list of lowercased phrases.
+
+    The phrase set is prepared once, so searching many texts for the same
+    phrases only pays for the scans.
+    """
+    always = [p for p in phrases if not p][:1]  # "" is in every string
+    needles = tuple(sorted({p for p in phrases if p}))
+    automaton = _keyword_automaton(needles) if AHOCORASICK_AVAILABLE and needles else None
+
+    def match(text_lower: str) -> set[str]:
+        present = set(always)
+        if automaton is not None:
+            present.update(found for _, found in automaton.iter(text_lower))
+        else:
+            present.update(p for p in needles if p in text_lower)
+        return present
+
+    return match
+
+
+def find_phrases(text_lower: str, phrases: list[str]) -> set[str]:
+    """Return which of the lowercased `phrases` occur as substrings of `text_lower`.
+
+    Uses a single Aho-Corasick pass when pyahocorasick is installed,
+    otherwise one substring search per phrase.
+    """
+    return phrase_matcher(phrases)(text_lower)
+
+
+def find_phrases_each(texts_lower: list[str], phrases: list[str]) -> list[set[str]]:
+    """find_phrases() for each of several texts searched for the same phrases.
+
+    With pyahocorasick every text gets one automaton pass. Without it the
+    texts are joined into one buffer and each phrase is located with
+    str.find(), skipping to the next text after a hit, so the Python-level
+    work grows with the hits rather than with phrases x texts.
+    """
+    needles = {p for p in phrases if p}
+    if AHOCORASICK_AVAILABLE or any(_SEPARATOR in p for p in needles):
+        match = phrase_matcher(phrases)
+        return [match(text_lower) for text_lower in texts_lower]
+
+    always = [p for p in phrases if not p][:1]  # "" is in every string
+    present = [set(always) for _ in texts_lower]
+    if not texts_lower:
+        return present
+    joined = _SEPARATOR.join(texts_lower)
+    # starts[i] is where text i begins in joined; the sentinel closes the last one
+    starts = list(accumulate((len(t) + 1 for t in texts_lower), initial=0))
+    for phrase in needles:
+        pos = joined.find(phrase)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            present[i].add(phrase)
+            pos = joined.find(phrase, starts[i + 1])
+    return present
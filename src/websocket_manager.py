@@ -2,56 +2,172 @@
 
 Replaces 30s polling with persistent WebSocket connections.
 Auth: first message must be {"type": "auth", "token": "..."}.
+
+Celery workers and scheduler threads have no access to the server's sockets
+or event loop, so they push through notify(): the payload is published on a
+Redis channel per user and every server process relays it to the sockets it
+holds. Without Redis, notify() falls back to scheduling the send on this
+process's event loop, which only reaches users connected to this process.
 """
 
-import json
+import asyncio
+import os
+
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 from .auth import get_current_user_from_token
 
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+WS_CHANNEL_PREFIX = "ws:user:"
+# Backoff (seconds) between relay resubscribe attempts while Redis is down
+RELAY_RETRY_MIN = 1.0
+RELAY_RETRY_MAX = 30.0
+
+_publisher = None
+_publisher_checked = False
+
+
+def _get_publisher():
+    """Return a connected Redis client for publishing, or None if Redis is unavailable."""
+    global _publisher, _publisher_checked
+    if _publisher_checked:
+        return _publisher
+    _publisher_checked = True
+    try:
+        import redis
+        client = redis.Redis.from_url(REDIS_URL, socket_timeout=0.5, socket_connect_timeout=0.5)
+        client.ping()
+        _publisher = client
+    except Exception:
+        print("[ws] Redis unavailable, notifications only reach this process")
+        _publisher = None
+    return _publisher
+
+
+def _encode(data: dict) -> str:
+    """Encode a message as compact UTF-8 JSON text, like WebSocket.send_json()."""
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 class ConnectionManager:
     """Manages active WebSocket connections per user."""
 
     def __init__(self):
-        self._connections: dict[int, list[WebSocket]] = {}  # user_id -> [ws, ...]
+        self._connections: dict[int, set[WebSocket]] = {}  # user_id -> {ws, ...}
+        self._loop: asyncio.AbstractEventLoop | None = None  # set by relay_published()
 
     async def connect(self, ws: WebSocket, user_id: int) -> None:
         """Register a WebSocket connection for a user."""
         await ws.accept()
-        if user_id not in self._connections:
-            self._connections[user_id] = []
-        self._connections[user_id].append(ws)
+        self._connections.setdefault(user_id, set()).add(ws)
 
     def disconnect(self, ws: WebSocket, user_id: int) -> None:
         """Remove a WebSocket connection for a user."""
-        conns = self._connections.get(user_id, [])
-        if ws in conns:
-            conns.remove(ws)
+        conns = self._connections.get(user_id)
+        if conns is None:
+            return
+        conns.discard(ws)
         if not conns:
-            self._connections.pop(user_id, None)
+            del self._connections[user_id]
 
     async def send_to_user(self, user_id: int, data: dict) -> None:
         """Push JSON data to all active connections for a user."""
-        conns = self._connections.get(user_id, [])
-        dead = []
-        for ws in conns:
-            try:
-                await ws.send_json(data)
-            except Exception:
-                dead.append(ws)
-        for ws in dead:
-            self.disconnect(ws, user_id)
+        await self._send_raw(user_id, _encode(data))
+
+    async def _send_raw(self, user_id: int, payload: str) -> None:
+        """Send an encoded message to every socket of a user concurrently.
+
+        Sockets whose send fails are dropped.
+        """
+        # Snapshot: connect/disconnect may run while the sends are awaited
+        conns = tuple(self._connections.get(user_id, ()))
+        if not conns:
+            return
+        results = await asyncio.gather(
+            *(ws.send_text(payload) for ws in conns), return_exceptions=True
+        )
+        for ws, result in zip(conns, results):
+            if isinstance(result, Exception):
+                self.disconnect(ws, user_id)
 
     async def broadcast(self, data: dict) -> None:
-        """Push JSON data to all connected users."""
-        for user_id in list(self._connections.keys()):
-            await self.send_to_user(user_id, data)
+        """Push JSON data to all connected users.
+
+        The message is encoded once for every socket rather than once per send.
+        """
+        payload = _encode(data)
+        await asyncio.gather(
+            *(self._send_raw(user_id, payload) for user_id in list(self._connections))
+        )
 
     def get_connected_user_ids(self) -> list[int]:
         """Return list of user IDs with active connections."""
         return list(self._connections.keys())
 
+    def notify(self, user_id: int, data: dict) -> None:
+        """Push JSON data to a user from synchronous code (best-effort).
+
+        Safe to call from any thread or process: it never touches the
+        sockets directly.
+        """
+        client = _get_publisher()
+        if client is not None:
+            try:
+                client.publish(f"{WS_CHANNEL_PREFIX}{user_id}", orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+                return
+            except Exception:
+                pass
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.send_to_user(user_id, data), loop)
+
+    async def relay_published(self) -> None:
+        """Forward notifications published via notify() to this process's sockets.
+
+        Runs for the lifetime of the server, resubscribing with backoff if
+        Redis is down at startup or drops later; notify() uses its
+        in-process fallback meanwhile. Returns only if redis isn't installed.
+        """
+        self._loop = asyncio.get_running_loop()
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            print("[ws] redis not installed, not relaying cross-process notifications")
+            return
+
+        prefix = WS_CHANNEL_PREFIX.encode()
+        delay = RELAY_RETRY_MIN
+        while True:
+            client = aioredis.Redis.from_url(REDIS_URL, socket_connect_timeout=0.5)
+            pubsub = client.pubsub()
+            try:
+                await pubsub.psubscribe(f"{WS_CHANNEL_PREFIX}*")
+                delay = RELAY_RETRY_MIN
+                async for message in pubsub.listen():
+                    if message["type"] != "pmessage":
+                        continue
+                    try:
+                        user_id = int(message["channel"][len(prefix):])
+                        data = orjson.loads(message["data"])
+                    except (ValueError, TypeError):
+                        continue
+                    try:
+                        await self.send_to_user(user_id, data)
+                    except Exception as e:
+                        print(f"[ws] Relay to user {user_id} failed: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[ws] Redis relay unavailable ({e}), retrying in {delay:.0f}s")
+            finally:
+                try:
+                    await pubsub.aclose()
+                    await client.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RELAY_RETRY_MAX)
 
 # Global singleton
 ws_manager = ConnectionManager()
@@ -61,7 +177,7 @@ async def authenticate_ws(ws: WebSocket) -> int | None:
     """Wait for auth message and return user_id, or None if auth fails."""
     try:
         raw = await ws.receive_text()
-        msg = json.loads(raw)
+        msg = orjson.loads(raw)
         if msg.get("type") != "auth" or not msg.get("token"):
             await ws.send_json({"type": "error", "message": "First message must be auth"})
             return None
@@ -0,0 +1,50 @@
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-network", action="store_true", default=False,
+        help="also run tests that call live external APIs",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "network: calls a live external API")
+
+
+def pytest_collection_modifyitems(config, items):
+    # Live APIs are slow and flaky, so those tests are opt-in
+    if config.getoption("--run-network"):
+        return
+    skip_network = pytest.mark.skip(reason="needs --run-network")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
+# The tools keep no per-call state, so one instance of each serves every test.
+# Each is imported on first use, so a run only loads the tools it needs.
+
+
+@pytest.fixture(scope="session")
+def jd_parser():
+    from src.tools.jd_parser import JDParserTool
+    return JDParserTool()
+
+
+@pytest.fixture(scope="session")
+def resume_analyzer():
+    from src.tools.resume_analyzer import ResumeAnalyzerTool
+    return ResumeAnalyzerTool()
+
+
+@pytest.fixture(scope="session")
+def skills_matcher():
+    from src.tools.skills_matcher import SkillsMatcherTool
+    return SkillsMatcherTool()
+
+
+@pytest.fixture(scope="session")
+def cover_letter():
+    from src.tools.cover_letter import CoverLetterTool
+    return CoverLetterTool()
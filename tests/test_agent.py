@@ -1,11 +1,15 @@
+import copy
 import json
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.agent import Agent
+from src.memory import AgentMemory
 from src.tools.base import Tool, ToolRegistry
 
+_TOOL_ARGS_JSON = json.dumps({"input": "test"})
+
 
 class MockTool(Tool):
     """A simple tool for testing the agent loop without real API calls."""
@@ -32,29 +36,66 @@ class MockTool(Tool):
         return {"success": True, "data": f"processed: {kwargs.get('input', '')}"}
 
 
+def make_msg(content, tool_calls=None):
+    """A chat completion message, as plain attributes."""
+    return SimpleNamespace(content=content, tool_calls=tool_calls)
+
+
+def make_resp(message):
+    """A chat completion response wrapping one message."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture(scope="session")
+def mock_tool():
+    return MockTool()
+
+
+@pytest.fixture
+def registry():
+    """A fresh registry per test, since tests register their own tools."""
+    return ToolRegistry()
+
+
+@pytest.fixture(scope="session")
+def agent_cls():
+    """The Agent class, imported on first use: src.agent pulls in the
+    openai SDK, which most test runs never need."""
+    from src.agent import Agent
+    return Agent
+
+
+@pytest.fixture(scope="session")
+def base_agent(agent_cls, mock_tool):
+    """One agent over the mock tool, for tests that only read from it."""
+    registry = ToolRegistry()
+    registry.register(mock_tool)
+    return agent_cls(registry=registry)
+
+
+@pytest.fixture
+def agent(base_agent):
+    """A copy of base_agent with its own memory, for tests that run it."""
+    agent = copy.copy(base_agent)
+    agent.memory = AgentMemory()
+    return agent
+
+
 class TestAgentSetup:
-    def test_agent_initializes_with_registry(self):
-        registry = ToolRegistry()
-        registry.register(MockTool())
-        agent = Agent(registry=registry)
+    def test_agent_initializes_with_registry(self, agent_cls, registry, mock_tool):
+        registry.register(mock_tool)
+        agent = agent_cls(registry=registry)
 
         assert agent.registry is registry
         assert agent.memory.step_count == 0
 
-    def test_build_system_prompt_includes_tools(self):
-        registry = ToolRegistry()
-        registry.register(MockTool())
-        agent = Agent(registry=registry)
-
-        prompt = agent._build_system_prompt()
+    def test_build_system_prompt_includes_tools(self, base_agent):
+        prompt = base_agent._build_system_prompt()
         assert "mock_tool" in prompt
         assert "A mock tool for testing" in prompt
 
-    def test_build_messages_with_empty_memory(self):
-        registry = ToolRegistry()
-        agent = Agent(registry=registry)
-
-        messages = agent._build_messages("test task")
+    def test_build_messages_with_empty_memory(self, base_agent):
+        messages = base_agent._build_messages("test task")
         assert len(messages) == 2
         assert messages[0]["role"] == "system"
         assert messages[1]["role"] == "user"
@@ -62,26 +103,17 @@ class TestAgentSetup:
 
 
 class TestToolExecution:
-    def test_execute_known_tool(self):
-        registry = ToolRegistry()
-        registry.register(MockTool())
-        agent = Agent(registry=registry)
-
-        result = agent._execute_tool("mock_tool", {"input": "hello"})
+    def test_execute_known_tool(self, base_agent):
+        result = base_agent._execute_tool("mock_tool", {"input": "hello"})
         assert result["success"] is True
         assert result["data"] == "processed: hello"
 
-    def test_execute_unknown_tool(self):
-        registry = ToolRegistry()
-        agent = Agent(registry=registry)
-
-        result = agent._execute_tool("nonexistent", {})
+    def test_execute_unknown_tool(self, base_agent):
+        result = base_agent._execute_tool("nonexistent", {})
         assert result["success"] is False
         assert "Unknown tool" in result["error"]
 
-    def test_execute_tool_handles_exception(self):
-        registry = ToolRegistry()
-
+    def test_execute_tool_handles_exception(self, agent_cls, registry):
         class FailingTool(Tool):
             @property
             def name(self):
@@ -99,7 +131,7 @@ class TestToolExecution:
                 raise ValueError("Something went wrong")
 
         registry.register(FailingTool())
-        agent = Agent(registry=registry)
+        agent = agent_cls(registry=registry)
 
         result = agent._execute_tool("failing", {})
         assert result["success"] is False
@@ -108,54 +140,40 @@ class TestToolExecution:
 
 class TestAgentLoop:
     @patch("src.agent.OpenAI")
-    def test_agent_returns_final_answer(self, mock_openai_class):
+    def test_agent_returns_final_answer(self, mock_openai_class, agent):
         """Test that the agent loop terminates when LLM returns FINAL_ANSWER."""
         mock_client = MagicMock()
         mock_openai_class.return_value = mock_client
 
         # Simulate LLM returning a final answer directly
-        mock_message = MagicMock()
-        mock_message.tool_calls = None
-        mock_message.content = "FINAL_ANSWER\n\nHere is my analysis."
-
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=mock_message)]
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_message = make_msg("FINAL_ANSWER\n\nHere is my analysis.")
+        mock_client.chat.completions.create.return_value = make_resp(mock_message)
 
-        registry = ToolRegistry()
-        agent = Agent(registry=registry)
         agent.client = mock_client
 
         result = agent.run("some JD", "resume.txt")
         assert "Here is my analysis." in result
 
     @patch("src.agent.OpenAI")
-    def test_agent_calls_tool_then_finishes(self, mock_openai_class):
+    def test_agent_calls_tool_then_finishes(self, mock_openai_class, agent):
         """Test that the agent calls a tool, observes, then finishes."""
         mock_client = MagicMock()
         mock_openai_class.return_value = mock_client
 
         # First call: agent wants to use a tool
-        tool_message = MagicMock()
-        tool_call = MagicMock()
-        tool_call.function.name = "mock_tool"
-        tool_call.function.arguments = json.dumps({"input": "test"})
-        tool_message.tool_calls = [tool_call]
-        tool_message.content = "Let me test this"
+        tool_call = SimpleNamespace(
+            function=SimpleNamespace(name="mock_tool", arguments=_TOOL_ARGS_JSON)
+        )
+        tool_message = make_msg("Let me test this", tool_calls=[tool_call])
 
         # Second call: agent returns final answer
-        final_message = MagicMock()
-        final_message.tool_calls = None
-        final_message.content = "FINAL_ANSWER\n\nDone with analysis."
+        final_message = make_msg("FINAL_ANSWER\n\nDone with analysis.")
 
         mock_client.chat.completions.create.side_effect = [
-            MagicMock(choices=[MagicMock(message=tool_message)]),
-            MagicMock(choices=[MagicMock(message=final_message)]),
+            make_resp(tool_message),
+            make_resp(final_message),
         ]
 
-        registry = ToolRegistry()
-        registry.register(MockTool())
-        agent = Agent(registry=registry)
         agent.client = mock_client
 
         result = agent.run("some JD", "resume.txt")
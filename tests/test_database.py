@@ -0,0 +1,199 @@
+import pytest
+
+from src import database as db
+
+T0 = "2026-01-01T09:00:00"
+STALE_BEFORE = "2026-02-01T00:00:00"
+
+
+@pytest.fixture
+def conn(tmp_path, monkeypatch):
+    """A fresh database file per test; rows are seeded through this connection."""
+    monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "kaziai.db"))
+    db.init_db()
+    conn = db.get_db()
+    yield conn
+    conn.close()
+
+
+def insert(conn, table, **cols):
+    cursor = conn.execute(
+        f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({', '.join('?' for _ in cols)})",
+        tuple(cols.values()),
+    )
+    conn.commit()
+    return cursor.lastrowid
+
+
+def add_user(conn, email="a@example.com"):
+    return insert(conn, "users", email=email, password_hash="x", name="A", created_at=T0)
+
+
+def add_job(conn, user_id, title="Engineer"):
+    return insert(conn, "jobs", user_id=user_id, title=title, company="Acme", saved_at=T0)
+
+
+def add_application(conn, user_id, job_id, status="applied", updated_at=T0):
+    return insert(conn, "applications", user_id=user_id, job_id=job_id, status=status, updated_at=updated_at)
+
+
+def add_goal(conn, user_id, title, updated_at, status="active", pending=1, done=0):
+    goal_id = insert(conn, "goals", user_id=user_id, title=title, status=status, created_at=T0, updated_at=updated_at)
+    for n in range(pending + done):
+        insert(conn, "goal_steps", goal_id=goal_id, step_number=n + 1, title=f"step {n + 1}",
+               status="pending" if n < pending else "completed", created_at=T0)
+    return goal_id
+
+
+def add_followup(conn, user_id, app_id, read=0):
+    insert(conn, "notifications", user_id=user_id, type="application_followup", title="t", message="m",
+           data=f'{{"application_id": {app_id}}}', read=read, created_at=T0)
+
+
+def rules(rows):
+    return [(row["rule"], row["priority"]) for row in rows]
+
+
+class TestSuggestionRows:
+    def test_new_user_gets_setup_rules(self, conn):
+        user_id = add_user(conn)
+        rows = db.get_suggestion_rows(user_id, STALE_BEFORE, limit=10)
+        assert rules(rows) == [("complete_profile", 10), ("upload_resume", 9), ("first_chat", 5)]
+
+    def test_profile_without_target_role_still_incomplete(self, conn):
+        user_id = add_user(conn)
+        insert(conn, "user_profiles", user_id=user_id, target_role="", updated_at=T0)
+        rows = db.get_suggestion_rows(user_id, STALE_BEFORE, limit=10)
+        assert ("complete_profile", 10) in rules(rows)
+
+    def test_every_rule(self, conn):
+        user_id = add_user(conn)
+        insert(conn, "user_profiles", user_id=user_id, target_role="Backend Engineer", updated_at=T0)
+        insert(conn, "user_resumes", user_id=user_id, name="cv", content="...", created_at=T0, updated_at=T0)
+        insert(conn, "conversations", user_id=user_id, title="hi", created_at=T0, updated_at=T0)
+
+        # Only the goal_limit most recently updated active goals are considered
+        add_goal(conn, user_id, "Oldest", "2026-01-02T00:00:00", pending=5)
+        newest = add_goal(conn, user_id, "Newest", "2026-01-04T00:00:00", pending=2, done=1)
+        middle = add_goal(conn, user_id, "Middle", "2026-01-03T00:00:00", pending=1)
+        add_goal(conn, user_id, "Paused", "2026-01-05T00:00:00", status="paused", pending=4)
+
+        jobs = [add_job(conn, user_id) for _ in range(4)]
+        add_application(conn, user_id, jobs[0])  # stale
+        add_application(conn, user_id, jobs[1], updated_at="2026-03-01T00:00:00")  # fresh
+        # jobs[2] and jobs[3] are saved with no application
+
+        rows = db.get_suggestion_rows(user_id, STALE_BEFORE, limit=10)
+        assert rules(rows) == [("goal_steps", 8), ("goal_steps", 8), ("draft_cover_letters", 7), ("follow_up", 6)]
+        assert [(r["ref_id"], r["title"], r["count"]) for r in rows[:2]] == [(newest, "Newest", 2), (middle, "Middle", 1)]
+        assert rows[2]["count"] == 2
+        assert rows[3]["count"] == 1
+
+    def test_goal_without_pending_steps_is_skipped(self, conn):
+        user_id = add_user(conn)
+        add_goal(conn, user_id, "Done", "2026-01-04T00:00:00", pending=0, done=2)
+        add_goal(conn, user_id, "Open", "2026-01-03T00:00:00", pending=3)
+        add_goal(conn, user_id, "Third", "2026-01-02T00:00:00", pending=1)
+
+        rows = [r for r in db.get_suggestion_rows(user_id, STALE_BEFORE, limit=10) if r["rule"] == "goal_steps"]
+        # The finished goal still takes one of the two slots
+        assert [r["title"] for r in rows] == ["Open"]
+
+    def test_limit_keeps_highest_priority(self, conn):
+        user_id = add_user(conn)
+        add_goal(conn, user_id, "Goal", "2026-01-02T00:00:00")
+        add_job(conn, user_id)
+        rows = db.get_suggestion_rows(user_id, STALE_BEFORE)
+        assert rules(rows) == [("complete_profile", 10), ("upload_resume", 9), ("goal_steps", 8)]
+
+    def test_other_users_rows_ignored(self, conn):
+        user_id = add_user(conn)
+        other = add_user(conn, "b@example.com")
+        add_goal(conn, other, "Theirs", "2026-01-02T00:00:00")
+        job_id = add_job(conn, other)
+        add_application(conn, other, job_id)
+        add_job(conn, other)
+
+        rows = db.get_suggestion_rows(user_id, STALE_BEFORE, limit=10)
+        assert rules(rows) == [("complete_profile", 10), ("upload_resume", 9), ("first_chat", 5)]
+
+
+class TestStaleApplications:
+    def test_filters(self, conn):
+        user_id = add_user(conn)
+        other = add_user(conn, "b@example.com")
+        stale = add_application(conn, user_id, add_job(conn, user_id, "Stale"), updated_at="2026-01-10T00:00:00")
+        read_followup = add_application(conn, user_id, add_job(conn, user_id, "Read"), updated_at="2026-01-20T00:00:00")
+        unread_followup = add_application(conn, user_id, add_job(conn, user_id, "Unread"))
+        add_application(conn, user_id, add_job(conn, user_id, "Fresh"), updated_at="2026-03-01T00:00:00")
+        add_application(conn, user_id, add_job(conn, user_id, "Interview"), status="interview")
+        add_application(conn, other, add_job(conn, other, "Theirs"))
+        add_followup(conn, user_id, read_followup, read=1)
+        add_followup(conn, user_id, unread_followup)
+        # Another user's notification for the same application id changes nothing
+        add_followup(conn, other, stale)
+
+        rows = db.get_stale_applications_without_followup(user_id, STALE_BEFORE)
+        assert [(r["id"], r["title"], r["company"]) for r in rows] == [
+            (read_followup, "Read", "Acme"),
+            (stale, "Stale", "Acme"),
+        ]
+
+
+class TestIterIdBatches:
+    QUERY = "SELECT id FROM users WHERE name = ? AND id > ? ORDER BY id LIMIT ?"
+
+    def test_batches(self, conn):
+        ids = [add_user(conn, f"u{n}@example.com") for n in range(7)]
+        insert(conn, "users", email="other@example.com", password_hash="x", name="B", created_at=T0)
+
+        batches = list(db.iter_id_batches(self.QUERY, ("A",), batch_size=3))
+        assert batches == [ids[:3], ids[3:6], ids[6:]]
+        assert list(db.iter_batched_ids(self.QUERY, ("A",), batch_size=3)) == ids
+
+    def test_exact_multiple_has_no_empty_batch(self, conn):
+        ids = [add_user(conn, f"u{n}@example.com") for n in range(6)]
+        assert list(db.iter_id_batches(self.QUERY, ("A",), batch_size=3)) == [ids[:3], ids[3:]]
+
+    def test_no_rows(self, conn):
+        assert list(db.iter_id_batches(self.QUERY, ("A",), batch_size=3)) == []
+
+
+class TestDashboardBundle:
+    def test_empty(self, conn):
+        user_id = add_user(conn)
+        assert db.get_dashboard_bundle(user_id) == {
+            "total_jobs_saved": 0,
+            "total_applications": 0,
+            "total_conversations": 0,
+            "total_resumes": 0,
+            "has_profile": False,
+            "application_status": {},
+            "recent_applications": [],
+        }
+
+    def test_counts(self, conn):
+        user_id = add_user(conn)
+        other = add_user(conn, "b@example.com")
+        # More jobs than get_jobs' default limit of 50, which used to cap the count
+        jobs = [add_job(conn, user_id, f"Job {n}") for n in range(55)]
+        add_job(conn, other)
+        statuses = ["applied", "applied", "interview", "saved", "rejected", "applied", "offer"]
+        for n, status in enumerate(statuses):
+            add_application(conn, user_id, jobs[n], status=status, updated_at=f"2026-01-{n + 10}T00:00:00")
+        add_application(conn, other, jobs[0])
+        insert(conn, "conversations", user_id=user_id, title="c", created_at=T0, updated_at=T0)
+        insert(conn, "user_resumes", user_id=user_id, name="cv", content="...", created_at=T0, updated_at=T0)
+        insert(conn, "user_resumes", user_id=user_id, name="cv2", content="...", created_at=T0, updated_at=T0)
+        insert(conn, "user_profiles", user_id=user_id, target_role="", updated_at=T0)
+
+        bundle = db.get_dashboard_bundle(user_id)
+        assert bundle["total_jobs_saved"] == 55
+        assert bundle["total_applications"] == 7
+        assert bundle["total_conversations"] == 1
+        assert bundle["total_resumes"] == 2
+        assert bundle["has_profile"] is True
+        assert bundle["application_status"] == {"applied": 3, "interview": 1, "saved": 1, "rejected": 1, "offer": 1}
+        assert [(r["title"], r["status"]) for r in bundle["recent_applications"]] == [
+            ("Job 6", "offer"), ("Job 5", "applied"), ("Job 4", "rejected"), ("Job 3", "saved"), ("Job 2", "interview"),
+        ]
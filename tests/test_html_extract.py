@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils import html_extract
+
+_PAGE = (
+    "<html><head><title> Acme </title><meta name='description' content='We build'></head>"
+    "<body><nav>Menu</nav><h1>About</h1>\n\n<p>Café</p><script>x = 1</script>"
+    "<footer>Footer</footer></body></html>"
+).encode()
+
+
+@pytest.fixture(params=["selectolax", "lxml", "soup"])
+def parser(request, monkeypatch):
+    """Run a test against each parser extract_page can fall back to."""
+    if request.param != "selectolax":
+        monkeypatch.setattr(html_extract, "SELECTOLAX_AVAILABLE", False)
+    if request.param == "soup":
+        monkeypatch.setattr(html_extract, "LXML_AVAILABLE", False)
+    return request.param
+
+
+def test_extract_page(parser):
+    title, meta_desc, text = html_extract.extract_page(_PAGE, "utf-8")
+    assert title == "Acme"
+    assert meta_desc == "We build"
+    assert text.splitlines()[-2:] == ["About", "Café"]
+    assert "Menu" not in text and "Footer" not in text and "x = 1" not in text
+
+
+def test_extract_page_caps_text(parser):
+    page = b"<html><body>" + b"<p>word</p>" * 1000 + b"</body></html>"
+    _, _, text = html_extract.extract_page(page, max_chars=100)
+    assert len(text) == 100
+
+
+@pytest.mark.parametrize("charset", [None, "utf8mb4"])
+def test_missing_or_unknown_charset_decodes_as_utf8(parser, charset):
+    page = "<html><body><p>Résumé</p></body></html>".encode()
+    assert html_extract.extract_page(page, charset)[2] == "Résumé"
+
+
+def test_decode_body_unknown_charset():
+    assert html_extract.decode_body("é".encode(), "utf8mb4") == "é"
+    assert html_extract.decode_body("é".encode("latin-1"), "iso-8859-1") == "é"
+
+
+def test_read_capped_stops_at_limit():
+    served = []
+
+    def iter_content(chunk_size):
+        for _ in range(10):
+            served.append(chunk_size)
+            yield b"x" * chunk_size
+
+    response = SimpleNamespace(iter_content=iter_content)
+    assert html_extract.read_capped(response, 250, chunk_size=100) == b"x" * 250
+    assert len(served) == 3
@@ -1,7 +1,45 @@
-from unittest.mock import patch, MagicMock
+from pathlib import Path
+from types import SimpleNamespace
+
+import orjson
+import pytest
+import requests
 
 from src.tools.job_search import JobSearchTool
 
+REMOTEOK_URL = JobSearchTool.SOURCES["remoteok"]["url"]
+ARBEITNOW_URL = JobSearchTool.SOURCES["arbeitnow"]["url"]
+
+# Recorded job board payloads, by name; loaded once per run
+BOARD_FIXTURES = orjson.loads(
+    (Path(__file__).parent / "fixtures" / "job_boards.json").read_bytes()
+)
+
+
+def _resp(payload):
+    """A successful response whose body is `payload` as JSON."""
+    return SimpleNamespace(content=orjson.dumps(payload), raise_for_status=lambda: None)
+
+
+@pytest.fixture
+def http(monkeypatch):
+    """Canned responses for the shared HTTP session, by URL.
+
+    Tests fill in the returned dict; an exception value is raised instead
+    of returned. Sources are fetched concurrently, so answers go by URL
+    rather than call order.
+    """
+    responses = {}
+
+    def fake_get(self, url, **kwargs):
+        response = responses[url]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    return responses
+
 
 class TestJobSearchTool:
     def test_tool_metadata(self):
@@ -15,30 +53,8 @@ class TestJobSearchTool:
         assert spec["type"] == "function"
         assert spec["function"]["name"] == "search_jobs"
 
-    @patch("src.tools.job_search.requests.get")
-    def test_search_remoteok(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.json.return_value = [
-            {"legal": "metadata"},
-            {
-                "position": "Senior Python Engineer",
-                "company": "TechCorp",
-                "tags": ["python", "backend", "ai"],
-                "url": "https://example.com/job/1",
-                "date": "2026-02-20",
-                "description": "Build backend systems",
-            },
-            {
-                "position": "Frontend React Developer",
-                "company": "WebCo",
-                "tags": ["react", "javascript"],
-                "url": "https://example.com/job/2",
-                "date": "2026-02-20",
-                "description": "Build UIs",
-            },
-        ]
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+    def test_search_remoteok(self, http):
+        http[REMOTEOK_URL] = _resp(BOARD_FIXTURES["remoteok_search"])
 
         tool = JobSearchTool()
         result = tool._search_remoteok(["python"])
@@ -47,24 +63,8 @@ class TestJobSearchTool:
         assert result[0]["title"] == "Senior Python Engineer"
         assert result[0]["source"] == "RemoteOK"
 
-    @patch("src.tools.job_search.requests.get")
-    def test_search_arbeitnow(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "title": "AI Backend Engineer",
-                    "company_name": "AICorp",
-                    "location": "Berlin",
-                    "tags": ["python", "ai", "backend"],
-                    "url": "https://example.com/job/3",
-                    "description": "Build AI systems with Python",
-                    "remote": True,
-                },
-            ],
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+    def test_search_arbeitnow(self, http):
+        http[ARBEITNOW_URL] = _resp(BOARD_FIXTURES["arbeitnow_search"])
 
         tool = JobSearchTool()
         result = tool._search_arbeitnow(["python"])
@@ -73,39 +73,11 @@ class TestJobSearchTool:
         assert result[0]["company"] == "AICorp"
         assert result[0]["source"] == "Arbeitnow"
 
-    @patch("src.tools.job_search.requests.get")
-    def test_deduplication(self, mock_get):
+    def test_deduplication(self, http):
         """Same job from both sources should appear once."""
-        mock_response = MagicMock()
-        mock_response.raise_for_status = MagicMock()
-
         # Both sources return the same job
-        remoteok_data = [
-            {"legal": "metadata"},
-            {
-                "position": "Python Engineer",
-                "company": "SameCo",
-                "tags": ["python"],
-                "url": "https://remoteok.com/job/1",
-                "description": "Python work",
-            },
-        ]
-        arbeitnow_data = {
-            "data": [
-                {
-                    "title": "Python Engineer",
-                    "company_name": "SameCo",
-                    "tags": ["python"],
-                    "url": "https://arbeitnow.com/job/1",
-                    "description": "Python work",
-                },
-            ],
-        }
-
-        mock_get.side_effect = [
-            MagicMock(json=lambda: remoteok_data, raise_for_status=MagicMock()),
-            MagicMock(json=lambda: arbeitnow_data, raise_for_status=MagicMock()),
-        ]
+        http[REMOTEOK_URL] = _resp(BOARD_FIXTURES["remoteok_duplicate"])
+        http[ARBEITNOW_URL] = _resp(BOARD_FIXTURES["arbeitnow_duplicate"])
 
         tool = JobSearchTool()
         result = tool.execute(keywords=["python"])
@@ -113,8 +85,7 @@ class TestJobSearchTool:
         assert result["success"] is True
         assert result["total_found"] == 1  # Deduplicated
 
-    @patch("src.tools.job_search.requests.get")
-    def test_max_results(self, mock_get):
+    def test_max_results(self, http):
         """Should respect max_results limit."""
         jobs = [
             {
@@ -127,16 +98,8 @@ class TestJobSearchTool:
             for i in range(20)
         ]
 
-        mock_get.side_effect = [
-            MagicMock(
-                json=lambda: [{"legal": "meta"}] + jobs,
-                raise_for_status=MagicMock(),
-            ),
-            MagicMock(
-                json=lambda: {"data": []},
-                raise_for_status=MagicMock(),
-            ),
-        ]
+        http[REMOTEOK_URL] = _resp([{"legal": "meta"}] + jobs)
+        http[ARBEITNOW_URL] = _resp({"data": []})
 
         tool = JobSearchTool()
         result = tool.execute(keywords=["python"], max_results=5)
@@ -144,11 +107,9 @@ class TestJobSearchTool:
         assert result["returned"] == 5
         assert len(result["jobs"]) == 5
 
-    @patch("src.tools.job_search.requests.get")
-    def test_network_failure_handled(self, mock_get):
+    def test_network_failure_handled(self, http):
         """Should return empty results on network failure, not crash."""
-        import requests
-        mock_get.side_effect = requests.RequestException("Connection failed")
+        http[REMOTEOK_URL] = http[ARBEITNOW_URL] = requests.RequestException("Connection failed")
 
         tool = JobSearchTool()
         result = tool.execute(keywords=["python"])
@@ -156,6 +117,7 @@ class TestJobSearchTool:
         assert result["success"] is True
         assert result["total_found"] == 0
 
+    @pytest.mark.network
     def test_no_keywords_match(self):
         """With impossible keywords, should return empty."""
         tool = JobSearchTool()
@@ -1,35 +1,70 @@
-import os
-import tempfile
-
 import pytest
 
 from src.tools.base import ToolRegistry
-from src.tools.jd_parser import JDParserTool
-from src.tools.resume_analyzer import ResumeAnalyzerTool
-from src.tools.skills_matcher import SkillsMatcherTool
-from src.tools.cover_letter import CoverLetterTool
+
+_JD_TEXT = """Software Engineer
+Acme Corp
+
+Requirements:
+- Python
+- PostgreSQL
+- 3+ years experience
+
+Preferred:
+- Docker experience
+- CI/CD knowledge
+"""
+
+_SECTIONED_JD_TEXT = """Overview of the role.
+
+Requirements:
+Python, Go, and Rust experience.
+
+Responsibilities:
+Build backend systems.
+"""
+
+_RESUME_TEXT = """John Doe
+Software Engineer
+
+Skills:
+Python, JavaScript, Docker
+
+Experience:
+Built web applications for 3 years.
+
+Education:
+BS Computer Science
+"""
+
+
+@pytest.fixture(scope="session")
+def resume_file(tmp_path_factory):
+    """_RESUME_TEXT on disk, written once per session (the analyzer only reads it)."""
+    path = tmp_path_factory.mktemp("resume") / "resume.txt"
+    path.write_text(_RESUME_TEXT)
+    return str(path)
 
 
 class TestToolRegistry:
-    def test_register_and_retrieve(self):
+    def test_register_and_retrieve(self, jd_parser):
         registry = ToolRegistry()
-        tool = JDParserTool()
-        registry.register(tool)
+        registry.register(jd_parser)
 
-        assert registry.get("parse_job_description") is tool
+        assert registry.get("parse_job_description") is jd_parser
         assert registry.get("nonexistent") is None
 
-    def test_list_tools(self):
+    def test_list_tools(self, jd_parser, skills_matcher):
         registry = ToolRegistry()
-        registry.register(JDParserTool())
-        registry.register(SkillsMatcherTool())
+        registry.register(jd_parser)
+        registry.register(skills_matcher)
 
         tools = registry.list_tools()
         assert len(tools) == 2
 
-    def test_openai_spec_format(self):
+    def test_openai_spec_format(self, jd_parser):
         registry = ToolRegistry()
-        registry.register(JDParserTool())
+        registry.register(jd_parser)
 
         specs = registry.to_openai_specs()
         assert len(specs) == 1
@@ -40,157 +75,90 @@ class TestToolRegistry:
 
 
 class TestJDParser:
-    def test_parse_text(self):
-        jd_text = """Software Engineer
-        Acme Corp
-
-        Requirements:
-        - Python
-        - PostgreSQL
-        - 3+ years experience
-
-        Preferred:
-        - Docker experience
-        - CI/CD knowledge
-        """
-        tool = JDParserTool()
-        result = tool.execute(source=jd_text)
+    def test_parse_text(self, jd_parser):
+        result = jd_parser.execute(source=_JD_TEXT)
 
         assert result["success"] is True
         assert result["char_count"] > 0
         assert "raw_text" in result
 
-    def test_section_extraction(self):
-        jd_text = """Overview of the role.
-
-        Requirements:
-        Python, Go, and Rust experience.
-
-        Responsibilities:
-        Build backend systems.
-        """
-        tool = JDParserTool()
-        result = tool.execute(source=jd_text)
+    def test_section_extraction(self, jd_parser):
+        result = jd_parser.execute(source=_SECTIONED_JD_TEXT)
 
         assert result["success"] is True
         assert "sections" in result
 
 
 class TestResumeAnalyzer:
-    def test_analyze_resume_file(self):
-        resume_text = """John Doe
-        Software Engineer
-
-        Skills:
-        Python, JavaScript, Docker
-
-        Experience:
-        Built web applications for 3 years.
-
-        Education:
-        BS Computer Science
-        """
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as f:
-            f.write(resume_text)
-            temp_path = f.name
-
-        try:
-            tool = ResumeAnalyzerTool()
-            result = tool.execute(file_path=temp_path)
-
-            assert result["success"] is True
-            assert "sections" in result
-            assert result["char_count"] > 0
-        finally:
-            os.unlink(temp_path)
-
-    def test_file_not_found(self):
-        tool = ResumeAnalyzerTool()
-        result = tool.execute(file_path="/nonexistent/resume.txt")
+    def test_analyze_resume_file(self, resume_analyzer, resume_file):
+        result = resume_analyzer.execute(file_path=resume_file)
+
+        assert result["success"] is True
+        assert "sections" in result
+        assert result["char_count"] > 0
+
+    def test_file_not_found(self, resume_analyzer):
+        result = resume_analyzer.execute(file_path="/nonexistent/resume.txt")
 
         assert result["success"] is False
         assert "not found" in result["error"]
 
-    def test_empty_file(self):
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as f:
-            f.write("")
-            temp_path = f.name
+    def test_empty_file(self, tmp_path, resume_analyzer):
+        resume_path = tmp_path / "resume.txt"
+        resume_path.write_text("")
 
-        try:
-            tool = ResumeAnalyzerTool()
-            result = tool.execute(file_path=temp_path)
+        result = resume_analyzer.execute(file_path=str(resume_path))
 
-            assert result["success"] is False
-            assert "empty" in result["error"]
-        finally:
-            os.unlink(temp_path)
+        assert result["success"] is False
+        assert "empty" in result["error"]
 
 
 class TestSkillsMatcher:
-    def test_perfect_match(self):
-        tool = SkillsMatcherTool()
-        result = tool.execute(
-            required_skills=["Python", "Docker"],
-            candidate_skills=["Python", "Docker", "Git"],
-        )
-
-        assert result["success"] is True
-        assert result["required_match_pct"] == 100.0
-        assert len(result["missing_required"]) == 0
-
-    def test_partial_match(self):
-        tool = SkillsMatcherTool()
-        result = tool.execute(
-            required_skills=["Python", "Go", "Rust"],
-            candidate_skills=["Python"],
-        )
-
-        assert result["success"] is True
-        assert result["required_match_pct"] < 100
-        assert "Go" in result["missing_required"]
-        assert "Rust" in result["missing_required"]
-
-    def test_alias_matching(self):
-        tool = SkillsMatcherTool()
-        result = tool.execute(
-            required_skills=["JS", "PostgreSQL"],
-            candidate_skills=["JavaScript", "Postgres"],
-        )
-
-        assert result["success"] is True
-        assert result["required_match_pct"] == 100.0
-
-    def test_preferred_skills(self):
-        tool = SkillsMatcherTool()
-        result = tool.execute(
-            required_skills=["Python"],
-            candidate_skills=["Python"],
-            preferred_skills=["Docker", "K8s"],
-        )
-
-        assert result["success"] is True
-        assert len(result["matched_required"]) == 1
-        assert len(result["missing_preferred"]) == 2
-
-    def test_empty_skills(self):
-        tool = SkillsMatcherTool()
-        result = tool.execute(
-            required_skills=[],
-            candidate_skills=[],
+    @pytest.mark.parametrize(
+        "required, candidate, preferred, expected",
+        [
+            pytest.param(
+                ["Python", "Docker"], ["Python", "Docker", "Git"], [],
+                {"required_match_pct": 100.0, "missing_required": []},
+                id="perfect_match",
+            ),
+            pytest.param(
+                ["Python", "Go", "Rust"], ["Python"], [],
+                {"required_match_pct": 33.3, "missing_required": ["Go", "Rust"]},
+                id="partial_match",
+            ),
+            pytest.param(
+                ["JS", "PostgreSQL"], ["JavaScript", "Postgres"], [],
+                {"required_match_pct": 100.0},
+                id="alias_matching",
+            ),
+            pytest.param(
+                ["Python"], ["Python"], ["Docker", "K8s"],
+                {"matched_required": ["Python"], "missing_preferred": ["Docker", "K8s"]},
+                id="preferred_skills",
+            ),
+            pytest.param(
+                [], [], [],
+                {"overall_match_pct": 0},
+                id="empty_skills",
+            ),
+        ],
+    )
+    def test_match(self, skills_matcher, required, candidate, preferred, expected):
+        result = skills_matcher.execute(
+            required_skills=required,
+            candidate_skills=candidate,
+            preferred_skills=preferred,
         )
 
         assert result["success"] is True
-        assert result["overall_match_pct"] == 0
+        for key, value in expected.items():
+            assert result[key] == value
 
 
 class TestCoverLetter:
-    def test_generate_letter(self):
-        tool = CoverLetterTool()
-        result = tool.execute(
+    def test_generate_letter(self, cover_letter):
+        result = cover_letter.execute(
             candidate_name="John Doe",
             company_name="Acme Corp",
             role_title="Software Engineer",
@@ -204,13 +172,13 @@ class TestCoverLetter:
         )
 
         assert result["success"] is True
-        assert "John Doe" in result["cover_letter"]
-        assert "Acme Corp" in result["cover_letter"]
-        assert "Software Engineer" in result["cover_letter"]
+        letter = result["cover_letter"]
+        assert "John Doe" in letter
+        assert "Acme Corp" in letter
+        assert "Software Engineer" in letter
 
-    def test_letter_structure(self):
-        tool = CoverLetterTool()
-        result = tool.execute(
+    def test_letter_structure(self, cover_letter):
+        result = cover_letter.execute(
             candidate_name="Jane Smith",
             company_name="TechCo",
             role_title="Backend Engineer",
@@ -223,9 +191,8 @@ class TestCoverLetter:
         assert "closing" in result["structure"]
         assert result["stats"]["strengths_highlighted"] == 1
 
-    def test_no_gaps(self):
-        tool = CoverLetterTool()
-        result = tool.execute(
+    def test_no_gaps(self, cover_letter):
+        result = cover_letter.execute(
             candidate_name="Jane Smith",
             company_name="TechCo",
             role_title="Engineer",